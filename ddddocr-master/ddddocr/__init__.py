@@ -31,6 +31,11 @@ DDDDOCR - 带带弟弟OCR通用验证码识别
 """
 
 import warnings
+from typing import TYPE_CHECKING
+
+from .utils.lazy_import import lazy_attributes
+from .utils.exceptions import DDDDOCRError, ModelLoadError, ImageProcessError, TypeError
+
 warnings.filterwarnings('ignore')
 
 # 版本信息
@@ -39,18 +44,33 @@ __author__ = "sml2h3"
 __email__ = "sml2h3@gmail.com"
 __url__ = "https://github.com/sml2h3/ddddocr"
 
-# 导入核心功能类
-from .compat.legacy import DdddOcr
-from .preprocessing.color_filter import ColorFilter
-
-# 导入工具函数（保持向后兼容）
-from .utils.image_io import base64_to_image, get_img_base64, png_rgba_black_preprocess
-from .utils.exceptions import DDDDOCRError, ModelLoadError, ImageProcessError, TypeError
-
-# 导入新的模块化组件（供高级用户使用）
-from .core import OCREngine, DetectionEngine, SlideEngine
-from .preprocessing import ImageProcessor
-from .models import ModelLoader, CharsetManager
+# 公共接口所在模块：首次访问时才导入，import ddddocr 本身不加载onnxruntime、OpenCV、NumPy和PIL
+# （ONNX运行时日志级别在创建推理会话时设置）
+_LAZY_ATTRIBUTES = {
+    # 核心功能类
+    'DdddOcr': '.compat.legacy',
+    'ColorFilter': '.preprocessing.color_filter',
+    
+    # 工具函数（保持向后兼容）
+    'base64_to_image': '.utils.image_io',
+    'get_img_base64': '.utils.image_io',
+    'png_rgba_black_preprocess': '.utils.image_io',
+    
+    # 新的模块化组件（供高级用户使用）
+    'OCREngine': '.core',
+    'DetectionEngine': '.core',
+    'SlideEngine': '.core',
+    'ImageProcessor': '.preprocessing',
+    'ModelLoader': '.models',
+    'CharsetManager': '.models',
+    'ResultCache': '.utils.result_cache',
+    
+    # 子模块（保持 import ddddocr 后可直接访问 ddddocr.core 等）
+    'compat': '.compat',
+    'core': '.core',
+    'models': '.models',
+    'preprocessing': '.preprocessing',
+}
 
 # 公共接口
 __all__ = [
@@ -76,6 +96,7 @@ __all__ = [
     'ImageProcessor',
     'ModelLoader',
     'CharsetManager',
+    'ResultCache',
     
     # 版本信息
     '__version__',
@@ -84,17 +105,24 @@ __all__ = [
     '__url__'
 ]
 
-# 设置ONNX运行时日志级别
-try:
-    import onnxruntime
-    onnxruntime.set_default_logger_severity(3)
-except ImportError:
-    pass
 
-# 兼容性处理：确保PIL有ANTIALIAS属性
-try:
-    from PIL import Image
-    if not hasattr(Image, 'ANTIALIAS'):
-        setattr(Image, 'ANTIALIAS', Image.LANCZOS)
-except ImportError:
-    pass
+def _configure_runtime() -> None:
+    """兼容性处理：首次使用公共接口时确保PIL有ANTIALIAS属性"""
+    try:
+        from PIL import Image
+        if not hasattr(Image, 'ANTIALIAS'):
+            setattr(Image, 'ANTIALIAS', Image.LANCZOS)
+    except ImportError:
+        pass
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals(), _configure_runtime)
+
+if TYPE_CHECKING:
+    from .compat.legacy import DdddOcr
+    from .preprocessing.color_filter import ColorFilter
+    from .utils.image_io import base64_to_image, get_img_base64, png_rgba_black_preprocess
+    from .core import OCREngine, DetectionEngine, SlideEngine
+    from .preprocessing import ImageProcessor
+    from .models import ModelLoader, CharsetManager
+    from .utils.result_cache import ResultCache
@@ -1,12 +1,16 @@
 # coding=utf-8
 """
 ddddocr命令行入口点
-支持通过 python -m ddddocr api 启动HTTP服务
+支持通过 python -m ddddocr api 启动HTTP服务，通过 python -m ddddocr bench-api 压测HTTP服务，
+通过 python -m ddddocr bench 运行引擎微基准测试，通过 python -m ddddocr quant-report 评估int8量化模型，
+通过 python -m ddddocr ocr / detect 批量识别本地图片
 """
 
+import os
 import sys
 import argparse
 import json
+import time
 from pathlib import Path
 
 
@@ -23,12 +27,87 @@ def main():
     api_parser = subparsers.add_parser("api", help="启动HTTP API服务")
     api_parser.add_argument("--host", default="0.0.0.0", help="服务器主机地址 (默认: 0.0.0.0)")
     api_parser.add_argument("--port", type=int, default=8000, help="服务器端口 (默认: 8000)")
-    api_parser.add_argument("--workers", type=int, default=1, help="工作进程数 (默认: 1)")
+    api_parser.add_argument("--workers", type=int, default=1,
+                           help="工作进程数，大于1时主进程预加载模型并读入权重后派生工作进程，权重在进程间共享（需安装onnx，否则内存随进程数增长） (默认: 1)")
+    api_parser.add_argument("--preload", help="启动时加载的模型，逗号分隔，可选 ocr、det，如 ocr,det")
+    api_parser.add_argument("--no-warmup", action="store_true", help="启动时不执行预热推理")
+    api_parser.add_argument("--precision", choices=["fp32", "int8"],
+                           help="默认模型精度，int8首次使用时生成动态量化模型并缓存在原模型旁 (默认: fp32)")
+    api_parser.add_argument("--fast-preprocess", action="store_true",
+                           help="OCR默认使用OpenCV快速预处理路径，不经过PIL，少量识别结果可能改变")
+    api_parser.add_argument("--cpu-affinity", action="store_true",
+                           help="多进程模式下将每个工作进程绑定到一个CPU核心 (仅Linux)")
     api_parser.add_argument("--reload", action="store_true", help="启用自动重载 (开发模式)")
-    api_parser.add_argument("--config", help="配置文件路径 (JSON格式)")
+    api_parser.add_argument("--config", help="配置文件路径 (JSON格式，可通过 preload、warmup 字段指定启动时加载和预热的模型)")
     api_parser.add_argument("--log-level", default="info", 
                            choices=["critical", "error", "warning", "info", "debug", "trace"],
                            help="日志级别 (默认: info)")
+    add_session_config_arguments(api_parser)
+    add_scheduler_arguments(api_parser)
+    
+    # API压测命令
+    bench_parser = subparsers.add_parser("bench-api", help="使用合成图片压测HTTP API服务")
+    bench_parser.add_argument("--url", default="http://127.0.0.1:8000", help="服务地址 (默认: http://127.0.0.1:8000)")
+    bench_parser.add_argument("--endpoints", default="ocr,detect",
+                             help="压测的接口，逗号分隔，可选 ocr、ocr_raw、ocr_batch、detect、detect_raw、detect_batch "
+                                  "(默认: ocr,detect)")
+    bench_parser.add_argument("--concurrency", default="1,4,16", help="并发数列表，逗号分隔 (默认: 1,4,16)")
+    bench_parser.add_argument("--requests", type=int, default=200, help="每个并发级别的请求数 (默认: 200)")
+    bench_parser.add_argument("--duration", type=float, help="每个并发级别的压测秒数，指定后忽略 --requests")
+    bench_parser.add_argument("--warmup", type=int, default=10, help="每个接口的预热请求数 (默认: 10)")
+    bench_parser.add_argument("--batch-size", type=int, default=8, help="批量接口每个请求的图片数 (默认: 8)")
+    bench_parser.add_argument("--timeout", type=float, default=30.0, help="单个请求超时秒数 (默认: 30)")
+    bench_parser.add_argument("--images", type=int, default=32, help="生成的合成图片数量 (默认: 32)")
+    bench_parser.add_argument("--seed", type=int, default=0, help="合成图片随机种子 (默认: 0)")
+    bench_parser.add_argument("--initialize", action="store_true", help="压测前调用 /initialize 加载所需模型")
+    bench_parser.add_argument("--json", dest="json_path", help="将结果以JSON格式写入文件，- 表示输出到标准输出")
+    
+    # 引擎微基准测试命令
+    engine_bench_parser = subparsers.add_parser("bench", help="运行OCR、检测、滑块和颜色过滤引擎的微基准测试")
+    engine_bench_parser.add_argument("--repeat", type=int, default=30, help="每个用例的计时次数 (默认: 30)")
+    engine_bench_parser.add_argument("--warmup", type=int, default=3, help="每个用例的预热次数 (默认: 3)")
+    engine_bench_parser.add_argument("--filter", help="只运行名称包含指定字符串的用例，逗号分隔，如 ocr,ctc")
+    engine_bench_parser.add_argument("--stand-in", action="store_true",
+                                    help="使用替身模型 (内置模型文件不存在时自动使用)")
+    engine_bench_parser.add_argument("--output", help="将结果以JSON格式写入文件")
+    engine_bench_parser.add_argument("--compare", help="与基线结果文件比较，存在回退时返回非零退出码")
+    engine_bench_parser.add_argument("--threshold", type=float, default=0.10,
+                                    help="判定回退的中位数耗时相对变化阈值 (默认: 0.10)")
+    add_session_config_arguments(engine_bench_parser)
+    
+    # 量化模型评估命令
+    quant_parser = subparsers.add_parser("quant-report", help="在本地图片集上比较fp32与int8量化模型的准确率、耗时和内存")
+    quant_parser.add_argument("images", nargs="+", help="图片文件或目录")
+    quant_parser.add_argument("--model", choices=["ocr", "det"], default="ocr", help="评估的模型 (默认: ocr)")
+    quant_parser.add_argument("--old", action="store_true", help="使用旧版OCR模型")
+    quant_parser.add_argument("--beta", action="store_true", help="使用beta版OCR模型")
+    quant_parser.add_argument("--import-onnx-path", default="", help="自定义OCR模型路径")
+    quant_parser.add_argument("--charsets-path", default="", help="自定义字符集路径")
+    quant_parser.add_argument("--labels", help="标注文件，每行为 文件名 标签，提供时报告准确率变化")
+    quant_parser.add_argument("--label-from-filename", action="store_true",
+                             help="从文件名取标签，如 a3b9_0001.png 的标签为 a3b9")
+    quant_parser.add_argument("--repeat", type=int, default=3, help="计时轮数，每轮识别全部图片 (默认: 3)")
+    quant_parser.add_argument("--no-isolate", action="store_true", help="在当前进程中测量两种精度（内存数据可能相互影响）")
+    quant_parser.add_argument("--output", help="将结果以JSON格式写入文件")
+    add_session_config_arguments(quant_parser)
+    
+    # 批量识别命令
+    ocr_parser = subparsers.add_parser("ocr", help="批量OCR识别本地图片，按输入顺序输出JSONL")
+    add_bulk_arguments(ocr_parser)
+    ocr_parser.add_argument("--old", action="store_true", help="使用旧版OCR模型")
+    ocr_parser.add_argument("--beta", action="store_true", help="使用beta版OCR模型")
+    ocr_parser.add_argument("--import-onnx-path", default="", help="自定义OCR模型路径")
+    ocr_parser.add_argument("--charsets-path", default="", help="自定义字符集路径")
+    ocr_parser.add_argument("--png-fix", action="store_true", help="修复PNG透明背景")
+    ocr_parser.add_argument("--colors", help="颜色过滤预设，逗号分隔，如 red,blue")
+    ocr_parser.add_argument("--charset-range", help="字符集范围，如 6 或 0123456789")
+    ocr_parser.add_argument("--fast-preprocess", action="store_true",
+                            help="使用OpenCV快速预处理路径，不经过PIL，少量识别结果可能改变")
+    add_session_config_arguments(ocr_parser)
+    
+    detect_parser = subparsers.add_parser("detect", help="批量目标检测本地图片，按输入顺序输出JSONL")
+    add_bulk_arguments(detect_parser)
+    add_session_config_arguments(detect_parser)
     
     # 颜色过滤器信息命令
     color_parser = subparsers.add_parser("colors", help="显示可用的颜色过滤器预设")
@@ -43,6 +122,14 @@ def main():
     
     if args.command == "api":
         start_api_server(args)
+    elif args.command == "bench-api":
+        run_api_benchmark(args)
+    elif args.command == "bench":
+        run_engine_benchmark(args)
+    elif args.command == "quant-report":
+        run_quantization_report(args)
+    elif args.command in ("ocr", "detect"):
+        run_bulk(args)
     elif args.command == "colors":
         show_color_presets()
     elif args.command == "version":
@@ -53,6 +140,83 @@ def main():
         parser.print_help()
 
 
+def add_session_config_arguments(parser):
+    """添加ONNX运行时会话配置参数"""
+    group = parser.add_argument_group("ONNX运行时会话配置")
+    group.add_argument("--intra-op-threads", type=int, help="单个算子内部并行线程数 (默认: 自动)")
+    group.add_argument("--inter-op-threads", type=int, help="算子之间并行线程数 (默认: 自动)")
+    group.add_argument("--execution-mode", choices=["sequential", "parallel"], help="执行模式 (默认: sequential)")
+    group.add_argument("--graph-optimization-level", choices=["disabled", "basic", "extended", "all"],
+                       help="图优化级别 (默认: all)")
+    group.add_argument("--disable-cpu-mem-arena", action="store_true", help="禁用CPU内存池")
+    group.add_argument("--disable-mem-pattern", action="store_true", help="禁用内存复用模式")
+    group.add_argument("--cache-optimized-model", action="store_true", help="缓存优化后的模型并在下次启动时复用")
+    group.add_argument("--optimized-model-dir", help="优化模型缓存目录 (默认: 与模型同目录)")
+
+
+def add_scheduler_arguments(parser):
+    """添加推理调度参数"""
+    group = parser.add_argument_group("推理调度")
+    group.add_argument("--max-batch-size", type=int, default=8,
+                       help="合并并发请求的最大批次大小，1表示不合并 (默认: 8)")
+    group.add_argument("--max-wait-ms", type=float, default=2.0,
+                       help="批次未满时最长等待时间，单位毫秒 (默认: 2.0)")
+    group.add_argument("--inference-workers", type=int,
+                       help="推理工作线程数 (默认: CPU核数，最多4个)")
+    group.add_argument("--cache-size", type=int, default=0,
+                       help="结果缓存最大条目数，0表示不缓存 (默认: 0)")
+    group.add_argument("--cache-ttl", type=float, default=300.0,
+                       help="缓存条目有效期，单位秒，0表示不过期 (默认: 300)")
+    group.add_argument("--cache-memory-mb", type=float, default=64.0,
+                       help="结果缓存内存上限，单位MB (默认: 64)")
+
+
+def add_bulk_arguments(parser):
+    """添加批量识别参数"""
+    parser.add_argument("inputs", nargs="*",
+                        help="图片文件、目录或通配符模式（如 'imgs/**/*.png'），- 或不指定时从标准输入逐行读取路径")
+    parser.add_argument("--workers", type=int, help="工作进程数，每个进程加载一次模型，1表示在当前进程中识别 (默认: CPU核数)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="每次分发给工作进程的图片数 (默认: 8)")
+    parser.add_argument("--precision", choices=["fp32", "int8"], default="fp32", help="模型精度 (默认: fp32)")
+    parser.add_argument("--output", help="结果写入的JSONL文件 (默认: 标准输出)")
+
+
+def session_config_from_args(args, config=None):
+    """
+    从命令行参数和配置文件构建会话配置字典
+
+    配置文件中的 session_config 字段作为基础，命令行参数覆盖其中的同名项
+    """
+    session_config = dict((config or {}).get("session_config") or {})
+    overrides = {
+        "intra_op_num_threads": args.intra_op_threads,
+        "inter_op_num_threads": args.inter_op_threads,
+        "execution_mode": args.execution_mode,
+        "graph_optimization_level": args.graph_optimization_level,
+        "enable_cpu_mem_arena": False if args.disable_cpu_mem_arena else None,
+        "enable_mem_pattern": False if args.disable_mem_pattern else None,
+        "cache_optimized_model": True if args.cache_optimized_model else None,
+        "optimized_model_dir": args.optimized_model_dir,
+    }
+    session_config.update({k: v for k, v in overrides.items() if v is not None})
+    return session_config or None
+
+
+def preload_from_args(args):
+    """
+    将 --preload 参数转换为启动时的模型初始化配置
+
+    如 "ocr,det" 转换为 {"ocr": True, "det": True}
+    """
+    if not args.preload:
+        return None
+    models = {name.strip() for name in args.preload.split(",") if name.strip()}
+    unknown = models - {"ocr", "det"}
+    if unknown:
+        raise ValueError(f"--preload 不支持的模型: {', '.join(sorted(unknown))}")
+    return {"ocr": "ocr" in models, "det": "det" in models}
+
+
 def start_api_server(args):
     """启动API服务器"""
     try:
@@ -75,7 +239,19 @@ def start_api_server(args):
             "port": config.get("port", args.port),
             "workers": config.get("workers", args.workers),
             "reload": config.get("reload", args.reload),
-            "log_level": config.get("log_level", args.log_level)
+            "log_level": config.get("log_level", args.log_level),
+            "session_config": session_config_from_args(args, config),
+            "max_batch_size": config.get("max_batch_size", args.max_batch_size),
+            "max_wait_ms": config.get("max_wait_ms", args.max_wait_ms),
+            "inference_workers": config.get("inference_workers", args.inference_workers),
+            "cache_size": config.get("cache_size", args.cache_size),
+            "cache_ttl": config.get("cache_ttl", args.cache_ttl),
+            "cache_memory_mb": config.get("cache_memory_mb", args.cache_memory_mb),
+            "preload": config.get("preload", preload_from_args(args)),
+            "warmup": {"enabled": False} if args.no_warmup else config.get("warmup"),
+            "cpu_affinity": config.get("cpu_affinity", args.cpu_affinity),
+            "precision": args.precision or config.get("precision", "fp32"),
+            "fast_preprocess": args.fast_preprocess or config.get("fast_preprocess", False)
         }
         
         print("=" * 60)
@@ -84,8 +260,19 @@ def start_api_server(args):
         print(f"主机地址: {server_config['host']}")
         print(f"端口: {server_config['port']}")
         print(f"工作进程: {server_config['workers']}")
+        if server_config['preload']:
+            print(f"预加载模型: {server_config['preload']}")
         print(f"自动重载: {server_config['reload']}")
         print(f"日志级别: {server_config['log_level']}")
+        print(f"模型精度: {server_config['precision']}")
+        if server_config['fast_preprocess']:
+            print("OCR预处理: OpenCV快速路径")
+        if server_config['session_config']:
+            print(f"会话配置: {server_config['session_config']}")
+        print(f"微批次: 最大{server_config['max_batch_size']}张, 最长等待{server_config['max_wait_ms']}ms")
+        if server_config['cache_size'] > 0:
+            print(f"结果缓存: 最多{server_config['cache_size']}条, 有效期{server_config['cache_ttl']}s, "
+                  f"内存上限{server_config['cache_memory_mb']}MB")
         print("=" * 60)
         
         # 启动服务器
@@ -100,6 +287,177 @@ def start_api_server(args):
         sys.exit(1)
 
 
+def run_api_benchmark(args):
+    """压测HTTP API服务"""
+    try:
+        from .benchmark import ApiBenchmark, ENDPOINTS
+        
+        endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+        concurrency = [int(value) for value in args.concurrency.split(",") if value.strip()]
+        benchmark = ApiBenchmark(args.url, endpoints, concurrency, requests=args.requests,
+                                 duration=args.duration, warmup=args.warmup, batch_size=args.batch_size,
+                                 timeout=args.timeout, image_count=args.images, seed=args.seed)
+        
+        # JSON输出到标准输出时，进度信息输出到标准错误
+        log = sys.stderr if args.json_path == "-" else sys.stdout
+        needed = {ENDPOINTS[name][1] for name in endpoints}
+        if args.initialize:
+            benchmark.initialize(ocr="ocr" in needed, det="detection" in needed)
+        missing = needed - set(benchmark.loaded_models())
+        if missing:
+            raise RuntimeError(f"服务未加载模型: {', '.join(sorted(missing))}，可添加 --initialize 参数")
+        
+        print(f"压测 {benchmark.base_url}: 接口 {', '.join(endpoints)}，并发 {concurrency}", file=log)
+        report = benchmark.run(progress=lambda r: print(
+            f"  {r['endpoint']} 并发{r['concurrency']}: {r['requests_per_second']:.1f} 请求/秒, "
+            f"p99 {r['latency_ms']['p99']:.2f}ms, 错误率 {r['error_rate'] * 100:.2f}%", file=log))
+        print(file=log)
+        print(ApiBenchmark.format_table(report["results"]), file=log)
+        
+        if args.json_path == "-":
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+        elif args.json_path:
+            with open(args.json_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"\n结果已写入: {args.json_path}", file=log)
+        
+    except Exception as e:
+        print(f"压测失败: {e}")
+        sys.exit(1)
+
+
+def run_engine_benchmark(args):
+    """运行引擎微基准测试"""
+    try:
+        from .benchmark import EngineBenchmark
+        
+        baseline = None
+        if args.compare:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        
+        filters = [name.strip() for name in args.filter.split(",")] if args.filter else None
+        benchmark = EngineBenchmark(repeat=args.repeat, warmup=args.warmup,
+                                    stand_in=True if args.stand_in else None, filters=filters,
+                                    session_config=session_config_from_args(args))
+        report = benchmark.run(progress=lambda name, r: print(
+            f"  {name}: 中位数 {r['median_ms']:.3f}ms, p95 {r['p95_ms']:.3f}ms"))
+        print(f"\n模型: {report['models']}")
+        print(EngineBenchmark.format_results(report))
+        
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"\n结果已写入: {args.output}")
+        
+        if baseline is not None:
+            if baseline.get("models") != report["models"]:
+                print(f"\n警告: 基线使用 {baseline.get('models')} 模型，当前使用 {report['models']} 模型，结果可能不可比")
+            rows = EngineBenchmark.compare(baseline, report, threshold=args.threshold)
+            print(f"\n与基线比较 (阈值 {args.threshold * 100:.0f}%):")
+            print(EngineBenchmark.format_comparison(rows))
+            regressions = [row["name"] for row in rows if row["status"] == "regression"]
+            if regressions:
+                print(f"\n性能回退: {', '.join(regressions)}")
+                sys.exit(1)
+        
+    except Exception as e:
+        print(f"基准测试失败: {e}")
+        sys.exit(1)
+
+
+def run_quantization_report(args):
+    """比较fp32与int8量化模型"""
+    try:
+        from .benchmark import QuantizationReport
+        from .benchmark.quant_report import find_images, load_labels, label_from_filename
+        
+        images = find_images(args.images)
+        labels = None
+        if args.labels:
+            labels = load_labels(args.labels)
+        elif args.label_from_filename:
+            labels = {os.path.basename(path): label_from_filename(path) for path in images}
+        
+        report = QuantizationReport(images, model=args.model, old=args.old, beta=args.beta,
+                                    import_onnx_path=args.import_onnx_path, charsets_path=args.charsets_path,
+                                    labels=labels, repeat=args.repeat,
+                                    session_config=session_config_from_args(args),
+                                    isolate=not args.no_isolate)
+        print(f"评估 {args.model} 模型: {len(images)} 张图片，{args.repeat} 轮")
+        result = report.run(progress=lambda precision, r: print(
+            f"  {precision}: {r['model_path']}，中位数 {r['median_ms']:.3f}ms"))
+        print()
+        print(QuantizationReport.format_report(result))
+        
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"\n结果已写入: {args.output}")
+        
+    except Exception as e:
+        print(f"量化评估失败: {e}")
+        sys.exit(1)
+
+
+def run_bulk(args):
+    """
+    批量识别图片，结果按输入顺序以JSONL格式逐行输出，完成后在标准错误输出吞吐量
+
+    有图片识别失败时返回非零退出码
+    """
+    from .bulk import BulkRunner, iter_inputs
+    
+    mode = "det" if args.command == "detect" else "ocr"
+    options = {}
+    if mode == "ocr":
+        charset_range = args.charset_range
+        if charset_range is not None and charset_range.isdigit():
+            charset_range = int(charset_range)
+        options = {
+            "old": args.old, "beta": args.beta,
+            "import_onnx_path": args.import_onnx_path, "charsets_path": args.charsets_path,
+            "png_fix": args.png_fix,
+            "color_filter_colors": [c.strip() for c in args.colors.split(",") if c.strip()] if args.colors else None,
+            "charset_range": charset_range,
+            "fast_preprocess": args.fast_preprocess,
+        }
+    
+    count = errors = 0
+    start = time.perf_counter()
+    output = sys.stdout
+    try:
+        runner = BulkRunner(mode, workers=args.workers, chunk_size=args.chunk_size,
+                            session_config=session_config_from_args(args), precision=args.precision,
+                            **options)
+        if args.output:
+            output = open(args.output, "w", encoding="utf-8")
+        for record in runner.run(iter_inputs(args.inputs)):
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            count += 1
+            if "error" in record:
+                errors += 1
+    except BrokenPipeError:
+        # 下游提前关闭管道（如 | head），将标准输出重定向到空设备以免退出时再次报错
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except Exception as e:
+        print(f"批量识别失败: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"完成 {count} 张图片，失败 {errors} 张，耗时 {elapsed:.2f} 秒，{rate:.1f} 张/秒", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
 def show_color_presets():
     """显示颜色过滤器预设"""
     try:
@@ -182,6 +540,21 @@ DDDDOCR 使用示例
 5. 启动API服务:
    python -m ddddocr api --host 0.0.0.0 --port 8000
 
+   压测API服务:
+   python -m ddddocr bench-api --url http://127.0.0.1:8000 --endpoints ocr,ocr_batch --concurrency 1,8,32
+
+   引擎微基准测试（保存基线，修改代码后比较）:
+   python -m ddddocr bench --output baseline.json
+   python -m ddddocr bench --compare baseline.json
+
+   评估int8量化模型（文件名形如 a3b9_0001.png 时可从文件名取标签）:
+   python -m ddddocr quant-report ./captchas --label-from-filename
+   python -m ddddocr api --precision int8
+
+   批量识别本地图片（结果按输入顺序输出为JSONL）:
+   python -m ddddocr ocr ./captchas --workers 4 --output result.jsonl
+   find ./images -name '*.jpg' | python -m ddddocr detect -
+
 6. 查看可用颜色:
    python -m ddddocr colors
 
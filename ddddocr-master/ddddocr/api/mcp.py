@@ -12,6 +12,17 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 
 from .models import MCPRequest, MCPResponse, MCPCapabilities
+from .routes import slide_options
+
+# 滑块匹配/比较工具共用的匹配参数
+SLIDE_OPTION_SCHEMA = {
+    "mode": {"type": "string", "enum": ["exact", "pyramid"],
+             "description": "匹配模式：exact为全分辨率匹配，pyramid为先缩小粗匹配再在全分辨率小窗口内精匹配"},
+    "roi": {"type": "array", "items": {"type": "integer"}, "description": "搜索区域 [x, y, width, height]"},
+    "row_band": {"type": "array", "items": {"type": "integer"}, "description": "搜索的行范围 [y_start, y_end]"},
+    "tolerance": {"type": "integer", "minimum": 0, "description": "金字塔模式精匹配窗口额外扩展的像素数"},
+    "pyramid_scale": {"type": "number", "description": "金字塔模式粗匹配的缩放比例（0到1之间）"}
+}
 
 
 class MCPHandler:
@@ -40,7 +51,20 @@ class MCPHandler:
                                 "det": {"type": "boolean", "description": "是否启用目标检测功能"},
                                 "old": {"type": "boolean", "description": "是否使用旧版OCR模型"},
                                 "beta": {"type": "boolean", "description": "是否使用beta版OCR模型"},
-                                "use_gpu": {"type": "boolean", "description": "是否使用GPU"}
+                                "use_gpu": {"type": "boolean", "description": "是否使用GPU"},
+                                "session_config": {
+                                    "type": "object",
+                                    "description": "ONNX运行时会话配置，如 {\"intra_op_num_threads\": 2}"
+                                },
+                                "precision": {
+                                    "type": "string",
+                                    "enum": ["fp32", "int8"],
+                                    "description": "模型精度，int8使用动态量化模型"
+                                },
+                                "fast_preprocess": {
+                                    "type": "boolean",
+                                    "description": "OCR是否使用OpenCV快速预处理路径（少量识别结果可能改变）"
+                                }
                             }
                         }
                     },
@@ -63,7 +87,17 @@ class MCPHandler:
                                         {"type": "integer"},
                                         {"type": "string"}
                                     ],
-                                    "description": "字符集范围限制"
+                                    "description": "字符集范围限制（仅作用于本次请求）"
+                                },
+                                "top_k": {
+                                    "type": "integer",
+                                    "minimum": 1,
+                                    "description": "返回每个字符前k个候选及概率（紧凑置信度输出）"
+                                },
+                                "probability_encoding": {
+                                    "type": "string",
+                                    "enum": ["list", "float16"],
+                                    "description": "概率数组编码方式"
                                 }
                             },
                             "required": ["image"]
@@ -88,7 +122,8 @@ class MCPHandler:
                             "properties": {
                                 "target_image": {"type": "string", "description": "滑块图片（base64编码）"},
                                 "background_image": {"type": "string", "description": "背景图片（base64编码）"},
-                                "simple_target": {"type": "boolean", "description": "是否为简单滑块"}
+                                "simple_target": {"type": "boolean", "description": "是否为简单滑块"},
+                                **SLIDE_OPTION_SCHEMA
                             },
                             "required": ["target_image", "background_image"]
                         }
@@ -100,7 +135,8 @@ class MCPHandler:
                             "type": "object",
                             "properties": {
                                 "target_image": {"type": "string", "description": "带坑位的图片（base64编码）"},
-                                "background_image": {"type": "string", "description": "完整背景图片（base64编码）"}
+                                "background_image": {"type": "string", "description": "完整背景图片（base64编码）"},
+                                **SLIDE_OPTION_SCHEMA
                             },
                             "required": ["target_image", "background_image"]
                         }
@@ -127,7 +163,7 @@ class MCPHandler:
                 if method == "ddddocr_initialize":
                     from .models import InitializeRequest
                     init_request = InitializeRequest(**params)
-                    result = self.service.initialize(init_request)
+                    result = await self.service.run_loader(self.service.initialize, init_request)
                     
                 elif method == "ddddocr_ocr":
                     from .models import OCRRequest
@@ -139,18 +175,19 @@ class MCPHandler:
                     # 解码base64图片
                     image_data = base64.b64decode(ocr_request.image)
                     
-                    # 设置字符集范围
-                    if ocr_request.charset_range is not None:
-                        self.service.ocr_instance.set_ranges(ocr_request.charset_range)
-                    
-                    # 执行OCR识别
-                    result = self.service.ocr_instance.classification(
-                        image_data,
-                        png_fix=ocr_request.png_fix,
-                        probability=ocr_request.probability,
-                        color_filter_colors=ocr_request.color_filter_colors,
-                        color_filter_custom_ranges=ocr_request.color_filter_custom_ranges
-                    )
+                    # 执行OCR识别（租用当前实例，模型替换时旧实例在请求完成后才释放）
+                    with self.service.lease("ocr") as instance:
+                        result = await self.service.scheduler.classify(
+                            instance,
+                            image_data,
+                            png_fix=ocr_request.png_fix,
+                            probability=ocr_request.probability,
+                            color_filter_colors=ocr_request.color_filter_colors,
+                            color_filter_custom_ranges=ocr_request.color_filter_custom_ranges,
+                            charset_range=ocr_request.charset_range,
+                            top_k=ocr_request.top_k,
+                            probability_encoding=ocr_request.probability_encoding
+                        )
                     
                 elif method == "ddddocr_detection":
                     from .models import DetectionRequest
@@ -163,7 +200,8 @@ class MCPHandler:
                     image_data = base64.b64decode(det_request.image)
                     
                     # 执行目标检测
-                    result = self.service.det_instance.detection(image_data)
+                    with self.service.lease("detection") as instance:
+                        result = await self.service.scheduler.detect(instance, image_data)
                     
                 elif method == "ddddocr_slide_match":
                     from .models import SlideMatchRequest
@@ -177,9 +215,12 @@ class MCPHandler:
                     background_data = base64.b64decode(slide_request.background_image)
                     
                     # 执行滑块匹配
-                    result = self.service.slide_instance.slide_match(
-                        target_data, background_data, simple_target=slide_request.simple_target
-                    )
+                    with self.service.lease("slide") as instance:
+                        result = await self.service.scheduler.run(
+                            instance.slide_match,
+                            target_data, background_data, simple_target=slide_request.simple_target,
+                            **slide_options(slide_request)
+                        )
                     
                 elif method == "ddddocr_slide_comparison":
                     from .models import SlideComparisonRequest
@@ -193,7 +234,11 @@ class MCPHandler:
                     background_data = base64.b64decode(slide_request.background_image)
                     
                     # 执行滑块比较
-                    result = self.service.slide_instance.slide_comparison(target_data, background_data)
+                    with self.service.lease("slide") as instance:
+                        result = await self.service.scheduler.run(
+                            instance.slide_comparison, target_data, background_data,
+                            **slide_options(slide_request)
+                        )
                     
                 elif method == "ddddocr_status":
                     result = self.service.get_status().dict()
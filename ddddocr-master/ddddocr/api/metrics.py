@@ -0,0 +1,223 @@
+# coding=utf-8
+"""
+服务监控指标
+以Prometheus文本格式导出请求计数、错误计数、分阶段耗时直方图及推理队列状态，
+并为每个响应添加Server-Timing响应头
+"""
+
+import os
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.stage_timer import StageTimer, current_timer
+
+# 耗时直方图默认分桶（秒）
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: Any) -> str:
+    """转义标签值"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    """格式化标签集合"""
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+def _format_value(value: float) -> str:
+    """格式化样本值"""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def mark_request_failed() -> None:
+    """将当前请求标记为失败（用于返回success=False但HTTP状态码为200的响应）"""
+    timer = current_timer()
+    if timer is not None:
+        timer.failed = True
+
+
+class _Histogram:
+    """带标签的直方图"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, List] = {}
+
+    def observe(self, labels: Tuple, value: float) -> None:
+        """记录一个观测值（调用方需持有锁）"""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> List[str]:
+        """输出文本格式（调用方需持有锁）"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        names = self.label_names + ('le',)
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (le,))} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {repr(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    服务指标注册表
+
+    记录每个接口的请求数、错误数、总耗时及各阶段（base64解码、图片解码、预处理、
+    排队、推理、后处理）耗时，导出时附带推理调度器和结果缓存的实时状态。
+    指标只统计当前进程，预派生多进程模式下每次抓取只返回处理该请求的工作进程的数据，
+    可通过worker_info中的pid区分
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = 'ddddocr'):
+        """
+        初始化指标注册表
+
+        Args:
+            buckets: 耗时直方图分桶上界（秒）
+            prefix: 指标名前缀
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._errors: Dict[Tuple[str], int] = {}
+        self.in_progress = 0
+        self._duration = _Histogram(f"{prefix}_request_duration_seconds", "请求处理总耗时（秒）",
+                                    ('endpoint',), buckets)
+        self._stages = _Histogram(f"{prefix}_stage_duration_seconds", "请求各处理阶段耗时（秒）",
+                                  ('endpoint', 'stage'), buckets)
+
+    def observe(self, endpoint: str, method: str, status: int, duration: float,
+                timer: Optional[StageTimer] = None) -> None:
+        """
+        记录一次请求
+
+        Args:
+            endpoint: 路由路径
+            method: 请求方法
+            status: 响应状态码
+            duration: 总耗时（秒）
+            timer: 请求的阶段计时器
+        """
+        failed = status >= 400 or (timer is not None and timer.failed)
+        stages = list(timer.stages.items()) if timer is not None else []
+        with self._lock:
+            key = (endpoint, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if failed:
+                self._errors[(endpoint,)] = self._errors.get((endpoint,), 0) + 1
+            self._duration.observe((endpoint,), duration)
+            for name, seconds in stages:
+                self._stages.observe((endpoint, name), seconds)
+
+    def render(self, scheduler: Any = None) -> str:
+        """
+        导出Prometheus文本格式指标
+
+        Args:
+            scheduler: 推理调度器，提供队列深度、批次大小及结果缓存统计
+
+        Returns:
+            指标文本
+        """
+        p = self.prefix
+        lines: List[str] = []
+
+        def add(name: str, kind: str, help_text: str, samples: List[Tuple[Tuple, Tuple, float]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for label_names, label_values, value in samples:
+                lines.append(f"{name}{_format_labels(label_names, label_values)} {_format_value(value)}")
+
+        add(f"{p}_worker_info", "gauge", "导出指标的进程（多进程模式下各工作进程分别统计）",
+            [(('pid',), (os.getpid(),), 1)])
+        with self._lock:
+            add(f"{p}_requests_total", "counter", "请求总数",
+                [(('endpoint', 'method', 'status'), key, count) for key, count in sorted(self._requests.items())])
+            add(f"{p}_request_errors_total", "counter", "失败请求数（HTTP错误或success=False）",
+                [(('endpoint',), key, count) for key, count in sorted(self._errors.items())])
+            add(f"{p}_requests_in_progress", "gauge", "正在处理的请求数", [((), (), self.in_progress)])
+            lines.extend(self._duration.render())
+            lines.extend(self._stages.render())
+
+        if scheduler is not None:
+            stats = scheduler.stats()
+            add(f"{p}_scheduler_queue_depth", "gauge", "等待凑批的推理请求数", [((), (), stats['pending'])])
+            add(f"{p}_scheduler_active_batches", "gauge", "正在执行的批次数", [((), (), stats['active_batches'])])
+            add(f"{p}_scheduler_active_batch_items", "gauge", "正在执行的批次中的请求数",
+                [((), (), stats['active_items'])])
+            add(f"{p}_scheduler_last_batch_size", "gauge", "最近一个批次的大小", [((), (), stats['last_batch_size'])])
+            add(f"{p}_scheduler_batches_total", "counter", "已提交的批次数", [((), (), stats['batches'])])
+            add(f"{p}_scheduler_batched_items_total", "counter", "已提交批次中的请求总数",
+                [((), (), stats['batched_items'])])
+
+            cache = getattr(scheduler, 'result_cache', None)
+            if cache is not None:
+                cache_stats = cache.stats()
+                for field, kind, help_text in (('hits', 'counter', '结果缓存命中次数'),
+                                               ('misses', 'counter', '结果缓存未命中次数'),
+                                               ('coalesced', 'counter', '合并到进行中计算的请求数'),
+                                               ('evictions', 'counter', '结果缓存淘汰条目数'),
+                                               ('entries', 'gauge', '结果缓存条目数'),
+                                               ('memory_bytes', 'gauge', '结果缓存估算占用字节数')):
+                    suffix = '_total' if kind == 'counter' else ''
+                    add(f"{p}_result_cache_{field}{suffix}", kind, help_text, [((), (), cache_stats[field])])
+
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsMiddleware:
+    """
+    ASGI指标中间件
+
+    为每个HTTP请求激活阶段计时器，在响应头中加入Server-Timing，
+    请求结束后将状态码与各阶段耗时记录到指标注册表
+    """
+
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timer = StageTimer()
+        status = [500]
+
+        async def send_with_timing(message):
+            if message['type'] == 'http.response.start':
+                status[0] = message['status']
+                headers = list(message.get('headers', []))
+                headers.append((b'server-timing', timer.server_timing().encode('latin-1')))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        self.registry.in_progress += 1
+        try:
+            with timer.activate():
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            self.registry.in_progress -= 1
+            route = scope.get('route')
+            endpoint = getattr(route, 'path', None) or 'unmatched'
+            self.registry.observe(endpoint, scope.get('method', ''), status[0], timer.elapsed(), timer)
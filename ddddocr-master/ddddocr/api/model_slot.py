@@ -0,0 +1,133 @@
+# coding=utf-8
+"""
+模型实例槽位
+支持在后台加载好新模型后原子替换，并等待旧实例上的请求全部完成后再释放
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+
+class ModelSlot:
+    """
+    可热替换的模型实例槽位
+
+    请求通过lease()租用当前实例，租用期间该实例不会被释放；
+    swap()原子地替换实例，之后的请求只会拿到新实例，
+    旧实例可通过drain()等待已租用的请求结束后再清理
+    """
+
+    def __init__(self, name: str, instance: Any = None):
+        """
+        初始化槽位
+
+        Args:
+            name: 槽位名称（如 ocr、detection、slide）
+            instance: 初始实例
+        """
+        self.name = name
+        self._instance = instance
+        # 按实例id记录未结束的租用数，实例在租用期间由_Lease持有引用，id不会被复用
+        self._leases: Dict[int, int] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def instance(self) -> Any:
+        """当前实例"""
+        return self._instance
+
+    def lease(self) -> '_Lease':
+        """
+        租用当前实例
+
+        Returns:
+            上下文管理器，进入时返回当前实例（可能为None），退出时归还
+        """
+        return _Lease(self)
+
+    def swap(self, instance: Any) -> Any:
+        """
+        原子替换实例
+
+        Args:
+            instance: 新实例，None表示卸载
+
+        Returns:
+            被替换的旧实例
+        """
+        with self._condition:
+            old = self._instance
+            self._instance = instance
+            return old
+
+    def in_flight(self, instance: Any = None) -> int:
+        """
+        获取未结束的租用数
+
+        Args:
+            instance: 指定实例，None表示所有实例
+
+        Returns:
+            租用数
+        """
+        with self._condition:
+            if instance is None:
+                return sum(self._leases.values())
+            return self._leases.get(id(instance), 0)
+
+    def drain(self, instance: Any, timeout: Optional[float] = None) -> bool:
+        """
+        等待指定实例上的租用全部结束
+
+        Args:
+            instance: 已被替换下来的旧实例
+            timeout: 最长等待秒数，None表示一直等待
+
+        Returns:
+            是否已全部结束
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: id(instance) not in self._leases, timeout)
+
+    def _acquire(self) -> Any:
+        """租用当前实例"""
+        with self._condition:
+            instance = self._instance
+            if instance is not None:
+                key = id(instance)
+                self._leases[key] = self._leases.get(key, 0) + 1
+            return instance
+
+    def _release(self, instance: Any) -> None:
+        """归还租用的实例"""
+        if instance is None:
+            return
+        with self._condition:
+            key = id(instance)
+            count = self._leases[key] - 1
+            if count:
+                self._leases[key] = count
+            else:
+                del self._leases[key]
+                self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        return f"ModelSlot(name={self.name}, loaded={self._instance is not None}, in_flight={self.in_flight()})"
+
+
+class _Lease:
+    """实例租用上下文"""
+
+    __slots__ = ('slot', 'instance')
+
+    def __init__(self, slot: ModelSlot):
+        self.slot = slot
+        self.instance = None
+
+    def __enter__(self) -> Any:
+        self.instance = self.slot._acquire()
+        return self.instance
+
+    def __exit__(self, *exc_info) -> None:
+        self.slot._release(self.instance)
+        self.instance = None
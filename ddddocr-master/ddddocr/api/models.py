@@ -7,6 +7,18 @@ from typing import List, Optional, Union, Dict, Any
 from pydantic import BaseModel, Field
 
 
+class SessionConfigModel(BaseModel):
+    """ONNX运行时会话配置模型"""
+    intra_op_num_threads: Optional[int] = Field(None, ge=0, description="单个算子内部并行线程数，0表示自动")
+    inter_op_num_threads: Optional[int] = Field(None, ge=0, description="算子之间并行线程数，0表示自动")
+    execution_mode: Optional[str] = Field(None, description="执行模式: 'sequential', 'parallel'")
+    graph_optimization_level: Optional[str] = Field(None, description="图优化级别: 'disabled', 'basic', 'extended', 'all'")
+    enable_cpu_mem_arena: Optional[bool] = Field(None, description="是否启用CPU内存池")
+    enable_mem_pattern: Optional[bool] = Field(None, description="是否启用内存复用模式")
+    cache_optimized_model: Optional[bool] = Field(None, description="是否缓存优化后的模型并在下次启动时复用")
+    optimized_model_dir: Optional[str] = Field(None, description="优化模型缓存目录，默认与模型同目录")
+
+
 class InitializeRequest(BaseModel):
     """初始化请求模型"""
     ocr: bool = Field(True, description="是否启用OCR功能")
@@ -17,6 +29,19 @@ class InitializeRequest(BaseModel):
     device_id: int = Field(0, description="GPU设备ID")
     import_onnx_path: str = Field("", description="自定义ONNX模型路径")
     charsets_path: str = Field("", description="自定义字符集路径")
+    session_config: Optional[SessionConfigModel] = Field(None, description="ONNX运行时会话配置，未指定时使用服务默认配置")
+    precision: Optional[str] = Field(None, description="模型精度: 'fp32', 'int8'（动态量化模型），未指定时使用服务默认精度")
+    fast_preprocess: Optional[bool] = Field(None, description="OCR是否使用OpenCV快速预处理路径（不经过PIL，少量识别结果可能改变），未指定时使用服务默认设置")
+
+
+class WarmupConfig(BaseModel):
+    """启动预热配置"""
+    enabled: bool = Field(True, description="是否在启动时执行预热推理")
+    iterations: int = Field(2, ge=1, description="每种输入形状的预热次数")
+    ocr_sizes: List[List[int]] = Field([[100, 30], [120, 40], [160, 60], [200, 80]],
+                                       description="OCR预热图片尺寸列表，每项为 [宽, 高]")
+    det_sizes: List[List[int]] = Field([[320, 160], [640, 480]], description="目标检测预热图片尺寸列表，每项为 [宽, 高]")
+    batch_sizes: Optional[List[int]] = Field(None, description="预热的批次大小，默认为1和推理调度器的最大批次")
 
 
 class SwitchModelRequest(BaseModel):
@@ -24,6 +49,9 @@ class SwitchModelRequest(BaseModel):
     model_type: str = Field(..., description="模型类型: 'ocr', 'det', 'ocr_old', 'ocr_beta'")
     use_gpu: bool = Field(False, description="是否使用GPU")
     device_id: int = Field(0, description="GPU设备ID")
+    session_config: Optional[SessionConfigModel] = Field(None, description="ONNX运行时会话配置，未指定时使用服务默认配置")
+    precision: Optional[str] = Field(None, description="模型精度: 'fp32', 'int8'（动态量化模型），未指定时使用服务默认精度")
+    fast_preprocess: Optional[bool] = Field(None, description="OCR是否使用OpenCV快速预处理路径（不经过PIL，少量识别结果可能改变），未指定时使用服务默认设置")
 
 
 class ToggleFeatureRequest(BaseModel):
@@ -32,14 +60,20 @@ class ToggleFeatureRequest(BaseModel):
     enabled: bool = Field(..., description="是否启用")
 
 
-class OCRRequest(BaseModel):
-    """OCR识别请求模型"""
-    image: str = Field(..., description="图片数据（base64编码）")
+class OCROptions(BaseModel):
+    """OCR识别参数模型"""
     png_fix: bool = Field(False, description="是否修复PNG透明背景问题")
     probability: bool = Field(False, description="是否返回概率信息")
     color_filter_colors: Optional[List[str]] = Field(None, description="颜色过滤预设颜色列表")
     color_filter_custom_ranges: Optional[List[List[List[int]]]] = Field(None, description="自定义HSV颜色范围")
-    charset_range: Optional[Union[int, str]] = Field(None, description="字符集范围限制")
+    charset_range: Optional[Union[int, str]] = Field(None, description="字符集范围限制（仅作用于本次请求）")
+    top_k: Optional[int] = Field(None, ge=1, description="返回每个字符前k个候选及概率（紧凑置信度输出，代替完整概率矩阵）")
+    probability_encoding: str = Field('list', description="概率数组编码方式: 'list', 'float16'（base64编码的二进制数据）")
+
+
+class OCRRequest(OCROptions):
+    """OCR识别请求模型"""
+    image: str = Field(..., description="图片数据（base64编码）")
 
 
 class DetectionRequest(BaseModel):
@@ -47,14 +81,23 @@ class DetectionRequest(BaseModel):
     image: str = Field(..., description="图片数据（base64编码）")
 
 
-class SlideMatchRequest(BaseModel):
+class SlideOptions(BaseModel):
+    """滑块匹配/比较参数模型"""
+    mode: str = Field('exact', description="匹配模式: 'exact'（全分辨率）, 'pyramid'（先缩小粗匹配再在全分辨率小窗口内精匹配）")
+    roi: Optional[List[int]] = Field(None, description="搜索区域 [x, y, width, height]")
+    row_band: Optional[List[int]] = Field(None, description="搜索的行范围 [y_start, y_end]，不能与roi同时指定")
+    tolerance: int = Field(2, ge=0, description="金字塔模式精匹配窗口额外扩展的像素数")
+    pyramid_scale: float = Field(0.5, gt=0, lt=1, description="金字塔模式粗匹配的缩放比例")
+
+
+class SlideMatchRequest(SlideOptions):
     """滑块匹配请求模型"""
     target_image: str = Field(..., description="滑块图片（base64编码）")
     background_image: str = Field(..., description="背景图片（base64编码）")
     simple_target: bool = Field(False, description="是否为简单滑块")
 
 
-class SlideComparisonRequest(BaseModel):
+class SlideComparisonRequest(SlideOptions):
     """滑块比较请求模型"""
     target_image: str = Field(..., description="带坑位的图片（base64编码）")
     background_image: str = Field(..., description="完整背景图片（base64编码）")
@@ -74,6 +117,16 @@ class StatusResponse(BaseModel):
     enabled_features: List[str] = Field(..., description="已启用的功能列表")
     version: str = Field(..., description="版本信息")
     uptime: float = Field(..., description="运行时间（秒）")
+    result_cache: Optional[Dict[str, Any]] = Field(None, description="结果缓存统计（未启用缓存时为空）")
+
+
+class ReadinessResponse(BaseModel):
+    """就绪状态响应模型"""
+    ready: bool = Field(..., description="是否已完成启动预加载与预热")
+    stage: str = Field(..., description="启动阶段: 'starting', 'loading', 'warming', 'ready', 'failed'")
+    loaded_models: List[str] = Field(..., description="已加载的模型列表")
+    warmup_seconds: Optional[float] = Field(None, description="预热耗时（秒）")
+    error: Optional[str] = Field(None, description="启动失败原因")
 
 
 class OCRResponse(BaseModel):
@@ -0,0 +1,188 @@
+# coding=utf-8
+"""
+预派生（pre-fork）多进程服务
+主进程加载模型权重、配置与字符集后派生多个工作进程共享监听端口，并负责监控和重启工作进程
+"""
+
+import gc
+import os
+import sys
+import time
+import signal
+import socket
+from typing import Any, Callable, Dict, List, Optional
+
+import uvicorn
+
+
+def supports_prefork() -> bool:
+    """当前平台是否支持预派生多进程模式"""
+    return hasattr(os, 'fork')
+
+
+class PreforkServer:
+    """
+    预派生多进程服务
+
+    主进程在派生前执行preload（加载字符集、解码表、会话配置，完成图优化并将模型权重读入内存），
+    随后冻结垃圾回收器追踪的对象，使这些内存页在工作进程间写时复制共享。
+    ONNX推理会话的线程池无法跨fork使用，因此会话在各工作进程首次推理时创建，
+    创建时直接引用主进程读入的权重（见SharedWeights），每个工作进程只增加会话自身的少量内存。
+
+    主进程只负责监控：工作进程异常退出时自动重启，
+    收到SIGTERM/SIGINT时通知所有工作进程优雅退出，超时后强制结束
+    """
+
+    # 工作进程启动后存活不足该秒数即退出时，重启前等待的秒数（避免崩溃循环占满CPU）
+    RESTART_BACKOFF = 1.0
+
+    def __init__(self, app: Any, host: str = "0.0.0.0", port: int = 8000, workers: int = 2,
+                 preload: Optional[Callable[[], Any]] = None, cpu_affinity: bool = False,
+                 graceful_timeout: int = 30, backlog: int = 2048, **uvicorn_kwargs):
+        """
+        初始化预派生服务
+
+        Args:
+            app: ASGI应用
+            host: 监听地址
+            port: 监听端口
+            workers: 工作进程数
+            preload: 派生前在主进程中执行的预加载函数
+            cpu_affinity: 是否将每个工作进程绑定到一个CPU核心（仅Linux）
+            graceful_timeout: 关闭时等待工作进程退出的秒数，超时后强制结束
+            backlog: 监听队列长度
+            **uvicorn_kwargs: 传递给uvicorn.Config的其他参数
+        """
+        if workers < 1:
+            raise ValueError("workers必须大于等于1")
+
+        self.app = app
+        self.host = host
+        self.port = port
+        self.num_workers = workers
+        self.preload = preload
+        self.cpu_affinity = cpu_affinity
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.uvicorn_kwargs = uvicorn_kwargs
+
+        self.workers: Dict[int, int] = {}
+        self._started_at: Dict[int, float] = {}
+        self._socket: Optional[socket.socket] = None
+        self._cpus: List[int] = []
+        self._stopping = False
+
+    def run(self) -> None:
+        """预加载、绑定端口、派生工作进程并进入监控循环，直到收到退出信号"""
+        if self.preload is not None:
+            self.preload()
+
+        if self.cpu_affinity:
+            if hasattr(os, 'sched_getaffinity'):
+                self._cpus = sorted(os.sched_getaffinity(0))
+            else:
+                print("警告: 当前平台不支持CPU绑定，已忽略 cpu_affinity")
+
+        self._socket = self._bind()
+
+        # 派生前完成一次回收并冻结现有对象，避免工作进程中的GC触碰共享页导致复制
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGALRM, self._handle_timeout)
+
+        print(f"主进程 {os.getpid()} 已预加载模型，启动 {self.num_workers} 个工作进程")
+        for index in range(self.num_workers):
+            self._spawn(index)
+
+        try:
+            self._supervise()
+        finally:
+            self._socket.close()
+            print("所有工作进程已退出")
+
+    def _bind(self) -> socket.socket:
+        """创建由所有工作进程共享的监听套接字"""
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn(self, index: int) -> None:
+        """派生第index个工作进程"""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._worker_main(index)
+            except BaseException as e:
+                if not isinstance(e, (SystemExit, KeyboardInterrupt)):
+                    print(f"工作进程 {os.getpid()} 异常退出: {str(e)}")
+                exit_code = e.code if isinstance(e, SystemExit) and isinstance(e.code, int) else 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(exit_code)
+
+        self.workers[pid] = index
+        self._started_at[index] = time.monotonic()
+
+    def _worker_main(self, index: int) -> None:
+        """工作进程入口"""
+        # 恢复默认信号处理，由uvicorn安装自己的处理函数
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGALRM):
+            signal.signal(signum, signal.SIG_DFL)
+
+        if self._cpus:
+            cpu = self._cpus[index % len(self._cpus)]
+            os.sched_setaffinity(0, {cpu})
+            print(f"工作进程 {os.getpid()} 已绑定到CPU {cpu}")
+
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, **self.uvicorn_kwargs)
+        uvicorn.Server(config).run(sockets=[self._socket])
+
+    def _supervise(self) -> None:
+        """等待工作进程退出，非关闭状态下重启异常退出的进程"""
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            index = self.workers.pop(pid, None)
+            if index is None or self._stopping:
+                continue
+
+            print(f"警告: 工作进程 {pid} 已退出（状态 {status}），正在重启")
+            if time.monotonic() - self._started_at.get(index, 0.0) < self.RESTART_BACKOFF:
+                time.sleep(self.RESTART_BACKOFF)
+            if not self._stopping:
+                self._spawn(index)
+
+    def _handle_stop(self, signum, frame) -> None:
+        """通知所有工作进程优雅退出"""
+        if self._stopping:
+            return
+        self._stopping = True
+        print("正在关闭工作进程...")
+        self._signal_workers(signal.SIGTERM)
+        signal.alarm(self.graceful_timeout)
+
+    def _handle_timeout(self, signum, frame) -> None:
+        """优雅退出超时，强制结束剩余工作进程"""
+        if self.workers:
+            print(f"警告: {len(self.workers)} 个工作进程未在 {self.graceful_timeout} 秒内退出，强制结束")
+            self._signal_workers(signal.SIGKILL)
+
+    def _signal_workers(self, signum: int) -> None:
+        """向所有工作进程发送信号"""
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
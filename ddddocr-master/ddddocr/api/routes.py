@@ -3,15 +3,50 @@
 API路由定义
 """
 
+import json
 import base64
+import asyncio
 import time
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Request, Depends, File, Query, UploadFile
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse, StreamingResponse
 
 from .models import *
+from .metrics import mark_request_failed
+from ..utils.stage_timer import stage
+
+
+def ocr_options(png_fix: bool = Query(False, description="是否修复PNG透明背景问题"),
+                probability: bool = Query(False, description="是否返回概率信息"),
+                color_filter_colors: Optional[List[str]] = Query(None, description="颜色过滤预设颜色，可重复传入"),
+                color_filter_custom_ranges: Optional[str] = Query(
+                    None, description="自定义HSV颜色范围（JSON），如 [[[0,50,50],[10,255,255]]]"),
+                charset_range: Optional[str] = Query(None, description="字符集范围限制（仅作用于本次请求）"),
+                top_k: Optional[int] = Query(None, description="返回每个字符前k个候选及概率"),
+                probability_encoding: str = Query('list', description="概率数组编码方式: list 或 float16")) -> OCROptions:
+    """从查询参数解析二进制上传接口的OCR参数"""
+    custom_ranges = None
+    if color_filter_custom_ranges:
+        try:
+            custom_ranges = json.loads(color_filter_custom_ranges)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="color_filter_custom_ranges不是有效的JSON")
+    try:
+        return OCROptions(png_fix=png_fix, probability=probability,
+                          color_filter_colors=color_filter_colors,
+                          color_filter_custom_ranges=custom_ranges,
+                          charset_range=charset_range, top_k=top_k,
+                          probability_encoding=probability_encoding)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"OCR参数无效: {str(e)}")
+
+
+def slide_options(options: SlideOptions) -> Dict[str, Any]:
+    """将滑块请求中的匹配参数转换为引擎关键字参数"""
+    return dict(mode=options.mode, roi=options.roi, row_band=options.row_band,
+                tolerance=options.tolerance, pyramid_scale=options.pyramid_scale)
 
 
 def create_routes(app: FastAPI, service):
@@ -53,18 +88,20 @@ def create_routes(app: FastAPI, service):
     async def initialize(request: InitializeRequest):
         """初始化并选择加载的模型类型"""
         try:
-            result = service.initialize(request)
+            result = await service.run_loader(service.initialize, request)
             return APIResponse(success=True, message=result["message"], data=result)
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=str(e))
     
     @app.post("/switch-model", response_model=APIResponse)
     async def switch_model(request: SwitchModelRequest):
         """运行时切换模型配置"""
         try:
-            result = service.switch_model(request)
+            result = await service.run_loader(service.switch_model, request)
             return APIResponse(success=True, message=result["message"], data=result)
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=str(e))
     
     @app.post("/toggle-feature", response_model=APIResponse)
@@ -74,76 +111,164 @@ def create_routes(app: FastAPI, service):
             result = service.toggle_feature(request)
             return APIResponse(success=True, message=result["message"], data=result)
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=str(e))
     
-    @app.post("/ocr", response_model=APIResponse)
-    async def ocr_recognition(request: OCRRequest):
-        """执行OCR识别"""
+    def check_ocr_available():
+        """检查OCR功能是否可用"""
+        if not service.ocr_instance:
+            raise HTTPException(status_code=400, detail="OCR功能未初始化，请先调用 /initialize 接口")
+        
+        if "ocr" not in service.enabled_features:
+            raise HTTPException(status_code=400, detail="OCR功能已禁用")
+    
+    def check_detection_available():
+        """检查目标检测功能是否可用"""
+        if not service.det_instance:
+            raise HTTPException(status_code=400, detail="目标检测功能未初始化，请先调用 /initialize 接口")
+        
+        if "detection" not in service.enabled_features:
+            raise HTTPException(status_code=400, detail="目标检测功能已禁用")
+    
+    async def run_ocr(image_data: bytes, options: OCROptions) -> APIResponse:
+        """执行OCR识别（由调度器合并并发请求后在工作线程中执行）"""
         try:
-            if not service.ocr_instance:
-                raise HTTPException(status_code=400, detail="OCR功能未初始化，请先调用 /initialize 接口")
-            
-            if "ocr" not in service.enabled_features:
-                raise HTTPException(status_code=400, detail="OCR功能已禁用")
-            
-            # 解码base64图片
-            try:
-                image_data = base64.b64decode(request.image)
-            except Exception:
-                raise HTTPException(status_code=400, detail="图片base64解码失败")
-            
-            # 设置字符集范围
-            if request.charset_range is not None:
-                service.ocr_instance.set_ranges(request.charset_range)
-            
-            # 执行OCR识别
-            result = service.ocr_instance.classification(
-                image_data,
-                png_fix=request.png_fix,
-                probability=request.probability,
-                color_filter_colors=request.color_filter_colors,
-                color_filter_custom_ranges=request.color_filter_custom_ranges
-            )
+            # 租用当前模型实例，模型替换时旧实例在本请求完成后才释放
+            with service.lease("ocr") as instance:
+                if instance is None:
+                    raise HTTPException(status_code=400, detail="OCR功能未初始化")
+                result = await service.scheduler.classify(
+                    instance,
+                    image_data,
+                    png_fix=options.png_fix,
+                    probability=options.probability,
+                    color_filter_colors=options.color_filter_colors,
+                    color_filter_custom_ranges=options.color_filter_custom_ranges,
+                    charset_range=options.charset_range,
+                    top_k=options.top_k,
+                    probability_encoding=options.probability_encoding
+                )
             
-            if request.probability:
+            if options.probability or options.top_k is not None:
                 response_data = OCRResponse(text=None, probability=result)
             else:
                 response_data = OCRResponse(text=result, probability=None)
             
             return APIResponse(success=True, message="OCR识别成功", data=response_data.dict())
             
-        except HTTPException:
-            raise
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=f"OCR识别失败: {str(e)}")
     
-    @app.post("/detect", response_model=APIResponse)
-    async def object_detection(request: DetectionRequest):
-        """执行目标检测"""
+    async def run_detection(image_data: bytes) -> APIResponse:
+        """执行目标检测（由调度器合并并发请求后在工作线程中执行）"""
         try:
-            if not service.det_instance:
-                raise HTTPException(status_code=400, detail="目标检测功能未初始化，请先调用 /initialize 接口")
-            
-            if "detection" not in service.enabled_features:
-                raise HTTPException(status_code=400, detail="目标检测功能已禁用")
-            
-            # 解码base64图片
-            try:
-                image_data = base64.b64decode(request.image)
-            except Exception:
-                raise HTTPException(status_code=400, detail="图片base64解码失败")
-            
-            # 执行目标检测
-            bboxes = service.det_instance.detection(image_data)
+            with service.lease("detection") as instance:
+                if instance is None:
+                    raise HTTPException(status_code=400, detail="目标检测功能未初始化")
+                bboxes = await service.scheduler.detect(instance, image_data)
             
             response_data = DetectionResponse(bboxes=bboxes)
             return APIResponse(success=True, message="目标检测成功", data=response_data.dict())
             
-        except HTTPException:
-            raise
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=f"目标检测失败: {str(e)}")
     
+    def stream_results(tasks: List["asyncio.Future"]) -> StreamingResponse:
+        """按完成顺序以NDJSON逐行返回批量结果，每行附带图片在请求中的序号"""
+        async def generate():
+            indexed = [asyncio.ensure_future(_with_index(i, task)) for i, task in enumerate(tasks)]
+            try:
+                for next_done in asyncio.as_completed(indexed):
+                    index, response = await next_done
+                    yield json.dumps({"index": index, **response.dict()}, ensure_ascii=False) + "\n"
+            finally:
+                for task in indexed:
+                    task.cancel()
+        
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+    
+    async def read_uploads(files: List[UploadFile]) -> List[bytes]:
+        """读取上传的文件内容"""
+        if not files:
+            raise HTTPException(status_code=400, detail="未上传图片")
+        return [await file.read() for file in files]
+    
+    @app.post("/ocr", response_model=APIResponse)
+    async def ocr_recognition(request: OCRRequest):
+        """执行OCR识别"""
+        check_ocr_available()
+        
+        # 解码base64图片
+        try:
+            with stage('base64_decode'):
+                image_data = base64.b64decode(request.image)
+        except Exception:
+            raise HTTPException(status_code=400, detail="图片base64解码失败")
+        
+        return await run_ocr(image_data, request)
+    
+    @app.post("/ocr/file", response_model=APIResponse)
+    async def ocr_recognition_file(file: UploadFile = File(..., description="图片文件"),
+                                   options: OCROptions = Depends(ocr_options)):
+        """执行OCR识别（multipart/form-data上传图片，识别参数通过查询参数传入）"""
+        check_ocr_available()
+        return await run_ocr(await file.read(), options)
+    
+    @app.post("/ocr/raw", response_model=APIResponse)
+    async def ocr_recognition_raw(request: Request, options: OCROptions = Depends(ocr_options)):
+        """执行OCR识别（请求体为application/octet-stream图片原始字节）"""
+        check_ocr_available()
+        image_data = await request.body()
+        if not image_data:
+            raise HTTPException(status_code=400, detail="请求体为空")
+        return await run_ocr(image_data, options)
+    
+    @app.post("/ocr/batch")
+    async def ocr_recognition_batch(files: List[UploadFile] = File(..., description="图片文件列表"),
+                                    options: OCROptions = Depends(ocr_options)):
+        """批量OCR识别，按完成顺序以NDJSON流式返回"""
+        check_ocr_available()
+        images = await read_uploads(files)
+        return stream_results([asyncio.ensure_future(run_ocr(image, options)) for image in images])
+    
+    @app.post("/detect", response_model=APIResponse)
+    async def object_detection(request: DetectionRequest):
+        """执行目标检测"""
+        check_detection_available()
+        
+        # 解码base64图片
+        try:
+            with stage('base64_decode'):
+                image_data = base64.b64decode(request.image)
+        except Exception:
+            raise HTTPException(status_code=400, detail="图片base64解码失败")
+        
+        return await run_detection(image_data)
+    
+    @app.post("/detect/file", response_model=APIResponse)
+    async def object_detection_file(file: UploadFile = File(..., description="图片文件")):
+        """执行目标检测（multipart/form-data上传图片）"""
+        check_detection_available()
+        return await run_detection(await file.read())
+    
+    @app.post("/detect/raw", response_model=APIResponse)
+    async def object_detection_raw(request: Request):
+        """执行目标检测（请求体为application/octet-stream图片原始字节）"""
+        check_detection_available()
+        image_data = await request.body()
+        if not image_data:
+            raise HTTPException(status_code=400, detail="请求体为空")
+        return await run_detection(image_data)
+    
+    @app.post("/detect/batch")
+    async def object_detection_batch(files: List[UploadFile] = File(..., description="图片文件列表")):
+        """批量目标检测，按完成顺序以NDJSON流式返回"""
+        check_detection_available()
+        images = await read_uploads(files)
+        return stream_results([asyncio.ensure_future(run_detection(image)) for image in images])
+    
     @app.post("/slide-match", response_model=APIResponse)
     async def slide_match(request: SlideMatchRequest):
         """滑块匹配"""
@@ -153,15 +278,19 @@ def create_routes(app: FastAPI, service):
             
             # 解码base64图片
             try:
-                target_data = base64.b64decode(request.target_image)
-                background_data = base64.b64decode(request.background_image)
+                with stage('base64_decode'):
+                    target_data = base64.b64decode(request.target_image)
+                    background_data = base64.b64decode(request.background_image)
             except Exception:
                 raise HTTPException(status_code=400, detail="图片base64解码失败")
             
             # 执行滑块匹配
-            result = service.slide_instance.slide_match(
-                target_data, background_data, simple_target=request.simple_target
-            )
+            with service.lease("slide") as instance:
+                result = await service.scheduler.run(
+                    instance.slide_match,
+                    target_data, background_data, simple_target=request.simple_target,
+                    **slide_options(request)
+                )
             
             response_data = SlideResponse(**result)
             return APIResponse(success=True, message="滑块匹配成功", data=response_data.dict())
@@ -169,6 +298,7 @@ def create_routes(app: FastAPI, service):
         except HTTPException:
             raise
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=f"滑块匹配失败: {str(e)}")
     
     @app.post("/slide-comparison", response_model=APIResponse)
@@ -180,13 +310,17 @@ def create_routes(app: FastAPI, service):
             
             # 解码base64图片
             try:
-                target_data = base64.b64decode(request.target_image)
-                background_data = base64.b64decode(request.background_image)
+                with stage('base64_decode'):
+                    target_data = base64.b64decode(request.target_image)
+                    background_data = base64.b64decode(request.background_image)
             except Exception:
                 raise HTTPException(status_code=400, detail="图片base64解码失败")
             
             # 执行滑块比较
-            result = service.slide_instance.slide_comparison(target_data, background_data)
+            with service.lease("slide") as instance:
+                result = await service.scheduler.run(
+                    instance.slide_comparison, target_data, background_data, **slide_options(request)
+                )
             
             response_data = SlideResponse(**result)
             return APIResponse(success=True, message="滑块比较成功", data=response_data.dict())
@@ -194,6 +328,7 @@ def create_routes(app: FastAPI, service):
         except HTTPException:
             raise
         except Exception as e:
+            mark_request_failed()
             return APIResponse(success=False, message=f"滑块比较失败: {str(e)}")
     
     @app.get("/status", response_model=StatusResponse)
@@ -201,11 +336,23 @@ def create_routes(app: FastAPI, service):
         """获取当前服务状态和已加载的模型信息"""
         return service.get_status()
     
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus文本格式的监控指标（仅当前工作进程）"""
+        return PlainTextResponse(service.metrics.render(service.scheduler),
+                                 media_type="text/plain; version=0.0.4; charset=utf-8")
+    
     @app.get("/health")
     async def health_check():
         """健康检查"""
         return {"status": "healthy", "timestamp": time.time()}
     
+    @app.get("/ready", response_model=ReadinessResponse)
+    async def readiness_check():
+        """就绪检查：启动预加载与预热完成前返回503"""
+        readiness = service.get_readiness()
+        return JSONResponse(status_code=200 if readiness.ready else 503, content=readiness.dict())
+    
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         """全局异常处理"""
@@ -217,3 +364,8 @@ def create_routes(app: FastAPI, service):
                 "detail": traceback.format_exc() if app.debug else None
             }
         )
+
+
+async def _with_index(index: int, task: "asyncio.Future"):
+    """等待任务完成并附带序号"""
+    return index, await task
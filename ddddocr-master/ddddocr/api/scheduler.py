@@ -0,0 +1,301 @@
+# coding=utf-8
+"""
+推理调度模块
+将阻塞的模型推理移出事件循环，并把并发请求合并为微批次执行
+"""
+
+import os
+import time
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..utils.hashable import freeze
+from ..utils.result_cache import ResultCache
+from ..utils.stage_timer import StageTimer, current_timer
+
+
+class _PendingBatch:
+    """等待凑批的请求"""
+
+    __slots__ = ('run_batch', 'items', 'timer')
+
+    def __init__(self, run_batch: Callable[[List[Any]], List[Any]]):
+        self.run_batch = run_batch
+        self.items: List[Tuple[Any, asyncio.Future, Optional[StageTimer], float]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class InferenceScheduler:
+    """
+    推理调度器
+
+    同一模型实例、相同识别参数（OCR还需预处理后的输入尺寸相同）的并发请求会被合并为一个批次，
+    批次达到max_batch_size或最早的请求等待超过max_wait_ms时提交到工作线程池执行，
+    结果按顺序回填到各请求的future中。配置了结果缓存时，命中的请求不再进入队列，
+    相同图片和参数的并发请求只提交一次
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait_ms: float = 2.0,
+                 num_workers: Optional[int] = None, result_cache: Optional[ResultCache] = None):
+        """
+        初始化推理调度器
+
+        Args:
+            max_batch_size: 单个批次的最大图片数，1表示不合并批次
+            max_wait_ms: 批次未满时最早的请求最多等待的毫秒数，0表示不等待
+            num_workers: 推理工作线程数，默认为CPU核数（最多4个）
+            result_cache: 识别结果缓存，None表示不缓存
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size必须大于等于1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms不能为负数")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.num_workers = num_workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self.result_cache = result_cache
+
+        # 统计信息
+        self.batches = 0
+        self.batched_items = 0
+        self.active_batches = 0
+        self.active_items = 0
+        self.last_batch_size = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """推理工作线程池（首次使用时创建）"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.num_workers,
+                                                        thread_name_prefix="ddddocr-infer")
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        在工作线程池中执行阻塞函数（不参与凑批）
+
+        Args:
+            func: 阻塞函数
+            *args: 位置参数
+            **kwargs: 关键字参数
+
+        Returns:
+            函数返回值
+        """
+        loop = asyncio.get_running_loop()
+        # 复制当前上下文，使工作线程中的阶段耗时记录到请求的计时器
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, lambda: context.run(func, *args, **kwargs))
+
+    async def classify(self, instance: Any, image: Any, **params) -> Any:
+        """
+        提交一张图片的OCR识别请求
+
+        Args:
+            instance: DdddOcr实例
+            image: 图片数据
+            **params: classification的其他参数
+
+        Returns:
+            识别结果
+        """
+        # 批次内只有相同尺寸的图片合并推理，按尺寸分批使不同尺寸的批次在各工作线程中并行执行
+        key = ('ocr', instance, freeze(params), instance.ocr_engine.batch_key(image))
+        if self.result_cache is None:
+            return await self.submit(key, lambda images: instance.classification_batch(images, **params), image)
+        # 调度器已持有缓存键，批次内不再经过实例的结果缓存，避免等待自身持有的键
+        return await self.result_cache.get_or_compute_async(
+            instance.ocr_engine.cache_key(image, **params),
+            lambda: self.submit(key, lambda images: instance.classification_batch(images, use_cache=False, **params),
+                                image)
+        )
+
+    async def detect(self, instance: Any, image: Any) -> Any:
+        """
+        提交一张图片的目标检测请求
+
+        Args:
+            instance: DdddOcr实例
+            image: 图片数据
+
+        Returns:
+            边界框列表
+        """
+        if self.result_cache is None:
+            return await self.submit(('detection', instance), instance.detection_batch, image)
+        return await self.result_cache.get_or_compute_async(
+            instance.detection_engine.cache_key(image),
+            lambda: self.submit(('detection', instance),
+                                lambda images: instance.detection_batch(images, use_cache=False), image)
+        )
+
+    async def submit(self, key: Hashable, run_batch: Callable[[List[Any]], List[Any]], item: Any) -> Any:
+        """
+        提交一个请求，等待所在批次执行完成
+
+        Args:
+            key: 批次键，键相同的请求才会合并
+            run_batch: 批量执行函数，接收请求列表并返回等长的结果列表
+            item: 请求数据
+
+        Returns:
+            该请求的结果
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = (item, future, current_timer(), time.perf_counter())
+
+        if self.max_batch_size == 1:
+            self._dispatch(loop, run_batch, [entry])
+            return await future
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingBatch(run_batch)
+        pending.items.append(entry)
+
+        if len(pending.items) >= self.max_batch_size or self.max_wait_ms == 0:
+            self._flush(loop, key)
+        elif pending.timer is None:
+            pending.timer = loop.call_later(self.max_wait_ms / 1000.0, self._flush, loop, key)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, key: Hashable) -> None:
+        """提交指定键下等待中的请求"""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        items = [entry for entry in pending.items if not entry[1].done()]
+        for start in range(0, len(items), self.max_batch_size):
+            self._dispatch(loop, pending.run_batch, items[start:start + self.max_batch_size])
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, run_batch: Callable[[List[Any]], List[Any]],
+                  items: List[Tuple[Any, asyncio.Future, Optional[StageTimer], float]]) -> None:
+        """将一个批次提交到工作线程池，完成后回填结果及各阶段耗时"""
+        if not items:
+            return
+        self.batches += 1
+        self.batched_items += len(items)
+        self.active_batches += 1
+        self.active_items += len(items)
+        self.last_batch_size = len(items)
+
+        batch_timer = StageTimer()
+        task = loop.run_in_executor(self.executor, self._execute, run_batch,
+                                    [entry[0] for entry in items], batch_timer)
+
+        def _complete(done: asyncio.Future) -> None:
+            self.active_batches -= 1
+            self.active_items -= len(items)
+            if done.cancelled():
+                outcomes = [asyncio.CancelledError()] * len(items)
+            elif done.exception() is not None:
+                outcomes = [done.exception()] * len(items)
+            else:
+                outcomes = done.result()
+            for (_, future, timer, submitted), outcome in zip(items, outcomes):
+                if timer is not None:
+                    # 批次内的耗时由批次中的每个请求共同承担
+                    timer.add('queue', max(0.0, batch_timer.start - submitted))
+                    timer.merge(batch_timer)
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+        task.add_done_callback(_complete)
+
+    @staticmethod
+    def _execute(run_batch: Callable[[List[Any]], List[Any]], items: List[Any],
+                 timer: StageTimer) -> List[Any]:
+        """
+        在工作线程中执行批次，各阶段耗时记录到批次计时器
+
+        Args:
+            run_batch: 批量执行函数
+            items: 请求数据列表
+            timer: 批次计时器，开始时间记为批次实际开始执行的时刻
+
+        Returns:
+            与请求等长的结果列表，失败的位置为异常对象
+        """
+        timer.start = time.perf_counter()
+        with timer.activate():
+            return InferenceScheduler._execute_batch(run_batch, items)
+
+    @staticmethod
+    def _execute_batch(run_batch: Callable[[List[Any]], List[Any]], items: List[Any]) -> List[Any]:
+        """
+        执行批次
+
+        整批失败时逐个重试，使单张异常图片只影响自身请求
+
+        Returns:
+            与请求等长的结果列表，失败的位置为异常对象
+        """
+        try:
+            results = run_batch(items)
+            if len(results) == len(items):
+                return list(results)
+        except Exception:
+            if len(items) == 1:
+                raise
+
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append(run_batch([item])[0])
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取调度统计信息
+
+        Returns:
+            统计信息字典
+        """
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'num_workers': self.num_workers,
+            'pending': sum(len(p.items) for p in self._pending.values()),
+            'active_batches': self.active_batches,
+            'active_items': self.active_items,
+            'last_batch_size': self.last_batch_size,
+            'batches': self.batches,
+            'batched_items': self.batched_items,
+            'average_batch_size': self.batched_items / self.batches if self.batches else 0.0
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        关闭工作线程池
+
+        Args:
+            wait: 是否等待执行中的批次完成
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def __repr__(self) -> str:
+        return (f"InferenceScheduler(max_batch_size={self.max_batch_size}, "
+                f"max_wait_ms={self.max_wait_ms}, num_workers={self.num_workers})")
@@ -3,48 +3,152 @@
 FastAPI服务器实现
 """
 
+import io
 import time
 import base64
+import asyncio
+import functools
+import threading
 import traceback
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import numpy as np
+from PIL import Image
 
 from .models import *
 from .routes import create_routes
 from .mcp import MCPHandler
+from .scheduler import InferenceScheduler
+from .model_slot import ModelSlot
+from .metrics import MetricsRegistry, MetricsMiddleware
+from .prefork import PreforkServer, supports_prefork
+from ..models.session_registry import session_registry
+from ..utils.result_cache import ResultCache
 
 
 class DDDDOCRService:
     """DDDDOCR服务管理类"""
     
+    # 替换模型后等待旧实例上请求完成的最长秒数，超时后旧实例在最后一个请求结束时由垃圾回收释放
+    DRAIN_TIMEOUT = 60.0
+    
     def __init__(self):
-        self.ocr_instance = None
-        self.det_instance = None
-        self.slide_instance = None
+        # 各功能的模型实例槽位：请求租用当前实例，模型变更时原子替换
+        self.slots: Dict[str, ModelSlot] = {name: ModelSlot(name) for name in ("ocr", "detection", "slide")}
         self.enabled_features = set()
         self.start_time = time.time()
         self.version = "1.6.0"
+        # 服务默认的推理会话配置（可由命令行或配置文件指定）
+        self.default_session_config: Optional[Dict[str, Any]] = None
+        # 服务默认的模型精度（fp32或int8）
+        self.default_precision = "fp32"
+        # OCR默认是否使用OpenCV快速预处理路径
+        self.default_fast_preprocess = False
+        # 推理调度器：在工作线程中执行推理并合并并发请求
+        self.scheduler = InferenceScheduler()
+        # 请求计数与分阶段耗时指标
+        self.metrics = MetricsRegistry()
+        # 启动时预加载的模型（InitializeRequest字段）与预热配置
+        self.preload_config: Optional[Dict[str, Any]] = None
+        self.warmup_config: Optional[Dict[str, Any]] = None
+        # 启动阶段: starting、loading、warming、ready、failed
+        self.stage = "starting"
+        self.warmup_seconds: Optional[float] = None
+        self.startup_error: Optional[str] = None
+        # 模型加载线程：初始化、切换模型及启动预热在此执行，不占用推理工作线程
+        self._loader: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def ocr_instance(self):
+        """当前OCR实例"""
+        return self.slots["ocr"].instance
+    
+    @property
+    def det_instance(self):
+        """当前目标检测实例"""
+        return self.slots["detection"].instance
+    
+    @property
+    def slide_instance(self):
+        """当前滑块实例"""
+        return self.slots["slide"].instance
+    
+    def lease(self, name: str):
+        """
+        租用指定功能的当前模型实例，租用期间该实例不会因模型替换而被释放
+        
+        Args:
+            name: 功能名称: 'ocr', 'detection', 'slide'
+            
+        Returns:
+            上下文管理器，进入时返回实例（未加载时为None）
+        """
+        return self.slots[name].lease()
     
-    def initialize(self, config: InitializeRequest) -> Dict[str, Any]:
-        """初始化服务"""
+    async def run_loader(self, func, *args, **kwargs) -> Any:
+        """
+        在模型加载线程中执行函数，模型变更按提交顺序依次执行
+        
+        Args:
+            func: 阻塞函数
+            *args: 位置参数
+            **kwargs: 关键字参数
+            
+        Returns:
+            函数返回值
+        """
+        if self._loader is None:
+            self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ddddocr-loader")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._loader, functools.partial(func, *args, **kwargs))
+    
+    def shutdown_loader(self) -> None:
+        """关闭模型加载线程"""
+        if self._loader is not None:
+            self._loader.shutdown(wait=False)
+            self._loader = None
+    
+    def _resolve_session_config(self, config: Optional[SessionConfigModel]) -> Optional[Dict[str, Any]]:
+        """合并请求中的会话配置与服务默认配置"""
+        merged = dict(self.default_session_config or {})
+        if config is not None:
+            merged.update({k: v for k, v in config.dict().items() if v is not None})
+        return merged or None
+    
+    def initialize(self, config: InitializeRequest, warmup: bool = True) -> Dict[str, Any]:
+        """
+        初始化服务
+        
+        新实例构建并预热完成后才替换当前实例，替换前后的请求均不受影响；
+        旧实例在其上的请求全部完成后释放
+        
+        Args:
+            config: 初始化配置
+            warmup: 替换前是否按预热配置预热新实例
+        """
         try:
             # 动态导入ddddocr以避免循环导入
             import ddddocr
             
-            # 清理现有实例
-            self.ocr_instance = None
-            self.det_instance = None
-            self.slide_instance = None
-            self.enabled_features.clear()
+            session_config = self._resolve_session_config(config.session_config)
+            precision = config.precision or self.default_precision
+            fast_preprocess = (self.default_fast_preprocess if config.fast_preprocess is None
+                               else config.fast_preprocess)
+            
+            # 先构建新实例再替换旧实例，相同模型的推理会话可直接复用
+            ocr_instance = None
+            det_instance = None
+            enabled_features = set()
             
             # 根据配置初始化实例
             if config.ocr:
-                self.ocr_instance = ddddocr.DdddOcr(
+                ocr_instance = ddddocr.DdddOcr(
                     ocr=True, 
                     det=False,
                     old=config.old,
@@ -53,23 +157,34 @@ class DDDDOCRService:
                     device_id=config.device_id,
                     show_ad=False,
                     import_onnx_path=config.import_onnx_path,
-                    charsets_path=config.charsets_path
+                    charsets_path=config.charsets_path,
+                    session_config=session_config,
+                    precision=precision,
+                    fast_preprocess=fast_preprocess
                 )
-                self.enabled_features.add("ocr")
+                enabled_features.add("ocr")
             
             if config.det:
-                self.det_instance = ddddocr.DdddOcr(
+                det_instance = ddddocr.DdddOcr(
                     ocr=False,
                     det=True,
                     use_gpu=config.use_gpu,
                     device_id=config.device_id,
-                    show_ad=False
+                    show_ad=False,
+                    session_config=session_config,
+                    precision=precision
                 )
-                self.enabled_features.add("detection")
+                enabled_features.add("detection")
             
             # 滑块功能总是可用
-            self.slide_instance = ddddocr.DdddOcr(ocr=False, det=False, show_ad=False)
-            self.enabled_features.add("slide")
+            slide_instance = ddddocr.DdddOcr(ocr=False, det=False, show_ad=False)
+            enabled_features.add("slide")
+            
+            if warmup:
+                self._warmup_new(ocr_instance, det_instance)
+            
+            self._install({"ocr": ocr_instance, "detection": det_instance, "slide": slide_instance})
+            self.enabled_features = enabled_features
             
             return {
                 "loaded_models": list(self.enabled_features),
@@ -80,37 +195,53 @@ class DDDDOCRService:
             raise HTTPException(status_code=500, detail=f"初始化失败: {str(e)}")
     
     def switch_model(self, config: SwitchModelRequest) -> Dict[str, Any]:
-        """切换模型"""
+        """切换模型（新模型加载并预热完成后原子替换，旧模型在其上的请求完成后释放）"""
         try:
             import ddddocr
             
+            session_config = self._resolve_session_config(config.session_config)
+            precision = config.precision or self.default_precision
+            fast_preprocess = (self.default_fast_preprocess if config.fast_preprocess is None
+                               else config.fast_preprocess)
+            
             if config.model_type == "ocr":
-                self.ocr_instance = ddddocr.DdddOcr(
+                slot, instance = "ocr", ddddocr.DdddOcr(
                     ocr=True, det=False, old=False, beta=False,
-                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False
+                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False,
+                    session_config=session_config,
+                    precision=precision, fast_preprocess=fast_preprocess
                 )
-                self.enabled_features.add("ocr")
             elif config.model_type == "ocr_old":
-                self.ocr_instance = ddddocr.DdddOcr(
+                slot, instance = "ocr", ddddocr.DdddOcr(
                     ocr=True, det=False, old=True, beta=False,
-                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False
+                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False,
+                    session_config=session_config,
+                    precision=precision, fast_preprocess=fast_preprocess
                 )
-                self.enabled_features.add("ocr")
             elif config.model_type == "ocr_beta":
-                self.ocr_instance = ddddocr.DdddOcr(
+                slot, instance = "ocr", ddddocr.DdddOcr(
                     ocr=True, det=False, old=False, beta=True,
-                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False
+                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False,
+                    session_config=session_config,
+                    precision=precision, fast_preprocess=fast_preprocess
                 )
-                self.enabled_features.add("ocr")
             elif config.model_type == "det":
-                self.det_instance = ddddocr.DdddOcr(
+                slot, instance = "detection", ddddocr.DdddOcr(
                     ocr=False, det=True,
-                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False
+                    use_gpu=config.use_gpu, device_id=config.device_id, show_ad=False,
+                    session_config=session_config,
+                    precision=precision
                 )
-                self.enabled_features.add("detection")
             else:
                 raise ValueError(f"不支持的模型类型: {config.model_type}")
             
+            if slot == "ocr":
+                self._warmup_new(instance, None)
+            else:
+                self._warmup_new(None, instance)
+            self._install({slot: instance})
+            self.enabled_features.add(slot)
+            
             return {
                 "model_type": config.model_type,
                 "message": f"模型 {config.model_type} 切换成功"
@@ -119,6 +250,33 @@ class DDDDOCRService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"模型切换失败: {str(e)}")
     
+    def _warmup_new(self, ocr_instance, det_instance) -> None:
+        """按预热配置预热尚未投入使用的新实例"""
+        config = WarmupConfig(**(self.warmup_config or {}))
+        if config.enabled and (ocr_instance or det_instance):
+            self._warmup_instances(config, ocr_instance, det_instance)
+    
+    def _install(self, instances: Dict[str, Any]) -> None:
+        """
+        原子替换各槽位的实例，并在后台等待旧实例上的请求完成后释放
+        
+        Args:
+            instances: 槽位名称到新实例的映射
+        """
+        for name, instance in instances.items():
+            slot = self.slots[name]
+            old = slot.swap(instance)
+            if old is not None and old is not instance:
+                threading.Thread(target=self._retire, args=(slot, old),
+                                 name=f"ddddocr-retire-{name}", daemon=True).start()
+    
+    def _retire(self, slot: ModelSlot, instance: Any) -> None:
+        """等待旧实例上的请求全部完成后释放其推理会话"""
+        if slot.drain(instance, self.DRAIN_TIMEOUT):
+            instance.cleanup()
+        else:
+            print(f"警告: 旧的 {slot.name} 模型在 {self.DRAIN_TIMEOUT} 秒内仍有请求未完成，将在请求结束后释放")
+    
     def toggle_feature(self, config: ToggleFeatureRequest) -> Dict[str, Any]:
         """开启/关闭功能"""
         if config.enabled:
@@ -134,8 +292,51 @@ class DDDDOCRService:
             "message": message
         }
     
-    def get_status(self) -> StatusResponse:
-        """获取服务状态"""
+    def prepare(self) -> None:
+        """执行启动时的模型预加载与预热，完成后标记为就绪"""
+        try:
+            if self.preload_config and not (self.ocr_instance or self.det_instance):
+                self.stage = "loading"
+                self.initialize(InitializeRequest(**self.preload_config), warmup=False)
+            
+            warmup = WarmupConfig(**(self.warmup_config or {}))
+            if warmup.enabled and (self.ocr_instance or self.det_instance):
+                self.stage = "warming"
+                start = time.time()
+                self.warmup(warmup)
+                self.warmup_seconds = time.time() - start
+                print(f"预热完成，耗时 {self.warmup_seconds:.2f} 秒")
+            
+            self.stage = "ready"
+        except Exception as e:
+            self.stage = "failed"
+            self.startup_error = getattr(e, "detail", None) or str(e)
+            print(f"启动预加载失败: {self.startup_error}")
+    
+    def warmup(self, config: WarmupConfig) -> None:
+        """
+        使用合成图片在常见输入形状和批次大小上执行推理，
+        提前完成推理会话创建、图优化和首次运行的内存分配
+        """
+        self._warmup_instances(config, self.ocr_instance, self.det_instance)
+    
+    def _warmup_instances(self, config: WarmupConfig, ocr_instance, det_instance) -> None:
+        """预热指定的OCR与目标检测实例"""
+        batch_sizes = config.batch_sizes or sorted({1, self.scheduler.max_batch_size})
+        ocr_images = [_synthetic_image(width, height) for width, height in config.ocr_sizes]
+        det_images = [_synthetic_image(width, height) for width, height in config.det_sizes]
+        
+        for _ in range(config.iterations):
+            for batch_size in batch_sizes:
+                if ocr_instance:
+                    for image in ocr_images:
+                        ocr_instance.classification_batch([image] * batch_size)
+                if det_instance:
+                    for image in det_images:
+                        det_instance.detection_batch([image] * batch_size)
+    
+    def _loaded_models(self) -> List[str]:
+        """已加载的模型列表"""
         loaded_models = []
         if self.ocr_instance:
             loaded_models.append("ocr")
@@ -143,16 +344,38 @@ class DDDDOCRService:
             loaded_models.append("detection")
         if self.slide_instance:
             loaded_models.append("slide")
-        
+        return loaded_models
+    
+    def get_readiness(self) -> ReadinessResponse:
+        """获取就绪状态"""
+        return ReadinessResponse(
+            ready=self.stage == "ready",
+            stage=self.stage,
+            loaded_models=self._loaded_models(),
+            warmup_seconds=self.warmup_seconds,
+            error=self.startup_error
+        )
+    
+    def get_status(self) -> StatusResponse:
+        """获取服务状态"""
         return StatusResponse(
             service_status="running",
-            loaded_models=loaded_models,
+            loaded_models=self._loaded_models(),
             enabled_features=list(self.enabled_features),
             version=self.version,
-            uptime=time.time() - self.start_time
+            uptime=time.time() - self.start_time,
+            result_cache=self.scheduler.result_cache.stats() if self.scheduler.result_cache is not None else None
         )
 
 
+def _synthetic_image(width: int, height: int) -> bytes:
+    """生成用于预热的PNG图片"""
+    pixels = np.random.RandomState(width * 10007 + height).randint(0, 256, (height, width, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
 # 全局服务实例
 service = DDDDOCRService()
 
@@ -160,11 +383,15 @@ service = DDDDOCRService()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
-    # 启动时初始化
+    # 启动时初始化：在后台预加载并预热模型，期间 /health 可用而 /ready 返回503
     print("DDDDOCR API服务启动中...")
+    prepare_task = asyncio.ensure_future(service.run_loader(service.prepare))
     yield
     # 关闭时清理
     print("DDDDOCR API服务关闭中...")
+    prepare_task.cancel()
+    service.scheduler.shutdown(wait=False)
+    service.shutdown_loader()
 
 
 def create_app() -> FastAPI:
@@ -187,6 +414,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # 添加指标中间件（记录请求耗时并返回Server-Timing响应头）
+    app.add_middleware(MetricsMiddleware, registry=service.metrics)
+    
     # 添加路由
     create_routes(app, service)
     
@@ -197,10 +427,69 @@ def create_app() -> FastAPI:
     return app
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000, **kwargs):
-    """运行服务器"""
+def run_server(host: str = "0.0.0.0", port: int = 8000,
+               session_config: Optional[Dict[str, Any]] = None,
+               max_batch_size: int = 8, max_wait_ms: float = 2.0,
+               inference_workers: Optional[int] = None, cache_size: int = 0,
+               cache_ttl: float = 300.0, cache_memory_mb: float = 64.0,
+               workers: int = 1, preload: Optional[Dict[str, Any]] = None,
+               warmup: Optional[Dict[str, Any]] = None, cpu_affinity: bool = False,
+               precision: str = "fp32", fast_preprocess: bool = False, **kwargs):
+    """
+    运行服务器
+
+    Args:
+        host: 监听地址
+        port: 监听端口
+        session_config: 默认推理会话配置
+        max_batch_size: 微批次最大图片数，1表示不合并请求
+        max_wait_ms: 凑批最长等待时间（毫秒）
+        inference_workers: 推理工作线程数，默认为CPU核数（最多4个）
+        cache_size: 结果缓存最大条目数，0表示不启用缓存
+        cache_ttl: 缓存条目有效期（秒），0表示不过期
+        cache_memory_mb: 结果缓存内存上限（MB）
+        workers: 工作进程数，大于1时以预派生多进程模式运行
+        preload: 启动时加载的模型配置（InitializeRequest字段），多进程模式下在主进程中加载后派生
+        warmup: 预热配置（WarmupConfig字段），预热完成前 /ready 返回503
+        cpu_affinity: 多进程模式下是否将每个工作进程绑定到一个CPU核心
+        precision: 默认模型精度，'fp32'或'int8'（动态量化模型），可被初始化请求覆盖
+        fast_preprocess: OCR默认是否使用OpenCV快速预处理路径，可被初始化请求覆盖
+        **kwargs: 传递给uvicorn的其他参数
+    """
+    if cpu_affinity and workers > 1 and not (session_config or {}).get("intra_op_num_threads"):
+        # 每个进程只占用一个核心时，推理线程数默认为1以避免线程争抢
+        session_config = dict(session_config or {}, intra_op_num_threads=1)
+    
+    service.default_session_config = session_config
+    service.default_precision = precision
+    service.default_fast_preprocess = fast_preprocess
+    service.preload_config = preload
+    service.warmup_config = warmup
+    result_cache = ResultCache(cache_size, cache_memory_mb, cache_ttl) if cache_size > 0 else None
+    service.scheduler = InferenceScheduler(max_batch_size, max_wait_ms, inference_workers, result_cache)
     app = create_app()
+    
+    def preload_models():
+        # 推理会话不能跨fork使用，预热在各工作进程启动后进行
+        result = service.initialize(InitializeRequest(**preload), warmup=False)
+        print(f"已预加载模型: {result['loaded_models']}")
+        # 权重在主进程中读入一次，各工作进程创建的会话写时复制共享这份内存
+        shared = session_registry.share_weights()
+        print(f"已共享模型权重: {shared / 1024 / 1024:.1f}MB")
+    
     print(f"DDDDOCR API服务启动在 http://{host}:{port}")
     print(f"API文档地址: http://{host}:{port}/docs")
     print(f"MCP协议地址: http://{host}:{port}/mcp")
+    print(f"监控指标地址: http://{host}:{port}/metrics")
+    
+    if workers > 1 and not kwargs.get("reload"):
+        if supports_prefork():
+            if not preload:
+                print("警告: 多进程模式下 /initialize 只作用于处理该请求的工作进程，建议通过 preload 在启动时加载模型")
+            # 主进程加载模型后派生，各工作进程启动时只需预热
+            PreforkServer(app, host, port, workers, preload=preload_models if preload else None,
+                          cpu_affinity=cpu_affinity, **kwargs).run()
+            return
+        print("警告: 当前平台不支持预派生多进程模式，将以单进程运行")
+    
     uvicorn.run(app, host=host, port=port, **kwargs)
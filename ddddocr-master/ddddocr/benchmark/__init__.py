@@ -0,0 +1,13 @@
+# coding=utf-8
+"""
+ddddocr性能测试模块
+提供合成测试图片、HTTP API压测工具、引擎微基准测试和量化模型评估
+"""
+
+from .images import captcha_image, captcha_images, detection_image, slide_images, slide_comparison_images
+from .api_bench import ApiBenchmark, ENDPOINTS
+from .engine_bench import EngineBenchmark
+from .quant_report import QuantizationReport
+
+__all__ = ['captcha_image', 'captcha_images', 'detection_image', 'slide_images', 'slide_comparison_images',
+           'ApiBenchmark', 'ENDPOINTS', 'EngineBenchmark', 'QuantizationReport']
@@ -0,0 +1,380 @@
+# coding=utf-8
+"""
+HTTP API压测工具
+使用本地生成的合成图片在不同并发数下压测OCR、目标检测及批量接口，统计吞吐量、延迟分位数和错误率
+"""
+
+import json
+import time
+import uuid
+import base64
+import threading
+import http.client
+from urllib.parse import urlsplit
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .images import captcha_images, detection_image
+from .report import format_table
+
+# 接口名称 -> (请求路径, 所需模型, 请求体类型)
+ENDPOINTS: Dict[str, Tuple[str, str, str]] = {
+    'ocr': ('/ocr', 'ocr', 'json'),
+    'ocr_raw': ('/ocr/raw', 'ocr', 'raw'),
+    'ocr_batch': ('/ocr/batch', 'ocr', 'multipart'),
+    'detect': ('/detect', 'detection', 'json'),
+    'detect_raw': ('/detect/raw', 'detection', 'raw'),
+    'detect_batch': ('/detect/batch', 'detection', 'multipart'),
+}
+
+
+def _percentiles(latencies: List[float]) -> Dict[str, float]:
+    """计算延迟统计（毫秒）"""
+    if not latencies:
+        return {'min': 0.0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    values = np.asarray(latencies) * 1000.0
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        'min': round(float(values.min()), 3),
+        'mean': round(float(values.mean()), 3),
+        'p50': round(float(p50), 3),
+        'p95': round(float(p95), 3),
+        'p99': round(float(p99), 3),
+        'max': round(float(values.max()), 3)
+    }
+
+
+class _Request:
+    """预先构建好的请求"""
+
+    __slots__ = ('path', 'body', 'headers', 'images', 'streaming')
+
+    def __init__(self, path: str, body: bytes, headers: Dict[str, str], images: int = 1,
+                 streaming: bool = False):
+        self.path = path
+        self.body = body
+        self.headers = headers
+        self.images = images
+        # 批量接口以NDJSON逐行返回每张图片的结果
+        self.streaming = streaming
+
+
+class ApiBenchmark:
+    """
+    HTTP API压测
+
+    每个并发级别启动对应数量的线程，各线程通过长连接循环发送预先构建的请求，
+    请求体的构建不计入延迟。HTTP状态码非2xx、响应success为False或批量结果数量不符均记为错误
+    """
+
+    def __init__(self, base_url: str = 'http://127.0.0.1:8000',
+                 endpoints: Sequence[str] = ('ocr', 'detect'),
+                 concurrency: Sequence[int] = (1, 4, 16),
+                 requests: int = 200, duration: Optional[float] = None,
+                 warmup: int = 10, batch_size: int = 8, timeout: float = 30.0,
+                 image_count: int = 32, seed: int = 0):
+        """
+        初始化压测
+
+        Args:
+            base_url: 服务地址
+            endpoints: 压测的接口名称，见ENDPOINTS
+            concurrency: 并发数列表，每个接口在各并发数下分别压测
+            requests: 每个并发级别发送的请求数（指定duration时忽略）
+            duration: 每个并发级别的压测秒数
+            warmup: 每个接口正式压测前发送的预热请求数（不计入结果）
+            batch_size: 批量接口每个请求包含的图片数
+            timeout: 单个请求的超时秒数
+            image_count: 生成的合成图片数量
+            seed: 图片随机种子
+        """
+        unknown = [name for name in endpoints if name not in ENDPOINTS]
+        if unknown:
+            raise ValueError(f"不支持的接口: {', '.join(unknown)}，可选: {', '.join(ENDPOINTS)}")
+        if not concurrency or min(concurrency) < 1:
+            raise ValueError("并发数必须大于等于1")
+        if duration is None and requests < 1:
+            raise ValueError("requests必须大于等于1")
+        if batch_size < 1:
+            raise ValueError("batch_size必须大于等于1")
+
+        parts = urlsplit(base_url if '://' in base_url else f'http://{base_url}')
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"不支持的协议: {parts.scheme}")
+        self.base_url = f"{parts.scheme}://{parts.netloc}"
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip('/')
+
+        self.endpoints = list(endpoints)
+        self.concurrency = list(concurrency)
+        self.requests = requests
+        self.duration = duration
+        self.warmup = warmup
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.image_count = max(1, image_count)
+        self.seed = seed
+
+        self._ocr_images = captcha_images(self.image_count, seed=seed)
+        self._det_images = [detection_image(seed=seed + i) for i in range(min(self.image_count, 8))]
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """创建到服务的连接"""
+        if self._scheme == 'https':
+            return http.client.HTTPSConnection(self._netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self._netloc, timeout=self.timeout)
+
+    def _call(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """发送一次JSON请求并返回(状态码, 解析后的响应)"""
+        connection = self._connection()
+        try:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            connection.request(method, self._prefix + path, body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+            try:
+                return response.status, json.loads(data)
+            except ValueError:
+                return response.status, data.decode('utf-8', 'replace')
+        finally:
+            connection.close()
+
+    def initialize(self, ocr: bool = True, det: bool = True) -> Dict[str, Any]:
+        """
+        调用 /initialize 加载压测所需的模型
+
+        Args:
+            ocr: 是否加载OCR模型
+            det: 是否加载目标检测模型
+
+        Returns:
+            接口响应
+        """
+        status, result = self._call('POST', '/initialize', {'ocr': ocr, 'det': det})
+        if status != 200 or not isinstance(result, dict) or not result.get('success'):
+            raise RuntimeError(f"初始化失败: HTTP {status} {result}")
+        return result
+
+    def loaded_models(self) -> List[str]:
+        """查询服务已加载的模型"""
+        status, result = self._call('GET', '/status')
+        if status != 200 or not isinstance(result, dict):
+            raise RuntimeError(f"无法获取服务状态: HTTP {status} {result}")
+        return list(result.get('loaded_models') or [])
+
+    def _build_requests(self, name: str) -> List[_Request]:
+        """预先构建接口的请求列表，压测时循环使用"""
+        path, model, body_type = ENDPOINTS[name]
+        images = self._ocr_images if model == 'ocr' else self._det_images
+        path = self._prefix + path
+
+        built = []
+        for index in range(len(images)):
+            if body_type == 'json':
+                body = json.dumps({'image': base64.b64encode(images[index]).decode('ascii')}).encode('utf-8')
+                built.append(_Request(path, body, {'Content-Type': 'application/json'}))
+            elif body_type == 'raw':
+                built.append(_Request(path, images[index], {'Content-Type': 'application/octet-stream'}))
+            else:
+                files = [images[(index + i) % len(images)] for i in range(self.batch_size)]
+                body, content_type = self._multipart(files)
+                built.append(_Request(path, body, {'Content-Type': content_type}, len(files), streaming=True))
+        return built
+
+    @staticmethod
+    def _multipart(files: List[bytes]) -> Tuple[bytes, str]:
+        """构建multipart/form-data请求体"""
+        boundary = uuid.uuid4().hex
+        parts = []
+        for index, data in enumerate(files):
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="files"; '
+                         f'filename="{index}.png"\r\nContent-Type: image/png\r\n\r\n'.encode('ascii'))
+            parts.append(data)
+            parts.append(b'\r\n')
+        parts.append(f'--{boundary}--\r\n'.encode('ascii'))
+        return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+    @staticmethod
+    def _check(status: int, data: bytes, request: _Request) -> Optional[str]:
+        """
+        检查响应
+
+        Returns:
+            错误类型，成功时返回None
+        """
+        if not 200 <= status < 300:
+            return f"HTTP {status}"
+        try:
+            if request.streaming:
+                lines = [json.loads(line) for line in data.splitlines() if line.strip()]
+                if len(lines) != request.images:
+                    return "incomplete"
+                return None if all(line.get('success') for line in lines) else "success=false"
+            return None if json.loads(data).get('success') else "success=false"
+        except ValueError:
+            return "invalid_response"
+
+    def _worker(self, requests: List[_Request], offset: int, should_continue: Callable[[], bool],
+                latencies: List[float], errors: Dict[str, int], counters: List[int],
+                lock: threading.Lock) -> None:
+        """压测线程：复用一个连接循环发送请求"""
+        connection = None
+        index = offset
+        while should_continue():
+            request = requests[index % len(requests)]
+            index += 1
+            error = None
+            start = time.perf_counter()
+            try:
+                if connection is None:
+                    connection = self._connection()
+                connection.request('POST', request.path, body=request.body, headers=request.headers)
+                response = connection.getresponse()
+                data = response.read()
+                error = self._check(response.status, data, request)
+                if response.getheader('connection', '').lower() == 'close':
+                    connection.close()
+                    connection = None
+            except Exception as e:
+                error = type(e).__name__
+                if connection is not None:
+                    connection.close()
+                connection = None
+            elapsed = time.perf_counter() - start
+
+            with lock:
+                latencies.append(elapsed)
+                if error is None:
+                    counters[0] += request.images
+                else:
+                    errors[error] = errors.get(error, 0) + 1
+
+        if connection is not None:
+            connection.close()
+
+    def run_level(self, name: str, concurrency: int, requests: Optional[List[_Request]] = None) -> Dict[str, Any]:
+        """
+        以指定并发数压测一个接口
+
+        Args:
+            name: 接口名称
+            concurrency: 并发数
+            requests: 预先构建的请求，None表示现场构建
+
+        Returns:
+            该级别的统计结果
+        """
+        return self._measure(name, concurrency, requests or self._build_requests(name),
+                             self.requests, self.duration)
+
+    def _measure(self, name: str, concurrency: int, requests: List[_Request],
+                 count: int, duration: Optional[float]) -> Dict[str, Any]:
+        """发送count个请求（或持续duration秒）并统计结果"""
+        latencies: List[float] = []
+        errors: Dict[str, int] = {}
+        counters = [0]
+        lock = threading.Lock()
+
+        if duration is not None:
+            deadline = time.perf_counter() + duration
+
+            def should_continue() -> bool:
+                return time.perf_counter() < deadline
+        else:
+            remaining = [count]
+
+            def should_continue() -> bool:
+                with lock:
+                    if remaining[0] <= 0:
+                        return False
+                    remaining[0] -= 1
+                    return True
+
+        threads = [threading.Thread(target=self._worker, name=f"bench-{name}-{i}",
+                                    args=(requests, i, should_continue, latencies, errors, counters, lock),
+                                    daemon=True)
+                   for i in range(concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        total = len(latencies)
+        failed = sum(errors.values())
+        return {
+            'endpoint': name,
+            'path': ENDPOINTS[name][0],
+            'concurrency': concurrency,
+            'requests': total,
+            'errors': failed,
+            'error_rate': round(failed / total, 6) if total else 0.0,
+            'error_types': errors,
+            'images': counters[0],
+            'elapsed_seconds': round(elapsed, 3),
+            'requests_per_second': round(total / elapsed, 2) if elapsed > 0 else 0.0,
+            'images_per_second': round(counters[0] / elapsed, 2) if elapsed > 0 else 0.0,
+            'latency_ms': _percentiles(latencies)
+        }
+
+    def run(self, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        按接口和并发数依次压测
+
+        Args:
+            progress: 每完成一个级别时调用的回调，参数为该级别的结果
+
+        Returns:
+            压测报告，包含配置和各级别结果
+        """
+        results = []
+        for name in self.endpoints:
+            requests = self._build_requests(name)
+            if self.warmup > 0:
+                self._measure(name, 1, requests, self.warmup, None)
+            for concurrency in self.concurrency:
+                result = self.run_level(name, concurrency, requests)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+
+        return {
+            'base_url': self.base_url,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'config': {
+                'endpoints': self.endpoints,
+                'concurrency': self.concurrency,
+                'requests': None if self.duration is not None else self.requests,
+                'duration': self.duration,
+                'warmup': self.warmup,
+                'batch_size': self.batch_size,
+                'image_count': self.image_count,
+                'seed': self.seed
+            },
+            'results': results
+        }
+
+    @staticmethod
+    def format_table(results: List[Dict[str, Any]]) -> str:
+        """
+        将压测结果格式化为文本表格
+
+        Args:
+            results: run返回的报告中的results
+
+        Returns:
+            表格文本
+        """
+        header = ('接口', '并发', '请求数', '错误率', '请求/秒', '图片/秒', 'p50(ms)', 'p95(ms)', 'p99(ms)')
+        rows = []
+        for r in results:
+            latency = r['latency_ms']
+            rows.append((r['endpoint'], str(r['concurrency']), str(r['requests']),
+                         f"{r['error_rate'] * 100:.2f}%", f"{r['requests_per_second']:.1f}",
+                         f"{r['images_per_second']:.1f}", f"{latency['p50']:.2f}",
+                         f"{latency['p95']:.2f}", f"{latency['p99']:.2f}"))
+        return format_table(header, rows)
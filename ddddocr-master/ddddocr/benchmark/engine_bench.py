@@ -0,0 +1,284 @@
+# coding=utf-8
+"""
+引擎微基准测试
+使用固定随机种子生成的本地图片测量OCR、目标检测、滑块、颜色过滤及CTC解码热点路径的耗时，
+结果保存为JSON，并可与基线结果比较以发现性能回退
+"""
+
+import gc
+import io
+import os
+import time
+import platform
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .images import captcha_image, detection_image, slide_images, slide_comparison_images
+from .report import format_table
+from ..core.ocr_engine import OCREngine
+from ..core.detection_engine import DetectionEngine
+from ..core.slide_engine import SlideEngine
+from ..models.model_loader import ModelLoader
+from ..models.charset_resource import load_builtin_charset
+from ..preprocessing.color_filter import ColorFilter
+from ..utils.exceptions import ModelLoadError
+
+# OCR基准测试使用的图片宽度
+OCR_WIDTHS = (100, 200, 400)
+
+
+class _StandInDetectionEngine(DetectionEngine):
+    """加载指定模型文件的检测引擎（用于替身模型）"""
+
+    def __init__(self, model_path: str, **kwargs):
+        self._model_path = model_path
+        super().__init__(**kwargs)
+
+    def initialize(self, **kwargs) -> None:
+        self._acquire_session(self._model_path)
+        self.is_initialized = True
+
+
+def _environment() -> Dict[str, Any]:
+    """记录运行环境，比较结果时用于判断是否可比"""
+    import onnxruntime
+    try:
+        import cv2
+        opencv_version = cv2.__version__
+    except ImportError:
+        opencv_version = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'onnxruntime': onnxruntime.__version__,
+        'opencv': opencv_version,
+        'pillow': Image.__version__
+    }
+
+
+class EngineBenchmark:
+    """
+    引擎微基准测试
+
+    每个用例先执行warmup次预热，再计时执行repeat次（计时期间暂停垃圾回收），
+    以中位数作为比较基准。内置模型权重不存在时自动使用形状一致的替身模型
+    """
+
+    def __init__(self, repeat: int = 30, warmup: int = 3, stand_in: Optional[bool] = None,
+                 filters: Optional[Sequence[str]] = None,
+                 session_config: Optional[Dict[str, Any]] = None):
+        """
+        初始化基准测试
+
+        Args:
+            repeat: 每个用例的计时次数
+            warmup: 每个用例的预热次数
+            stand_in: True强制使用替身模型，False要求内置模型，None表示内置模型不存在时使用替身模型
+            filters: 只运行名称包含其中任一字符串的用例，None表示全部运行
+            session_config: 推理会话配置
+        """
+        if repeat < 1:
+            raise ValueError("repeat必须大于等于1")
+        if warmup < 0:
+            raise ValueError("warmup不能为负数")
+
+        self.repeat = repeat
+        self.warmup = warmup
+        self.stand_in = stand_in
+        self.filters = [f for f in (filters or []) if f]
+        self.session_config = session_config
+
+    def _create_engines(self, workdir: str) -> Tuple[OCREngine, DetectionEngine, str]:
+        """创建OCR与检测引擎，返回(OCR引擎, 检测引擎, 模型类型)"""
+        loader = ModelLoader()
+        real = os.path.exists(loader.get_ocr_model_path()) and os.path.exists(loader.get_detection_model_path())
+        use_stand_in = (not real) if self.stand_in is None else self.stand_in
+        if not use_stand_in and not real:
+            raise ModelLoadError("内置模型文件不存在，请使用替身模型")
+
+        if use_stand_in:
+            from .stand_in import build_stand_in_models
+            paths = build_stand_in_models(workdir, load_builtin_charset('old').chars)
+            ocr = OCREngine(import_onnx_path=paths['ocr'], charsets_path=paths['charsets'],
+                            session_config=self.session_config)
+            detection = _StandInDetectionEngine(paths['detection'], session_config=self.session_config)
+            return ocr, detection, 'stand-in'
+
+        ocr = OCREngine(session_config=self.session_config)
+        detection = DetectionEngine(session_config=self.session_config)
+        return ocr, detection, 'builtin'
+
+    def _cases(self, ocr: OCREngine, detection: DetectionEngine) -> List[Tuple[str, Callable[[], Any]]]:
+        """构建基准测试用例"""
+        cases: List[Tuple[str, Callable[[], Any]]] = []
+
+        for width in OCR_WIDTHS:
+            image = captcha_image(width=width, height=40, seed=width)
+            cases.append((f'ocr.predict[w={width}]', lambda image=image: ocr.predict(image)))
+
+        colored = captcha_image(width=200, height=40, seed=200)
+        cases.append(('ocr.predict[w=200,color_filter]',
+                      lambda: ocr.predict(colored, color_filter_colors=['red', 'blue'])))
+
+        batch = [captcha_image(width=OCR_WIDTHS[i % len(OCR_WIDTHS)], height=40, seed=i) for i in range(8)]
+        cases.append(('ocr.predict_batch[n=8]', lambda: ocr.predict_batch(batch)))
+
+        rng = np.random.RandomState(0)
+        num_classes = len(ocr.charset_manager.charset)
+        logits = rng.randn(50, 1, num_classes).astype(np.float32)
+        batch_logits = rng.randn(50, 8, num_classes).astype(np.float32)
+        cases.append(('ctc.decode[T=50]', lambda: ocr.decoder.decode(logits)))
+        cases.append(('ctc.decode_batch[n=8,T=50]', lambda: ocr.decoder.decode_batch(batch_logits, 8)))
+
+        det_image = detection_image(320, 160, seed=0)
+        cases.append(('detection.get_bbox[320x160]', lambda: detection.get_bbox(det_image)))
+        cases.append(('detection.predict[320x160]', lambda: detection.predict(det_image)))
+
+        slide = SlideEngine()
+        target, background, _ = slide_images(seed=0)
+        full, gapped, _ = slide_comparison_images(seed=0)
+        cases.append(('slide.slide_match', lambda: slide.slide_match(target, background)))
+        cases.append(('slide.slide_match[simple]', lambda: slide.slide_match(target, background, simple_target=True)))
+        cases.append(('slide.slide_comparison', lambda: slide.slide_comparison(full, gapped)))
+        large_target, large_background, _ = slide_images(width=1200, height=700, piece=160, seed=0)
+        cases.append(('slide.slide_match[1200x700]', lambda: slide.slide_match(large_target, large_background)))
+        cases.append(('slide.slide_match[1200x700,pyramid]',
+                      lambda: slide.slide_match(large_target, large_background, mode='pyramid')))
+
+        color_filter = ColorFilter(colors=['red', 'blue'])
+        for width, height in ((160, 40), (400, 100)):
+            pil_image = Image.open(io.BytesIO(captcha_image(width=width, height=height, seed=1))).convert('RGB')
+            cases.append((f'color_filter.filter_image[{width}x{height}]',
+                          lambda pil_image=pil_image: color_filter.filter_image(pil_image)))
+
+        if self.filters:
+            cases = [case for case in cases if any(f in case[0] for f in self.filters)]
+        return cases
+
+    def _measure(self, func: Callable[[], Any]) -> Dict[str, Any]:
+        """预热后计时执行用例"""
+        for _ in range(self.warmup):
+            func()
+
+        gc.collect()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            timings = []
+            for _ in range(self.repeat):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        values = np.asarray(timings) * 1000.0
+        median = float(np.median(values))
+        return {
+            'iterations': self.repeat,
+            'mean_ms': round(float(values.mean()), 4),
+            'median_ms': round(median, 4),
+            'p95_ms': round(float(np.percentile(values, 95)), 4),
+            'min_ms': round(float(values.min()), 4),
+            'stdev_ms': round(float(values.std()), 4),
+            'ops_per_second': round(1000.0 / median, 2) if median > 0 else 0.0
+        }
+
+    def run(self, progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        运行基准测试
+
+        Args:
+            progress: 每完成一个用例时调用的回调，参数为(用例名称, 结果)
+
+        Returns:
+            测试报告，包含运行环境、模型类型、配置和各用例结果
+        """
+        with tempfile.TemporaryDirectory(prefix='ddddocr-bench-') as workdir:
+            ocr, detection, models = self._create_engines(workdir)
+            try:
+                results = {}
+                for name, func in self._cases(ocr, detection):
+                    results[name] = self._measure(func)
+                    if progress is not None:
+                        progress(name, results[name])
+            finally:
+                ocr.cleanup()
+                detection.cleanup()
+
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'environment': _environment(),
+            'models': models,
+            'config': {'repeat': self.repeat, 'warmup': self.warmup, 'filters': self.filters},
+            'results': results
+        }
+
+    @staticmethod
+    def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+        """
+        按中位数耗时比较两次测试结果
+
+        Args:
+            baseline: 基线报告
+            current: 当前报告
+            threshold: 判定回退或提升的相对变化阈值，如0.10表示10%
+
+        Returns:
+            各用例的比较结果，status为 regression、improvement、ok、new 或 missing
+        """
+        base_results = baseline.get('results', {})
+        current_results = current.get('results', {})
+        rows = []
+        for name in list(current_results) + [n for n in base_results if n not in current_results]:
+            base = base_results.get(name)
+            now = current_results.get(name)
+            row = {'name': name,
+                   'baseline_ms': base['median_ms'] if base else None,
+                   'current_ms': now['median_ms'] if now else None,
+                   'change': None}
+            if base is None:
+                row['status'] = 'new'
+            elif now is None:
+                row['status'] = 'missing'
+            else:
+                change = now['median_ms'] / base['median_ms'] - 1.0 if base['median_ms'] > 0 else 0.0
+                row['change'] = round(change, 4)
+                if change > threshold:
+                    row['status'] = 'regression'
+                elif change < -threshold:
+                    row['status'] = 'improvement'
+                else:
+                    row['status'] = 'ok'
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def format_results(report: Dict[str, Any]) -> str:
+        """将测试报告格式化为文本表格"""
+        header = ('用例', '中位数(ms)', '平均(ms)', 'p95(ms)', '最小(ms)', '次/秒')
+        rows = [(name, f"{r['median_ms']:.3f}", f"{r['mean_ms']:.3f}", f"{r['p95_ms']:.3f}",
+                 f"{r['min_ms']:.3f}", f"{r['ops_per_second']:.1f}")
+                for name, r in report['results'].items()]
+        return format_table(header, rows)
+
+    @staticmethod
+    def format_comparison(rows: List[Dict[str, Any]]) -> str:
+        """将比较结果格式化为文本表格"""
+        labels = {'regression': '回退', 'improvement': '提升', 'ok': '持平', 'new': '新增', 'missing': '缺失'}
+        header = ('用例', '基线(ms)', '当前(ms)', '变化', '结论')
+        table = []
+        for row in rows:
+            table.append((row['name'],
+                          '-' if row['baseline_ms'] is None else f"{row['baseline_ms']:.3f}",
+                          '-' if row['current_ms'] is None else f"{row['current_ms']:.3f}",
+                          '-' if row['change'] is None else f"{row['change'] * 100:+.1f}%",
+                          labels[row['status']]))
+        return format_table(header, table)
@@ -0,0 +1,204 @@
+# coding=utf-8
+"""
+合成测试图片
+在本地按固定随机种子生成类验证码图片，性能测试不依赖外部数据
+"""
+
+import io
+import string
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# 生成验证码文本使用的字符
+CAPTCHA_CHARS = string.ascii_lowercase + string.digits
+
+
+def _font(size: int) -> ImageFont.ImageFont:
+    """获取内置字体（旧版本Pillow的默认字体不支持指定大小）"""
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _encode(image: Image.Image, fmt: str) -> bytes:
+    """将图片编码为字节"""
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def random_text(length: int, seed: int = 0) -> str:
+    """
+    生成随机验证码文本
+
+    Args:
+        length: 文本长度
+        seed: 随机种子
+
+    Returns:
+        由小写字母和数字组成的文本
+    """
+    rng = np.random.RandomState(seed)
+    return ''.join(rng.choice(list(CAPTCHA_CHARS), length))
+
+
+def captcha_image(text: Optional[str] = None, width: int = 120, height: int = 40,
+                  seed: int = 0, fmt: str = 'PNG') -> bytes:
+    """
+    生成类验证码图片：噪点背景、随机颜色和位置的字符以及干扰线
+
+    Args:
+        text: 图片中的文本，None表示按宽度随机生成
+        width: 图片宽度
+        height: 图片高度
+        seed: 随机种子，相同参数生成的图片完全一致
+        fmt: 编码格式，如 PNG、JPEG
+
+    Returns:
+        编码后的图片字节
+    """
+    rng = np.random.RandomState(seed)
+    if text is None:
+        text = random_text(max(1, width // 25), seed)
+
+    background = rng.randint(200, 256, (height, width, 3), dtype=np.uint8)
+    image = Image.fromarray(background)
+    draw = ImageDraw.Draw(image)
+
+    font = _font(int(height * 0.7))
+    step = width / (len(text) + 1)
+    for index, char in enumerate(text):
+        x = step * (index + 0.5) + rng.randint(-3, 4)
+        y = rng.randint(0, max(1, height // 5))
+        color = tuple(int(c) for c in rng.randint(0, 150, 3))
+        draw.text((x, y), char, fill=color, font=font)
+
+    for _ in range(3):
+        points = [(int(rng.randint(0, width)), int(rng.randint(0, height))) for _ in range(2)]
+        draw.line(points, fill=tuple(int(c) for c in rng.randint(0, 200, 3)), width=1)
+
+    return _encode(image, fmt)
+
+
+def captcha_images(count: int, widths: Sequence[int] = (100, 120, 160), height: int = 40,
+                   seed: int = 0, fmt: str = 'PNG') -> List[bytes]:
+    """
+    生成一组宽度不同的类验证码图片
+
+    Args:
+        count: 图片数量
+        widths: 轮流使用的图片宽度
+        height: 图片高度
+        seed: 起始随机种子
+        fmt: 编码格式
+
+    Returns:
+        图片字节列表
+    """
+    return [captcha_image(width=widths[i % len(widths)], height=height, seed=seed + i, fmt=fmt)
+            for i in range(count)]
+
+
+def detection_image(width: int = 320, height: int = 160, count: int = 4,
+                    seed: int = 0, fmt: str = 'PNG') -> bytes:
+    """
+    生成目标检测用的图片：在纹理背景上分散绘制若干大号字符
+
+    Args:
+        width: 图片宽度
+        height: 图片高度
+        count: 字符数量
+        seed: 随机种子
+        fmt: 编码格式
+
+    Returns:
+        编码后的图片字节
+    """
+    rng = np.random.RandomState(seed)
+    base = rng.randint(120, 220, (height // 8 + 1, width // 8 + 1, 3), dtype=np.uint8)
+    background = np.repeat(np.repeat(base, 8, axis=0), 8, axis=1)[:height, :width]
+    image = Image.fromarray(np.ascontiguousarray(background))
+    draw = ImageDraw.Draw(image)
+
+    size = max(12, min(width, height) // 4)
+    font = _font(size)
+    for char in random_text(count, seed):
+        x = int(rng.randint(0, max(1, width - size)))
+        y = int(rng.randint(0, max(1, height - size)))
+        draw.text((x, y), char, fill=tuple(int(c) for c in rng.randint(0, 80, 3)), font=font)
+
+    return _encode(image, fmt)
+
+
+def _slide_scene(width: int, height: int, piece: int, seed: int) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """生成滑块场景：(原始背景, 带缺口背景, 缺口x, 缺口y)"""
+    rng = np.random.RandomState(seed)
+    # 平滑噪声背景上叠加随机形状，避免规则纹理产生大量相似的匹配位置
+    base = rng.randint(0, 256, (height // 16 + 2, width // 16 + 2, 3), dtype=np.uint8)
+    image = Image.fromarray(base).resize((width, height), Image.BICUBIC)
+    draw = ImageDraw.Draw(image)
+    for _ in range(max(4, width * height // 4000)):
+        x0, y0 = int(rng.randint(0, width)), int(rng.randint(0, height))
+        size = int(rng.randint(8, max(9, min(width, height) // 4)))
+        color = tuple(int(c) for c in rng.randint(0, 256, 3))
+        if rng.rand() < 0.5:
+            draw.ellipse((x0, y0, x0 + size, y0 + size), fill=color)
+        else:
+            draw.rectangle((x0, y0, x0 + size, y0 + size // 2), fill=color)
+    original = np.array(image)
+
+    x = int(rng.randint(piece, width - piece))
+    y = int(rng.randint(0, height - piece))
+
+    # 缺口处变暗并加亮边，模拟常见滑块背景
+    notch = original[y:y + piece, x:x + piece] // 2
+    notch[[0, -1], :] = 255
+    notch[:, [0, -1]] = 255
+    gapped = original.copy()
+    gapped[y:y + piece, x:x + piece] = notch
+    return original, gapped, x, y
+
+
+def slide_images(width: int = 280, height: int = 160, piece: int = 50,
+                 seed: int = 0) -> Tuple[bytes, bytes, int]:
+    """
+    生成滑块匹配用的图片
+
+    Args:
+        width: 背景图宽度
+        height: 背景图高度
+        piece: 滑块边长
+        seed: 随机种子
+
+    Returns:
+        (带透明通道的滑块图PNG, 带缺口的背景图PNG, 缺口左上角x坐标)
+    """
+    original, gapped, x, y = _slide_scene(width, height, piece, seed)
+    target = np.zeros((piece, piece, 4), dtype=np.uint8)
+    target[..., :3] = original[y:y + piece, x:x + piece]
+    # 滑块同样带亮边
+    target[[0, -1], :, :3] = 255
+    target[:, [0, -1], :3] = 255
+    target[..., 3] = 255
+    return _encode(Image.fromarray(target, 'RGBA'), 'PNG'), _encode(Image.fromarray(gapped), 'PNG'), x
+
+
+def slide_comparison_images(width: int = 280, height: int = 160, piece: int = 50,
+                            seed: int = 0) -> Tuple[bytes, bytes, int]:
+    """
+    生成滑块比较用的图片
+
+    Args:
+        width: 图片宽度
+        height: 图片高度
+        piece: 缺口边长
+        seed: 随机种子
+
+    Returns:
+        (完整背景图PNG, 带缺口的背景图PNG, 缺口左上角x坐标)
+    """
+    original, gapped, x, _ = _slide_scene(width, height, piece, seed)
+    return _encode(Image.fromarray(original), 'PNG'), _encode(Image.fromarray(gapped), 'PNG'), x
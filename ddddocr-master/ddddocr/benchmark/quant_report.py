@@ -0,0 +1,325 @@
+# coding=utf-8
+"""
+量化模型评估
+在本地图片集上对比float32与动态量化INT8模型的识别结果、推理耗时和内存占用
+"""
+
+import os
+import gc
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .report import format_table
+from ..bulk.inputs import IMAGE_EXTENSIONS
+from ..utils.exceptions import DDDDOCRError
+
+# 检测结果比较时判定两个框为同一目标的IoU阈值
+MATCH_IOU = 0.5
+
+# 报告中保留的结果不一致样例数
+MAX_MISMATCHES = 20
+
+
+def find_images(paths: Sequence[str]) -> List[str]:
+    """
+    收集图片文件，目录按文件名排序递归查找
+
+    Args:
+        paths: 图片文件或目录路径
+
+    Returns:
+        图片文件路径列表
+
+    Raises:
+        DDDDOCRError: 当路径不存在或未找到图片时
+    """
+    images = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                images.extend(os.path.join(root, name) for name in sorted(files)
+                              if name.lower().endswith(IMAGE_EXTENSIONS))
+        elif os.path.isfile(path):
+            images.append(path)
+        else:
+            raise DDDDOCRError(f"图片路径不存在: {path}")
+    if not images:
+        raise DDDDOCRError("未找到图片文件")
+    return images
+
+
+def load_labels(path: str) -> Dict[str, str]:
+    """
+    加载标注文件，每行为 文件名<制表符或空格>标签
+
+    Args:
+        path: 标注文件路径
+
+    Returns:
+        文件名到标签的映射
+    """
+    labels = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.rstrip('\r\n').split(None, 1)
+            if len(parts) == 2:
+                labels[os.path.basename(parts[0])] = parts[1]
+    return labels
+
+
+def label_from_filename(path: str) -> str:
+    """从文件名中取标签，如 a3b9_0001.png 的标签为 a3b9"""
+    return os.path.splitext(os.path.basename(path))[0].split('_')[0]
+
+
+def _rss_mb() -> Optional[float]:
+    """当前进程的常驻内存（MB），平台不支持时返回None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux以KB为单位，macOS以字节为单位
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        return None
+
+
+def _box_agreement(reference: List[List[int]], boxes: List[List[int]]) -> float:
+    """参考检测框中能在另一组结果里找到IoU不低于MATCH_IOU的框的比例"""
+    if not reference:
+        return 1.0 if not boxes else 0.0
+    if not boxes:
+        return 0.0
+    a = np.asarray(reference, dtype=np.float64)[:, None, :]
+    b = np.asarray(boxes, dtype=np.float64)[None, :, :]
+    w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = w * h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    iou = inter / np.maximum(area_a + area_b - inter, 1e-9)
+    return float((iou.max(axis=1) >= MATCH_IOU).mean())
+
+
+def _measure_precision(options: Dict[str, Any], precision: str, images: List[str],
+                       repeat: int) -> Dict[str, Any]:
+    """
+    加载指定精度的模型并逐张推理，返回识别结果、耗时和内存占用
+
+    在独立进程中执行时内存与耗时不受另一精度模型的影响
+    """
+    from ..core.ocr_engine import OCREngine
+    from ..core.detection_engine import DetectionEngine
+
+    data = []
+    for path in images:
+        with open(path, 'rb') as f:
+            data.append(f.read())
+
+    gc.collect()
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    if options['model'] == 'det':
+        engine = DetectionEngine(session_config=options['session_config'], precision=precision)
+    else:
+        engine = OCREngine(old=options['old'], beta=options['beta'],
+                           import_onnx_path=options['import_onnx_path'],
+                           charsets_path=options['charsets_path'],
+                           session_config=options['session_config'], precision=precision)
+    try:
+        # 首次推理时创建会话，第一轮推理的结果作为识别输出
+        outputs = [engine.predict(image) for image in data]
+        load_seconds = time.perf_counter() - start
+        rss_after = _rss_mb()
+
+        timings = []
+        for _ in range(repeat):
+            for image in data:
+                begin = time.perf_counter()
+                engine.predict(image)
+                timings.append(time.perf_counter() - begin)
+
+        model_path = engine._session_handle.model_path
+    finally:
+        engine.cleanup()
+
+    values = np.asarray(timings) * 1000.0
+    median = float(np.median(values))
+    return {
+        'model_path': model_path,
+        'model_size_mb': round(os.path.getsize(model_path) / (1024 * 1024), 3),
+        'rss_mb': None if rss_before is None else round(rss_after - rss_before, 2),
+        'load_and_first_pass_s': round(load_seconds, 3),
+        'median_ms': round(median, 4),
+        'mean_ms': round(float(values.mean()), 4),
+        'p95_ms': round(float(np.percentile(values, 95)), 4),
+        'images_per_second': round(1000.0 / median, 2) if median > 0 else 0.0,
+        'outputs': outputs
+    }
+
+
+class QuantizationReport:
+    """
+    量化模型评估
+
+    分别用float32与INT8模型识别同一图片集，报告结果一致率（有标注时报告准确率变化）、
+    单张推理耗时、模型文件大小及加载模型并推理后增加的常驻内存。
+    默认每种精度在独立的子进程中测量，避免内存池和缓存相互影响
+    """
+
+    def __init__(self, images: Sequence[str], model: str = 'ocr', old: bool = False, beta: bool = False,
+                 import_onnx_path: str = "", charsets_path: str = "",
+                 labels: Optional[Dict[str, str]] = None, repeat: int = 3,
+                 session_config: Optional[Dict[str, Any]] = None, isolate: bool = True):
+        """
+        初始化评估
+
+        Args:
+            images: 图片文件路径列表
+            model: 评估的模型，'ocr'或'det'
+            old: 是否使用旧版OCR模型
+            beta: 是否使用beta版OCR模型
+            import_onnx_path: 自定义OCR模型路径
+            charsets_path: 自定义字符集路径
+            labels: 文件名到标签的映射，提供时计算OCR准确率
+            repeat: 计时的轮数，每轮识别全部图片
+            session_config: 推理会话配置
+            isolate: 是否在独立子进程中测量每种精度
+        """
+        if model not in ('ocr', 'det'):
+            raise DDDDOCRError(f"不支持的模型类型: {model}，可选: ocr, det")
+        if repeat < 1:
+            raise DDDDOCRError("repeat必须大于等于1")
+        if not images:
+            raise DDDDOCRError("图片列表不能为空")
+
+        self.images = list(images)
+        self.repeat = repeat
+        self.labels = labels
+        self.isolate = isolate
+        self.options = {
+            'model': model, 'old': old, 'beta': beta,
+            'import_onnx_path': import_onnx_path, 'charsets_path': charsets_path,
+            'session_config': session_config
+        }
+
+    def _measure(self, precision: str) -> Dict[str, Any]:
+        """测量单个精度"""
+        if not self.isolate:
+            return _measure_precision(self.options, precision, self.images, self.repeat)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            return executor.submit(_measure_precision, self.options, precision, self.images, self.repeat).result()
+
+    def run(self, progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        运行评估
+
+        Args:
+            progress: 每完成一种精度的测量时调用的回调，参数为(精度, 测量结果)
+
+        Returns:
+            评估报告，包含各精度的测量结果及两者的比较
+        """
+        results = {}
+        for precision in ('fp32', 'int8'):
+            results[precision] = self._measure(precision)
+            if progress is not None:
+                progress(precision, results[precision])
+
+        fp32, int8 = results['fp32'].pop('outputs'), results['int8'].pop('outputs')
+        comparison = self._compare_outputs(fp32, int8)
+        base, quant = results['fp32'], results['int8']
+        comparison.update({
+            'speedup': round(base['median_ms'] / quant['median_ms'], 3) if quant['median_ms'] > 0 else None,
+            'model_size_reduction': round(1.0 - quant['model_size_mb'] / base['model_size_mb'], 4)
+            if base['model_size_mb'] > 0 else None,
+            'rss_saving_mb': None if base['rss_mb'] is None or quant['rss_mb'] is None
+            else round(base['rss_mb'] - quant['rss_mb'], 2)
+        })
+
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'model': self.options['model'],
+            'images': len(self.images),
+            'repeat': self.repeat,
+            'results': results,
+            'comparison': comparison
+        }
+
+    def _compare_outputs(self, fp32: List[Any], int8: List[Any]) -> Dict[str, Any]:
+        """比较两种精度的识别结果"""
+        mismatches = []
+        if self.options['model'] == 'det':
+            scores = [_box_agreement(a, b) for a, b in zip(fp32, int8)]
+            for path, a, b, score in zip(self.images, fp32, int8, scores):
+                if score < 1.0 and len(mismatches) < MAX_MISMATCHES:
+                    mismatches.append({'image': path, 'fp32': a, 'int8': b})
+            return {'agreement': round(float(np.mean(scores)), 4), 'mismatches': mismatches}
+
+        for path, a, b in zip(self.images, fp32, int8):
+            if a != b and len(mismatches) < MAX_MISMATCHES:
+                mismatches.append({'image': path, 'fp32': a, 'int8': b})
+        comparison: Dict[str, Any] = {
+            'agreement': round(sum(a == b for a, b in zip(fp32, int8)) / len(fp32), 4),
+            'mismatches': mismatches
+        }
+
+        if self.labels is not None:
+            labelled = [(self.labels[os.path.basename(path)], a, b) for path, a, b in zip(self.images, fp32, int8)
+                        if os.path.basename(path) in self.labels]
+            if labelled:
+                fp32_accuracy = sum(label == a for label, a, _ in labelled) / len(labelled)
+                int8_accuracy = sum(label == b for label, _, b in labelled) / len(labelled)
+                comparison.update({
+                    'labelled': len(labelled),
+                    'fp32_accuracy': round(fp32_accuracy, 4),
+                    'int8_accuracy': round(int8_accuracy, 4),
+                    'accuracy_delta': round(int8_accuracy - fp32_accuracy, 4)
+                })
+        return comparison
+
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        """将评估报告格式化为文本表格"""
+        base, quant = report['results']['fp32'], report['results']['int8']
+        comparison = report['comparison']
+
+        def number(value, pattern):
+            return '-' if value is None else pattern.format(value)
+
+        def change(a, b):
+            return '-' if a is None or b is None or not a else f"{(b / a - 1.0) * 100:+.1f}%"
+
+        rows = [
+            ('模型文件(MB)', number(base['model_size_mb'], '{:.2f}'), number(quant['model_size_mb'], '{:.2f}'),
+             change(base['model_size_mb'], quant['model_size_mb'])),
+            ('常驻内存增量(MB)', number(base['rss_mb'], '{:.1f}'), number(quant['rss_mb'], '{:.1f}'),
+             change(base['rss_mb'], quant['rss_mb'])),
+            ('中位数(ms)', number(base['median_ms'], '{:.3f}'), number(quant['median_ms'], '{:.3f}'),
+             change(base['median_ms'], quant['median_ms'])),
+            ('p95(ms)', number(base['p95_ms'], '{:.3f}'), number(quant['p95_ms'], '{:.3f}'),
+             change(base['p95_ms'], quant['p95_ms'])),
+            ('张/秒', number(base['images_per_second'], '{:.1f}'), number(quant['images_per_second'], '{:.1f}'),
+             change(base['images_per_second'], quant['images_per_second'])),
+        ]
+        if 'fp32_accuracy' in comparison:
+            rows.append(('准确率', f"{comparison['fp32_accuracy'] * 100:.2f}%",
+                         f"{comparison['int8_accuracy'] * 100:.2f}%",
+                         f"{comparison['accuracy_delta'] * 100:+.2f}pt"))
+
+        lines = [format_table(('指标', 'fp32', 'int8', '变化'), rows), '',
+                 f"结果一致率: {comparison['agreement'] * 100:.2f}% ({report['images']}张图片)"]
+        for item in comparison['mismatches'][:5]:
+            lines.append(f"  {os.path.basename(item['image'])}: fp32={item['fp32']!r} int8={item['int8']!r}")
+        return '\n'.join(lines)
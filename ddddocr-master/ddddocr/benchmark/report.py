@@ -0,0 +1,32 @@
+# coding=utf-8
+"""
+性能测试报告工具
+"""
+
+from typing import List, Sequence
+
+
+def _display_width(text: str) -> int:
+    """文本显示宽度，中文字符按两个字符宽度计算"""
+    return sum(2 if ord(ch) > 0x2E80 else 1 for ch in text)
+
+
+def format_table(header: Sequence[str], rows: List[Sequence[str]]) -> str:
+    """
+    将行数据格式化为左对齐的文本表格
+
+    Args:
+        header: 表头
+        rows: 各行的单元格文本
+
+    Returns:
+        表格文本
+    """
+    rows = [tuple(header)] + [tuple(row) for row in rows]
+    widths = [max(_display_width(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for index, row in enumerate(rows):
+        lines.append('  '.join(cell + ' ' * (widths[i] - _display_width(cell)) for i, cell in enumerate(row)).rstrip())
+        if index == 0:
+            lines.append('  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
@@ -0,0 +1,146 @@
+# coding=utf-8
+"""
+替身模型
+在缺少内置模型权重时生成输入输出形状与真实模型一致的微型ONNX模型，
+使性能测试可以覆盖预处理、会话调用和后处理的完整流程
+"""
+
+import os
+import json
+from typing import Sequence
+
+import numpy as np
+
+
+def _onnx():
+    """导入onnx（仅生成替身模型时需要）"""
+    try:
+        import onnx
+        return onnx
+    except ImportError as e:
+        raise ImportError("生成替身模型需要onnx，请安装: pip install onnx") from e
+
+
+def build_ocr_model(path: str, charset: Sequence[str], height: int = 64, stride: int = 8,
+                    context: int = 0) -> str:
+    """
+    生成OCR替身模型及字符集文件
+
+    输入为(N, 1, height, W)的灰度图，每stride列池化为一个时间步，
+    输出(T, N, C)的logits，与内置OCR模型布局一致。context大于0时每个时间步再与前后context个
+    时间步做一维卷积，模拟内置模型中循环层等读取相邻列的序列上下文
+
+    Args:
+        path: 模型保存路径，字符集保存为 path + '.json'
+        charset: 字符集，决定输出类别数
+        height: 输入高度
+        stride: 时间步对应的列数
+        context: 每个时间步读取的前后相邻时间步数，0表示时间步之间相互独立
+
+    Returns:
+        字符集文件路径
+    """
+    onnx = _onnx()
+    from onnx import helper, numpy_helper, TensorProto
+
+    num_classes = len(charset)
+    rng = np.random.RandomState(0)
+    weight = rng.randn(1, num_classes).astype(np.float32) * 8.0
+    bias = rng.randn(num_classes).astype(np.float32)
+
+    initializers = [numpy_helper.from_array(weight, 'weight'), numpy_helper.from_array(bias, 'bias'),
+                    numpy_helper.from_array(np.array([2], dtype=np.int64), 'axes')]
+    nodes = [helper.make_node('AveragePool', ['input1'], ['pooled'], kernel_shape=[height, stride],
+                              strides=[height, stride])]
+    pooled = 'pooled'
+    if context > 0:
+        kernel = rng.rand(1, 1, 1, 2 * context + 1).astype(np.float32)
+        initializers.append(numpy_helper.from_array(kernel / kernel.sum(), 'context'))
+        nodes.append(helper.make_node('Conv', ['pooled', 'context'], ['mixed'], pads=[0, context, 0, context]))
+        pooled = 'mixed'
+    nodes += [
+        helper.make_node('Squeeze', [pooled, 'axes'], ['squeezed']),
+        helper.make_node('Transpose', ['squeezed'], ['steps'], perm=[2, 0, 1]),
+        helper.make_node('MatMul', ['steps', 'weight'], ['logits']),
+        helper.make_node('Add', ['logits', 'bias'], ['output']),
+    ]
+    graph = helper.make_graph(
+        nodes, 'ocr_stand_in',
+        [helper.make_tensor_value_info('input1', TensorProto.FLOAT, ['N', 1, height, 'W'])],
+        [helper.make_tensor_value_info('output', TensorProto.FLOAT, ['T', 'N', num_classes])],
+        initializer=initializers)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 13)])
+    model.ir_version = 8
+    onnx.save(model, path)
+
+    charsets_path = path + '.json'
+    with open(charsets_path, 'w', encoding='utf-8') as f:
+        json.dump({'charset': list(charset), 'word': False, 'image': [-1, height], 'channel': 1},
+                  f, ensure_ascii=False)
+    return charsets_path
+
+
+def build_detection_model(path: str, strides: Sequence[int] = (8, 16, 32)) -> None:
+    """
+    生成目标检测替身模型
+
+    输入为(N, 3, H, W)，在各步长的特征图上输出YOLOX格式的(N, A, 6)预测
+    （4个框参数、目标置信度和1个类别分数），后处理与内置检测模型相同
+
+    Args:
+        path: 模型保存路径
+        strides: 特征图步长
+    """
+    onnx = _onnx()
+    from onnx import helper, numpy_helper, TensorProto
+
+    rng = np.random.RandomState(1)
+    nodes, initializers, heads = [], [], []
+    for stride in strides:
+        weight = rng.randn(6, 3, 1, 1).astype(np.float32) * 0.004
+        bias = np.array([0.5, 0.5, 0.3, 0.3, -1.3, 0.5], dtype=np.float32)
+        initializers += [numpy_helper.from_array(weight, f'w{stride}'), numpy_helper.from_array(bias, f'b{stride}')]
+        nodes += [
+            helper.make_node('AveragePool', ['images'], [f'pool{stride}'],
+                             kernel_shape=[stride, stride], strides=[stride, stride]),
+            helper.make_node('Conv', [f'pool{stride}', f'w{stride}', f'b{stride}'], [f'conv{stride}']),
+            helper.make_node('Reshape', [f'conv{stride}', 'shape'], [f'head{stride}']),
+        ]
+        heads.append(f'head{stride}')
+
+    initializers += [numpy_helper.from_array(np.array([0, 6, -1], dtype=np.int64), 'shape'),
+                     numpy_helper.from_array(np.array([4, 2], dtype=np.int64), 'split')]
+    nodes += [
+        helper.make_node('Concat', heads, ['concat'], axis=2),
+        helper.make_node('Transpose', ['concat'], ['predictions'], perm=[0, 2, 1]),
+        helper.make_node('Split', ['predictions', 'split'], ['boxes', 'scores'], axis=2),
+        helper.make_node('Sigmoid', ['scores'], ['probabilities']),
+        helper.make_node('Concat', ['boxes', 'probabilities'], ['output'], axis=2),
+    ]
+    graph = helper.make_graph(
+        nodes, 'detection_stand_in',
+        [helper.make_tensor_value_info('images', TensorProto.FLOAT, ['N', 3, 'H', 'W'])],
+        [helper.make_tensor_value_info('output', TensorProto.FLOAT, ['N', 'A', 6])],
+        initializer=initializers)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 13)])
+    model.ir_version = 8
+    onnx.save(model, path)
+
+
+def build_stand_in_models(directory: str, charset: Sequence[str]) -> dict:
+    """
+    在目录中生成OCR和目标检测替身模型
+
+    Args:
+        directory: 输出目录
+        charset: OCR字符集
+
+    Returns:
+        {'ocr': 模型路径, 'charsets': 字符集路径, 'detection': 模型路径}
+    """
+    os.makedirs(directory, exist_ok=True)
+    ocr_path = os.path.join(directory, 'ocr_stand_in.onnx')
+    det_path = os.path.join(directory, 'detection_stand_in.onnx')
+    charsets_path = build_ocr_model(ocr_path, charset)
+    build_detection_model(det_path)
+    return {'ocr': ocr_path, 'charsets': charsets_path, 'detection': det_path}
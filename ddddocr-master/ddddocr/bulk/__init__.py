@@ -0,0 +1,10 @@
+# coding=utf-8
+"""
+ddddocr批量识别模块
+提供命令行批量OCR和目标检测使用的输入收集与多进程识别
+"""
+
+from .inputs import iter_inputs, IMAGE_EXTENSIONS
+from .runner import BulkRunner, BULK_MODES
+
+__all__ = ['iter_inputs', 'IMAGE_EXTENSIONS', 'BulkRunner', 'BULK_MODES']
@@ -0,0 +1,72 @@
+# coding=utf-8
+"""
+批量输入收集模块
+将命令行给出的图片文件、目录、通配符模式及标准输入中的路径列表展开为按顺序产生的图片路径
+"""
+
+import os
+import sys
+import glob
+from typing import Iterable, Iterator, Optional, TextIO
+
+# 展开目录时识别的图片文件扩展名
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+
+# 表示从标准输入读取路径列表的参数
+STDIN_MARKER = '-'
+
+
+def _walk_directory(path: str) -> Iterator[str]:
+    """按文件名顺序递归产生目录中的图片文件"""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
+def _expand(path: str) -> Iterator[str]:
+    """展开单个输入：目录递归查找图片，通配符按路径排序展开，其余原样产生"""
+    if os.path.isdir(path):
+        yield from _walk_directory(path)
+    elif not os.path.exists(path) and glob.has_magic(path):
+        for match in sorted(glob.glob(path, recursive=True)):
+            if os.path.isdir(match):
+                yield from _walk_directory(match)
+            else:
+                yield match
+    else:
+        # 不存在的文件也原样产生，由识别时在结果中报告错误，保证输出与输入一一对应
+        yield path
+
+
+def _read_stdin(stream: TextIO) -> Iterator[str]:
+    """逐行读取路径列表，忽略空行"""
+    for line in stream:
+        path = line.strip()
+        if path:
+            yield path
+
+
+def iter_inputs(inputs: Iterable[str], stdin: Optional[TextIO] = None) -> Iterator[str]:
+    """
+    按输入顺序产生图片路径
+
+    路径是逐个产生的，处理大目录或标准输入中的长列表时无需等待全部收集完成即可开始识别
+
+    Args:
+        inputs: 图片文件、目录或通配符模式（支持 ** 递归匹配），- 表示从标准输入逐行读取路径；
+            为空时从标准输入读取
+        stdin: 读取路径列表的文本流，None表示 sys.stdin
+
+    Returns:
+        图片路径迭代器
+    """
+    inputs = list(inputs) or [STDIN_MARKER]
+    stream = stdin if stdin is not None else sys.stdin
+    for item in inputs:
+        if item == STDIN_MARKER:
+            for path in _read_stdin(stream):
+                yield from _expand(path)
+        else:
+            yield from _expand(item)
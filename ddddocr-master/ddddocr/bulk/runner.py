@@ -0,0 +1,191 @@
+# coding=utf-8
+"""
+批量识别模块
+将图片分块分发到进程池，每个工作进程只加载一次模型，结果按输入顺序逐条产生
+"""
+
+import os
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from ..utils.exceptions import DDDDOCRError
+
+# 支持的任务类型
+BULK_MODES = ('ocr', 'det')
+
+# 每个工作进程最多排队的分块数，限制未输出结果占用的内存
+PREFETCH_CHUNKS = 4
+
+# 工作进程内的识别实例，由进程池初始化函数创建
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    """
+    工作进程初始化：加载模型
+
+    加载失败时记录错误信息，在处理第一个分块时以普通异常抛出，
+    避免进程池因初始化函数异常而只报告进程意外退出
+    """
+    _worker_state.clear()
+    _worker_state['options'] = options
+    try:
+        from ..compat.legacy import DdddOcr
+        _worker_state['ocr'] = DdddOcr(ocr=options['mode'] == 'ocr', det=options['mode'] == 'det',
+                                       old=options['old'], beta=options['beta'], show_ad=False,
+                                       import_onnx_path=options['import_onnx_path'],
+                                       charsets_path=options['charsets_path'],
+                                       session_config=options['session_config'],
+                                       precision=options['precision'],
+                                       fast_preprocess=options['fast_preprocess'])
+    except Exception as e:
+        _worker_state['error'] = f"模型加载失败: {str(e)}"
+
+
+def _process_chunk(paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    识别一个分块中的图片
+
+    单张图片读取或识别失败时在对应结果中记录error，不影响同一分块中的其他图片
+
+    Raises:
+        DDDDOCRError: 当工作进程的模型加载失败时
+    """
+    if 'error' in _worker_state:
+        raise DDDDOCRError(_worker_state['error'])
+
+    ocr = _worker_state['ocr']
+    options = _worker_state['options']
+    records = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                image = f.read()
+            if options['mode'] == 'det':
+                records.append({'path': path, 'bboxes': ocr.detection(image)})
+            else:
+                text = ocr.classification(image, png_fix=options['png_fix'],
+                                          color_filter_colors=options['color_filter_colors'],
+                                          charset_range=options['charset_range'])
+                records.append({'path': path, 'text': text})
+        except Exception as e:
+            records.append({'path': path, 'error': str(e)})
+    return records
+
+
+def _chunked(paths: Iterable[str], size: int) -> Iterator[List[str]]:
+    """将路径迭代器切分为固定大小的分块"""
+    iterator = iter(paths)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BulkRunner:
+    """
+    批量OCR/目标检测
+
+    图片按chunk_size分块提交到进程池，每个工作进程在启动时加载一次模型；
+    同时排队的分块数有上限，结果按输入顺序产生，可在全部图片识别完成前开始输出
+    """
+
+    def __init__(self, mode: str = 'ocr', workers: Optional[int] = None, chunk_size: int = 8,
+                 old: bool = False, beta: bool = False, import_onnx_path: str = "", charsets_path: str = "",
+                 png_fix: bool = False, color_filter_colors: Optional[Sequence[str]] = None,
+                 charset_range: Optional[Union[int, str]] = None,
+                 session_config: Optional[Dict[str, Any]] = None, precision: str = 'fp32',
+                 fast_preprocess: bool = False):
+        """
+        初始化批量识别
+
+        Args:
+            mode: 任务类型，ocr 或 det
+            workers: 工作进程数，None表示CPU核数，1表示在当前进程中识别
+            chunk_size: 每次提交给工作进程的图片数
+            old: 是否使用旧版OCR模型
+            beta: 是否使用beta版OCR模型
+            import_onnx_path: 自定义OCR模型路径
+            charsets_path: 自定义字符集路径
+            png_fix: 是否修复PNG透明背景问题
+            color_filter_colors: 颜色过滤预设颜色列表
+            charset_range: 字符集范围
+            session_config: 推理会话配置，多进程时未指定intra_op_num_threads则按进程数均分CPU核心
+            precision: 模型精度，fp32 或 int8
+            fast_preprocess: OCR是否使用OpenCV快速预处理路径
+
+        Raises:
+            DDDDOCRError: 当参数无效时
+        """
+        if mode not in BULK_MODES:
+            raise DDDDOCRError(f"不支持的任务类型: {mode}，可选: {', '.join(BULK_MODES)}")
+        if workers is not None and workers < 1:
+            raise DDDDOCRError("workers必须大于等于1")
+        if chunk_size < 1:
+            raise DDDDOCRError("chunk_size必须大于等于1")
+
+        cpu_count = os.cpu_count() or 1
+        self.workers = workers or cpu_count
+        self.chunk_size = chunk_size
+
+        session_config = dict(session_config or {})
+        if self.workers > 1 and session_config.get('intra_op_num_threads') is None:
+            # 每个进程各自创建线程池，默认线程数等于CPU核数会导致线程过度竞争
+            session_config['intra_op_num_threads'] = max(1, cpu_count // self.workers)
+
+        self.options = {
+            'mode': mode, 'old': old, 'beta': beta,
+            'import_onnx_path': import_onnx_path, 'charsets_path': charsets_path,
+            'png_fix': png_fix,
+            'color_filter_colors': list(color_filter_colors) if color_filter_colors else None,
+            'charset_range': charset_range,
+            'session_config': session_config or None,
+            'precision': precision,
+            'fast_preprocess': fast_preprocess
+        }
+
+    def run(self, paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        识别图片
+
+        Args:
+            paths: 图片路径，可以是逐个产生路径的迭代器
+
+        Returns:
+            按输入顺序产生的结果字典迭代器：OCR为 {'path', 'text'}，目标检测为 {'path', 'bboxes'}，
+            单张图片失败时为 {'path', 'error'}
+
+        Raises:
+            DDDDOCRError: 当模型加载失败时
+        """
+        chunks = _chunked(paths, self.chunk_size)
+        if self.workers == 1:
+            _init_worker(self.options)
+            try:
+                for chunk in chunks:
+                    yield from _process_chunk(chunk)
+            finally:
+                _worker_state.clear()
+            return
+
+        # 使用spawn启动工作进程，不继承父进程中可能已创建的推理线程池
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                       initializer=_init_worker, initargs=(self.options,))
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_process_chunk, chunk))
+                if len(pending) >= self.workers * PREFETCH_CHUNKS:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # 提前停止（如输出管道关闭）时取消尚未开始的分块
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
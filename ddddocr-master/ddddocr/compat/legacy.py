@@ -4,14 +4,16 @@
 提供与原始DdddOcr类完全兼容的接口
 """
 
-from typing import Union, List, Optional, Dict, Any, Tuple
+from typing import Union, List, Optional, Dict, Any, Sequence, Tuple
 import pathlib
 from PIL import Image
 
 from ..core.ocr_engine import OCREngine
 from ..core.detection_engine import DetectionEngine
 from ..core.slide_engine import SlideEngine
+from ..models.session_config import SessionConfig
 from ..utils.exceptions import DDDDOCRError
+from ..utils.result_cache import ResultCache
 from ..utils.validators import validate_model_config
 
 
@@ -25,7 +27,10 @@ class DdddOcr:
     
     def __init__(self, ocr: bool = True, det: bool = False, old: bool = False, beta: bool = False,
                  use_gpu: bool = False, device_id: int = 0, show_ad: bool = True, 
-                 import_onnx_path: str = "", charsets_path: str = ""):
+                 import_onnx_path: str = "", charsets_path: str = "",
+                 session_config: Optional[Union[SessionConfig, Dict[str, Any]]] = None,
+                 result_cache: Optional[Union[ResultCache, bool]] = None,
+                 precision: str = 'fp32', fast_preprocess: bool = False):
         """
         初始化DDDDOCR
         
@@ -39,6 +44,14 @@ class DdddOcr:
             show_ad: 是否显示广告信息
             import_onnx_path: 自定义ONNX模型路径
             charsets_path: 自定义字符集路径
+            session_config: ONNX运行时会话配置（SessionConfig或配置字典），
+                如 {'intra_op_num_threads': 2, 'cache_optimized_model': True}
+            result_cache: 识别结果缓存，传入ResultCache实例（可在多个实例间共享）或True使用默认配置，
+                相同图片和参数的识别直接返回缓存结果，并发的相同请求只推理一次
+            precision: 模型精度，'fp32'使用原始模型，'int8'使用ONNX运行时动态量化的模型，
+                量化模型在首次使用时生成并缓存在原模型旁（如 common_old.int8.onnx）
+            fast_preprocess: 是否使用OpenCV快速预处理路径，不经过PIL解码和缩放，速度更快，
+                但缩放插值与默认的PIL路径不同，少量图片的识别结果可能改变
         """
         # 显示广告信息（保持原有行为）
         if show_ad:
@@ -63,6 +76,13 @@ class DdddOcr:
         self.device_id = device_id
         self.import_onnx_path = import_onnx_path
         self.charsets_path = charsets_path
+        self.session_config = SessionConfig.from_value(session_config)
+        self.precision = precision
+        self.fast_preprocess = fast_preprocess
+        if result_cache is True:
+            result_cache = ResultCache()
+        # ResultCache定义了__len__，没有条目的缓存为假值，须按类型判断而不能依赖真值
+        self.result_cache = result_cache if isinstance(result_cache, ResultCache) else None
         
         # 初始化引擎
         self.ocr_engine: Optional[OCREngine] = None
@@ -73,7 +93,7 @@ class DdddOcr:
         if det:
             # 目标检测模式
             self.det = True
-            self.detection_engine = DetectionEngine(use_gpu, device_id)
+            self.detection_engine = DetectionEngine(use_gpu, device_id, self.session_config, precision=precision)
         elif ocr or import_onnx_path:
             # OCR模式
             self.det = False
@@ -83,11 +103,18 @@ class DdddOcr:
                 old=old,
                 beta=beta,
                 import_onnx_path=import_onnx_path,
-                charsets_path=charsets_path
+                charsets_path=charsets_path,
+                session_config=self.session_config,
+                precision=precision,
+                fast_preprocess=fast_preprocess
             )
         else:
             # 滑块模式
             self.det = False
+        
+        for engine in (self.ocr_engine, self.detection_engine):
+            if engine is not None:
+                engine.result_cache = self.result_cache
             
         # 滑块引擎总是可用
         self.slide_engine = SlideEngine()
@@ -95,7 +122,9 @@ class DdddOcr:
     def classification(self, img: Union[bytes, str, pathlib.PurePath, Image.Image], 
                       png_fix: bool = False, probability: bool = False,
                       color_filter_colors: Optional[List[str]] = None,
-                      color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None) -> Union[str, Dict[str, Any]]:
+                      color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+                      charset_range: Optional[Union[int, str, List[str]]] = None,
+                      top_k: Optional[int] = None, probability_encoding: str = 'list') -> Union[str, Dict[str, Any]]:
         """
         OCR识别方法
         
@@ -105,6 +134,9 @@ class DdddOcr:
             probability: 是否返回概率信息
             color_filter_colors: 颜色过滤预设颜色列表，如 ['red', 'blue']
             color_filter_custom_ranges: 自定义HSV颜色范围列表，如 [((0,50,50), (10,255,255))]
+            charset_range: 本次识别的字符集范围，不影响set_ranges设置的默认范围，可在多线程中安全使用
+            top_k: 设置后返回紧凑的置信度信息（每个字符前k个候选及概率），代替完整概率矩阵
+            probability_encoding: 概率数组编码方式，'list'或'float16'（base64编码的二进制数据）
         
         Returns:
             识别结果文本或包含概率信息的字典
@@ -123,9 +155,58 @@ class DdddOcr:
             png_fix=png_fix,
             probability=probability,
             color_filter_colors=color_filter_colors,
-            color_filter_custom_ranges=color_filter_custom_ranges
+            color_filter_custom_ranges=color_filter_custom_ranges,
+            charset_range=charset_range,
+            top_k=top_k,
+            probability_encoding=probability_encoding
         )
-    
+
+    def classification_batch(self, imgs: List[Union[bytes, str, pathlib.PurePath, Image.Image]],
+                             png_fix: bool = False, probability: bool = False,
+                             color_filter_colors: Optional[List[str]] = None,
+                             color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+                             charset_range: Optional[Union[int, str, List[str]]] = None,
+                             top_k: Optional[int] = None,
+                             probability_encoding: str = 'list',
+                             use_cache: bool = True) -> List[Union[str, Dict[str, Any]]]:
+        """
+        批量OCR识别方法
+
+        Args:
+            imgs: 图片数据列表
+            png_fix: 是否修复PNG透明背景问题
+            probability: 是否返回概率信息
+            color_filter_colors: 颜色过滤预设颜色列表
+            color_filter_custom_ranges: 自定义HSV颜色范围列表
+            charset_range: 本次识别的字符集范围
+            top_k: 设置后返回每个字符前k个候选及概率
+            probability_encoding: 概率数组编码方式
+            use_cache: 是否使用结果缓存，外层已通过同一缓存合并请求时需传False
+
+        Returns:
+            与输入顺序一致的识别结果列表
+
+        Raises:
+            DDDDOCRError: 当功能未启用或识别失败时
+        """
+        if self.det:
+            raise DDDDOCRError("当前识别类型为目标检测")
+
+        if not self.ocr_engine:
+            raise DDDDOCRError("OCR功能未初始化")
+
+        return self.ocr_engine.predict_batch(
+            images=imgs,
+            png_fix=png_fix,
+            probability=probability,
+            color_filter_colors=color_filter_colors,
+            color_filter_custom_ranges=color_filter_custom_ranges,
+            charset_range=charset_range,
+            top_k=top_k,
+            probability_encoding=probability_encoding,
+            use_cache=use_cache
+        )
+
     def detection(self, img: Union[bytes, str, pathlib.PurePath, Image.Image]) -> List[List[int]]:
         """
         目标检测方法
@@ -146,10 +227,35 @@ class DdddOcr:
             raise DDDDOCRError("目标检测功能未初始化")
         
         return self.detection_engine.predict(img)
+
+    def detection_batch(self, imgs: List[Union[bytes, str, pathlib.PurePath, Image.Image]],
+                        use_cache: bool = True) -> List[List[List[int]]]:
+        """
+        批量目标检测方法
+
+        Args:
+            imgs: 图片数据列表
+            use_cache: 是否使用结果缓存，外层已通过同一缓存合并请求时需传False
+
+        Returns:
+            与输入顺序一致的边界框列表
+
+        Raises:
+            DDDDOCRError: 当功能未启用或检测失败时
+        """
+        if not self.det:
+            raise DDDDOCRError("当前识别类型为OCR")
+
+        if not self.detection_engine:
+            raise DDDDOCRError("目标检测功能未初始化")
+
+        return self.detection_engine.detect_batch(imgs, use_cache=use_cache)
     
     def slide_match(self, target_img: Union[bytes, str, pathlib.PurePath, Image.Image],
                    background_img: Union[bytes, str, pathlib.PurePath, Image.Image],
-                   simple_target: bool = False) -> Dict[str, Any]:
+                   simple_target: bool = False, mode: str = 'exact',
+                   roi: Optional[Sequence[int]] = None, row_band: Optional[Sequence[int]] = None,
+                   tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         滑块匹配方法
         
@@ -157,6 +263,11 @@ class DdddOcr:
             target_img: 滑块图片
             background_img: 背景图片
             simple_target: 是否为简单滑块
+            mode: 匹配模式，exact为全分辨率匹配，pyramid为先缩小粗匹配再在全分辨率小窗口内精匹配
+            roi: 只在背景图的该区域 (x, y, width, height) 内搜索
+            row_band: 只在背景图的该行范围 (y_start, y_end) 内搜索
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
             
         Returns:
             匹配结果字典
@@ -167,16 +278,58 @@ class DdddOcr:
         if not self.slide_engine:
             raise DDDDOCRError("滑块功能未初始化")
         
-        return self.slide_engine.slide_match(target_img, background_img, simple_target)
+        return self.slide_engine.slide_match(target_img, background_img, simple_target, mode=mode,
+                                             roi=roi, row_band=row_band, tolerance=tolerance,
+                                             pyramid_scale=pyramid_scale)
+    
+    def slide_match_batch(self, pairs: List[Tuple[Union[bytes, str, pathlib.PurePath, Image.Image],
+                                                  Union[bytes, str, pathlib.PurePath, Image.Image]]],
+                          simple_target: bool = False, mode: str = 'exact',
+                          roi: Optional[Sequence[int]] = None, row_band: Optional[Sequence[int]] = None,
+                          tolerance: int = 2, pyramid_scale: float = 0.5,
+                          max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        批量滑块匹配方法
+        
+        Args:
+            pairs: (滑块图片, 背景图片) 列表
+            simple_target: 是否为简单滑块
+            mode: 匹配模式（exact或pyramid）
+            roi: 搜索区域 (x, y, width, height)
+            row_band: 搜索的行范围 (y_start, y_end)
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
+            max_workers: 并行线程数
+            
+        Returns:
+            与输入顺序一致的匹配结果列表
+            
+        Raises:
+            DDDDOCRError: 当匹配失败时
+        """
+        if not self.slide_engine:
+            raise DDDDOCRError("滑块功能未初始化")
+        
+        return self.slide_engine.slide_match_batch(pairs, simple_target=simple_target, mode=mode,
+                                                   roi=roi, row_band=row_band, tolerance=tolerance,
+                                                   pyramid_scale=pyramid_scale, max_workers=max_workers)
     
     def slide_comparison(self, target_img: Union[bytes, str, pathlib.PurePath, Image.Image],
-                        background_img: Union[bytes, str, pathlib.PurePath, Image.Image]) -> Dict[str, Any]:
+                        background_img: Union[bytes, str, pathlib.PurePath, Image.Image],
+                        mode: str = 'exact', roi: Optional[Sequence[int]] = None,
+                        row_band: Optional[Sequence[int]] = None,
+                        tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         滑块比较方法
         
         Args:
             target_img: 带坑位的图片
             background_img: 完整背景图片
+            mode: 比较模式，exact为全分辨率比较，pyramid为先缩小定位缺口再在全分辨率窗口内比较
+            roi: 只比较该区域 (x, y, width, height)
+            row_band: 只比较该行范围 (y_start, y_end)
+            tolerance: 金字塔模式缺口窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式定位缺口的缩放比例
             
         Returns:
             比较结果字典
@@ -187,7 +340,9 @@ class DdddOcr:
         if not self.slide_engine:
             raise DDDDOCRError("滑块功能未初始化")
         
-        return self.slide_engine.slide_comparison(target_img, background_img)
+        return self.slide_engine.slide_comparison(target_img, background_img, mode=mode, roi=roi,
+                                                  row_band=row_band, tolerance=tolerance,
+                                                  pyramid_scale=pyramid_scale)
     
     def set_ranges(self, charset_range: Union[int, str, List[str]]) -> None:
         """
@@ -254,7 +409,9 @@ class DdddOcr:
             'ocr_enabled': self.ocr_enabled,
             'det_enabled': self.det_enabled,
             'use_gpu': self.use_gpu,
-            'device_id': self.device_id
+            'device_id': self.device_id,
+            'precision': self.precision,
+            'fast_preprocess': self.fast_preprocess
         }
         
         if self.ocr_engine:
@@ -263,17 +420,21 @@ class DdddOcr:
         if self.detection_engine:
             info['detection_model'] = self.detection_engine.get_model_info()
         
+        if self.result_cache is not None:
+            info['result_cache'] = self.result_cache.stats()
+        
         return info
     
     def cleanup(self) -> None:
         """清理所有资源"""
-        if self.ocr_engine:
+        # 构造过程中参数校验失败时引擎属性可能尚未创建
+        if getattr(self, 'ocr_engine', None):
             self.ocr_engine.cleanup()
         
-        if self.detection_engine:
+        if getattr(self, 'detection_engine', None):
             self.detection_engine.cleanup()
         
-        if self.slide_engine:
+        if getattr(self, 'slide_engine', None):
             self.slide_engine.cleanup()
     
     def __del__(self):
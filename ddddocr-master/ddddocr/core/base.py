@@ -5,29 +5,87 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 import onnxruntime
 
 from ..models.model_loader import ModelLoader
+from ..models.session_config import SessionConfig
+from ..models.session_registry import SharedSession
+from ..utils.result_cache import ResultCache
 from ..utils.exceptions import ModelLoadError
 
 
 class BaseEngine(ABC):
     """基础引擎抽象类"""
     
-    def __init__(self, use_gpu: bool = False, device_id: int = 0):
+    def __init__(self, use_gpu: bool = False, device_id: int = 0,
+                 session_config: Optional[Union[SessionConfig, Dict[str, Any]]] = None,
+                 precision: str = 'fp32'):
         """
         初始化基础引擎
         
         Args:
             use_gpu: 是否使用GPU
             device_id: GPU设备ID
+            session_config: 推理会话配置
+            precision: 模型精度，'fp32'或'int8'
         """
         self.use_gpu = use_gpu
         self.device_id = device_id
-        self.model_loader = ModelLoader(use_gpu, device_id)
-        self.session: Optional[onnxruntime.InferenceSession] = None
+        self.model_loader = ModelLoader(use_gpu, device_id, session_config, precision)
+        self._session: Optional[onnxruntime.InferenceSession] = None
+        self._session_handle: Optional[SharedSession] = None
         self.is_initialized = False
+        # 可选的识别结果缓存，可在多个引擎之间共享
+        self.result_cache: Optional[ResultCache] = None
+    
+    @property
+    def session(self) -> Optional[onnxruntime.InferenceSession]:
+        """
+        推理会话，使用共享会话句柄时在首次访问时创建
+        
+        Returns:
+            ONNX推理会话对象
+        """
+        handle = getattr(self, '_session_handle', None)
+        if handle is not None:
+            return handle.get()
+        return getattr(self, '_session', None)
+    
+    @session.setter
+    def session(self, session: Optional[onnxruntime.InferenceSession]) -> None:
+        self._release_session()
+        self._session = session
+    
+    def _acquire_session(self, model_path: str) -> None:
+        """
+        从会话注册表获取共享会话句柄，替换当前会话
+        
+        Args:
+            model_path: 模型文件路径
+        """
+        handle = self.model_loader.acquire_session(model_path)
+        self._release_session()
+        self._session = None
+        self._session_handle = handle
+    
+    def _release_session(self) -> None:
+        """释放持有的共享会话句柄"""
+        handle = getattr(self, '_session_handle', None)
+        if handle is not None:
+            self._session_handle = None
+            handle.release()
+    
+    def cache_namespace(self) -> Tuple:
+        """
+        结果缓存中区分模型的标识，子类可追加影响输出的模型配置
+        
+        Returns:
+            由引擎类型和模型路径组成的元组
+        """
+        handle = getattr(self, '_session_handle', None)
+        model = handle.model_path if handle is not None else id(self._session)
+        return (type(self).__name__, model)
     
     @abstractmethod
     def initialize(self, **kwargs) -> None:
@@ -63,7 +121,7 @@ class BaseEngine(ABC):
         Returns:
             模型信息字典
         """
-        if self.session:
+        if self.is_ready():
             return self.model_loader.get_model_info(self.session)
         return {'error': '模型未加载'}
     
@@ -74,7 +132,8 @@ class BaseEngine(ABC):
         Returns:
             是否就绪
         """
-        return self.is_initialized and self.session is not None
+        has_session = self._session_handle is not None or self._session is not None
+        return self.is_initialized and has_session
     
     def switch_device(self, use_gpu: bool, device_id: int = 0) -> None:
         """
@@ -99,9 +158,8 @@ class BaseEngine(ABC):
     
     def cleanup(self) -> None:
         """清理资源"""
-        if self.session:
-            del self.session
-            self.session = None
+        self._release_session()
+        self._session = None
         self.is_initialized = False
     
     def __del__(self):
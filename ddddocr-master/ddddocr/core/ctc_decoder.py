@@ -0,0 +1,173 @@
+# coding=utf-8
+"""
+CTC解码模块
+基于NumPy数组运算的CTC贪心解码，支持单张及batch输出
+"""
+
+from typing import List, Optional, Sequence
+import numpy as np
+
+
+class CTCDecoder:
+    """CTC贪心解码器"""
+
+    def __init__(self, charset: Sequence[str], blank_index: int = 0):
+        """
+        初始化解码器
+
+        Args:
+            charset: 字符集，索引与模型输出类别一一对应
+            blank_index: blank字符索引
+        """
+        self.blank_index = blank_index
+        self.num_chars = len(charset)
+        # 预先构建索引到字符的查找表，解码时直接按索引取值
+        self.char_table = np.array(list(charset), dtype=object)
+
+    def decode(self, output: np.ndarray, valid_indices: Optional[np.ndarray] = None) -> str:
+        """
+        解码单张图像的模型输出
+
+        Args:
+            output: 模型输出，形状为(T, C)、(C,)或batch为1的三维数组
+            valid_indices: 允许输出的类别索引数组，None表示不限制
+
+        Returns:
+            解码后的文本
+        """
+        if len(output.shape) == 3:
+            return self.decode_batch(output, 1, valid_indices)[0]
+
+        if len(output.shape) == 1:
+            output = output[np.newaxis, :]
+
+        indices = self.argmax(output, valid_indices)
+        return self.indices_to_text(self.collapse(indices))
+
+    def decode_batch(self, output: np.ndarray, batch_size: int,
+                     valid_indices: Optional[np.ndarray] = None,
+                     lengths: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        解码batch模型输出
+
+        Args:
+            output: 模型输出，形状为(T, N, C)或(N, T, C)
+            batch_size: batch大小N，用于判断输出布局
+            valid_indices: 允许输出的类别索引数组，None表示不限制
+            lengths: 每行的有效时间步数，None表示全部有效
+
+        Returns:
+            每行解码后的文本列表
+        """
+        output = self.to_batch_major(output, batch_size)
+        indices = self.argmax(output, valid_indices)
+
+        keep = self._keep_mask(indices)
+        if lengths is not None:
+            steps = np.arange(indices.shape[1])
+            keep &= steps[np.newaxis, :] < np.asarray(lengths)[:, np.newaxis]
+
+        return [self.indices_to_text(row[mask]) for row, mask in zip(indices, keep)]
+
+    @staticmethod
+    def to_batch_major(output: np.ndarray, batch_size: int) -> np.ndarray:
+        """
+        将三维输出统一为(N, T, C)布局
+
+        Args:
+            output: 形状为(T, N, C)或(N, T, C)的模型输出
+            batch_size: batch大小N
+
+        Returns:
+            (N, T, C)布局的数组视图
+        """
+        if output.shape[1] == batch_size and output.shape[0] != batch_size:
+            return output.transpose(1, 0, 2)
+        if output.shape[0] == batch_size:
+            return output
+        # 无法区分时按内置模型的(T, N, C)布局处理
+        return output.transpose(1, 0, 2)
+
+    def argmax(self, logits: np.ndarray, valid_indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        在允许的类别上取argmax
+
+        Args:
+            logits: 最后一维为类别的输出数组
+            valid_indices: 允许输出的类别索引数组，None表示不限制
+
+        Returns:
+            每个时间步的类别索引
+        """
+        if valid_indices is None:
+            return np.argmax(logits, axis=-1)
+
+        valid_indices = valid_indices[valid_indices < logits.shape[-1]]
+        if len(valid_indices) == 0:
+            return np.full(logits.shape[:-1], self.blank_index, dtype=np.int64)
+
+        # 只在允许的列上取最大值，再映射回原始类别索引
+        return valid_indices[np.argmax(logits[..., valid_indices], axis=-1)]
+
+    def collapse(self, indices: np.ndarray) -> np.ndarray:
+        """
+        去除连续重复和blank字符
+
+        Args:
+            indices: 一维类别索引数组
+
+        Returns:
+            解码后的类别索引数组
+        """
+        indices = np.asarray(indices).reshape(-1)
+        if len(indices) == 0:
+            return indices
+        return indices[self._keep_mask(indices[np.newaxis, :])[0]]
+
+    def emit_positions(self, indices: np.ndarray) -> np.ndarray:
+        """
+        计算输出字符所在的时间步（每段连续重复字符的第一个时间步）
+
+        Args:
+            indices: 一维类别索引数组
+
+        Returns:
+            时间步位置数组，与collapse的结果一一对应
+        """
+        indices = np.asarray(indices).reshape(-1)
+        if len(indices) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self._keep_mask(indices[np.newaxis, :])[0])
+
+    def _keep_mask(self, indices: np.ndarray) -> np.ndarray:
+        """
+        计算二维索引数组中需要保留的位置
+
+        Args:
+            indices: 形状为(N, T)的类别索引数组
+
+        Returns:
+            形状为(N, T)的布尔数组
+        """
+        keep = np.ones(indices.shape, dtype=bool)
+        keep[:, 1:] = indices[:, 1:] != indices[:, :-1]
+        keep &= indices != self.blank_index
+        keep &= (indices >= 0) & (indices < self.num_chars)
+        return keep
+
+    def indices_to_text(self, indices: np.ndarray) -> str:
+        """
+        将类别索引转换为文本
+
+        Args:
+            indices: 已解码的类别索引数组
+
+        Returns:
+            文本
+        """
+        if len(indices) == 0:
+            return ''
+        return ''.join(self.char_table[indices])
+
+    def __repr__(self) -> str:
+        return f"CTCDecoder(size={self.num_chars}, blank={self.blank_index})"
@@ -4,31 +4,71 @@
 提供目标检测功能
 """
 
-from typing import Union, List, Tuple
+import threading
+from typing import Union, List, Tuple, Optional, Dict, Any
 import numpy as np
 from PIL import Image
 
 from .base import BaseEngine
-from ..utils.image_io import load_image_from_input, image_to_numpy
-from ..utils.exceptions import ModelLoadError, ImageProcessError, safe_import_opencv
+from ..models.session_config import SessionConfig
+from ..preprocessing.image_processor import ImageProcessor
+from ..utils.image_io import load_image_from_input
+from ..utils.exceptions import DDDDOCRError, ModelLoadError, ImageProcessError, safe_import_opencv
+from ..utils.result_cache import ResultCache
+from ..utils.stage_timer import timed_stage
 from ..utils.validators import validate_image_input
 
 # 安全导入OpenCV
 cv2 = safe_import_opencv()
 
 
+class _SessionMeta:
+    """推理会话的输入元数据，会话创建后缓存以免每次推理查询"""
+
+    __slots__ = ('session', 'input_name', 'dynamic_batch')
+
+    def __init__(self, session):
+        model_input = session.get_inputs()[0]
+        batch_dim = model_input.shape[0]
+        self.session = session
+        self.input_name = model_input.name
+        self.dynamic_batch = not (isinstance(batch_dim, int) and batch_dim == 1)
+
+
 class DetectionEngine(BaseEngine):
     """目标检测引擎"""
 
-    def __init__(self, use_gpu: bool = False, device_id: int = 0):
+    # 默认模型输入尺寸 (height, width)
+    DEFAULT_INPUT_SIZE = (416, 416)
+
+    # 候选框数量不超过该值时使用矩阵形式的向量化NMS，否则逐框循环以限制内存占用
+    NMS_MATRIX_LIMIT = 2048
+
+    # 多图像合并NMS的IoU矩阵元素上限，超过时逐图像计算（大矩阵跨图像合并不再更快）
+    NMS_BATCH_LIMIT = 1 << 18
+
+    # 各输入尺寸对应的网格与步长，所有实例共享
+    _grid_cache: Dict[Tuple[int, int, bool], Tuple[np.ndarray, np.ndarray]] = {}
+    _grid_lock = threading.Lock()
+
+    def __init__(self, use_gpu: bool = False, device_id: int = 0,
+                 session_config: Optional[Union[SessionConfig, Dict[str, Any]]] = None,
+                 input_size: Union[int, Tuple[int, int]] = DEFAULT_INPUT_SIZE,
+                 precision: str = 'fp32'):
         """
         初始化检测引擎
 
         Args:
             use_gpu: 是否使用GPU
             device_id: GPU设备ID
+            session_config: 推理会话配置
+            input_size: 模型输入尺寸，整数或(height, width)，需为32的倍数
+            precision: 模型精度，'fp32'使用原始模型，'int8'使用动态量化模型
         """
-        super().__init__(use_gpu, device_id)
+        super().__init__(use_gpu, device_id, session_config, precision)
+        self.input_size = self._normalize_input_size(input_size)
+        self._buffers = threading.local()
+        self._session_meta: Optional[_SessionMeta] = None
         self.initialize()
 
     def initialize(self, **kwargs) -> None:
@@ -39,19 +79,21 @@ class DetectionEngine(BaseEngine):
             ModelLoadError: 当初始化失败时
         """
         try:
-            # 加载检测模型
-            self.session = self.model_loader.load_detection_model()
+            # 加载检测模型（共享会话，首次推理时创建）
+            self._acquire_session(self.model_loader.get_detection_model_path())
             self.is_initialized = True
 
         except Exception as e:
             raise ModelLoadError(f"检测引擎初始化失败: {str(e)}") from e
 
-    def predict(self, image: Union[bytes, str, Image.Image]) -> List[List[int]]:
+    def predict(self, image: Union[bytes, str, Image.Image, np.ndarray],
+                input_size: Optional[Union[int, Tuple[int, int]]] = None) -> List[List[int]]:
         """
         执行目标检测
 
         Args:
-            image: 输入图像
+            image: 输入图像，numpy数组按RGB（或RGBA、灰度）通道顺序处理
+            input_size: 本次检测使用的模型输入尺寸，None表示使用引擎默认尺寸
 
         Returns:
             检测到的边界框列表，每个边界框格式为[x1, y1, x2, y2]
@@ -65,68 +107,497 @@ class DetectionEngine(BaseEngine):
 
         # 验证输入
         validate_image_input(image)
+        size = self.input_size if input_size is None else self._normalize_input_size(input_size)
 
+        if self.result_cache is not None:
+            return self.result_cache.get_or_compute(self.cache_key(image, size),
+                                                    lambda: self._predict(image, size))
+        return self._predict(image, size)
+
+    def _predict(self, image: Union[bytes, str, Image.Image, np.ndarray],
+                 size: Tuple[int, int]) -> List[List[int]]:
+        """执行单张图片的目标检测（不经过结果缓存）"""
         try:
-            # 直接使用原始的get_bbox方法
-            if isinstance(image, bytes):
-                return self.get_bbox(image)
-            elif isinstance(image, Image.Image):
-                import io
-                img_bytes = io.BytesIO()
-                image.save(img_bytes, format='PNG')
-                return self.get_bbox(img_bytes.getvalue())
-            else:
-                # 其他类型先转换为PIL Image再处理
-                pil_image = load_image_from_input(image)
-                import io
-                img_bytes = io.BytesIO()
-                pil_image.save(img_bytes, format='PNG')
-                return self.get_bbox(img_bytes.getvalue())
+            return self._detect(self._decode_image(image), size)
 
         except Exception as e:
             raise ImageProcessError(f"目标检测失败: {str(e)}") from e
 
-    def preproc(self, img, input_size, swap=(2, 0, 1)):
-        """预处理函数（来自原始代码）"""
-        if len(img.shape) == 3:
-            padded_img = np.ones((input_size[0], input_size[1], 3), dtype=np.uint8) * 114
-        else:
-            padded_img = np.ones(input_size, dtype=np.uint8) * 114
+    def detect_batch(self, images: List[Union[bytes, str, Image.Image, np.ndarray]],
+                     input_size: Optional[Union[int, Tuple[int, int]]] = None,
+                     use_cache: bool = True) -> List[List[List[int]]]:
+        """
+        批量执行目标检测
+
+        所有图像按相同输入尺寸预处理后堆叠为一个NCHW张量，只调用一次推理会话，
+        再对全部候选框执行一次向量化NMS（不同图像的候选框互不抑制）
+
+        Args:
+            images: 输入图像列表
+            input_size: 本次检测使用的模型输入尺寸，None表示使用引擎默认尺寸
+            use_cache: 是否使用引擎的结果缓存。调用方已在外层通过缓存合并相同请求时需传False，
+                否则内层会等待外层持有的同一个缓存键而无法完成
+
+        Returns:
+            与输入顺序一致的边界框列表，每张图像的结果格式与predict相同
+
+        Raises:
+            ImageProcessError: 当图像处理失败时
+            ModelLoadError: 当模型未初始化时
+        """
+        if not self.is_ready():
+            raise ModelLoadError("检测引擎未初始化")
+
+        images = list(images)
+        if not images:
+            return []
+
+        for image in images:
+            validate_image_input(image)
+        size = self.input_size if input_size is None else self._normalize_input_size(input_size)
+
+        if use_cache and self.result_cache is not None:
+            # 只对未命中缓存的图片执行一次批量推理
+            keys = [self.cache_key(image, size) for image in images]
+            return self.result_cache.get_or_compute_many(keys, images,
+                                                         lambda misses: self._detect_batch(misses, size))
+        return self._detect_batch(images, size)
+
+    def _detect_batch(self, images: List[Union[bytes, str, Image.Image, np.ndarray]],
+                      size: Tuple[int, int]) -> List[List[List[int]]]:
+        """批量执行目标检测（不经过结果缓存）"""
+        try:
+            decoded = [self._decode_image(image) for image in images]
+
+            # 模型输入batch维度固定为1时逐张推理
+            if not self._supports_batch() or len(decoded) == 1:
+                return [self._detect(img, size) for img in decoded]
+
+            tensor = np.empty((len(decoded), 3, *size), dtype=np.float32)
+            ratios = np.empty(len(decoded), dtype=np.float32)
+            for i, img in enumerate(decoded):
+                _, ratios[i] = self.preproc(img, size, out=tensor[i])
+
+            predictions = self.demo_postprocess(self._run_session(tensor), size)
+            return self._postprocess_batch(predictions, ratios, [img.shape for img in decoded])
+
+        except Exception as e:
+            raise ImageProcessError(f"批量目标检测失败: {str(e)}") from e
+
+    def cache_key(self, image: Union[bytes, str, Image.Image, np.ndarray],
+                  input_size: Optional[Union[int, Tuple[int, int]]] = None) -> Optional[Tuple]:
+        """
+        生成检测结果的缓存键
+
+        Args:
+            image: 输入图像
+            input_size: 模型输入尺寸，None表示使用引擎默认尺寸
+
+        Returns:
+            缓存键，输入类型无法计算哈希时返回None
+        """
+        size = self.input_size if input_size is None else self._normalize_input_size(input_size)
+        return ResultCache.make_key(self.cache_namespace(), image, input_size=size)
+
+    def set_input_size(self, input_size: Union[int, Tuple[int, int]]) -> None:
+        """
+        设置默认模型输入尺寸
+
+        Args:
+            input_size: 整数或(height, width)，需为32的倍数
+        """
+        self.input_size = self._normalize_input_size(input_size)
+
+    @staticmethod
+    def _normalize_input_size(input_size: Union[int, Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        规范化并校验输入尺寸
+
+        Args:
+            input_size: 整数或(height, width)
+
+        Returns:
+            (height, width)
+
+        Raises:
+            DDDDOCRError: 当尺寸无效时
+        """
+        if isinstance(input_size, int):
+            input_size = (input_size, input_size)
+        try:
+            height, width = (int(v) for v in input_size)
+        except (TypeError, ValueError):
+            raise DDDDOCRError(f"无效的检测输入尺寸: {input_size}")
+        if height <= 0 or width <= 0 or height % 32 or width % 32:
+            raise DDDDOCRError(f"检测输入尺寸必须为32的正整数倍: {input_size}")
+        return height, width
+
+    @timed_stage('decode')
+    def _decode_image(self, image: Union[bytes, str, Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        将输入解码为BGR数组，OpenCV无法直接处理的输入经PIL转换
+
+        Args:
+            image: 输入图像
+
+        Returns:
+            (H, W, 3)的uint8 BGR数组
+        """
+        img = ImageProcessor.decode_to_bgr(image)
+        if img is None and not isinstance(image, bytes):
+            pil_image = load_image_from_input(image).convert('RGB')
+            img = ImageProcessor.decode_to_bgr(pil_image)
+        if img is None:
+            raise ImageProcessError("图像解码失败")
+        return img
+
+    def _supports_batch(self) -> bool:
+        """
+        检查模型输入的batch维度是否为动态维度
+
+        Returns:
+            是否支持batch大于1的输入
+        """
+        return self._meta().dynamic_batch
+
+    def _meta(self) -> _SessionMeta:
+        """
+        获取当前推理会话的元数据，会话变化（如重新加载模型）后重新读取
+
+        Returns:
+            会话元数据
+        """
+        session = self.session
+        meta = self._session_meta
+        if meta is None or meta.session is not session:
+            meta = _SessionMeta(session)
+            self._session_meta = meta
+        return meta
+
+    def _input_buffer(self, input_size: Tuple[int, int], channels: int = 3) -> np.ndarray:
+        """
+        获取当前线程复用的(1, C, H, W)输入缓冲区
+
+        Args:
+            input_size: (height, width)
+            channels: 通道数
+
+        Returns:
+            float32输入缓冲区
+        """
+        buffers = getattr(self._buffers, 'inputs', None)
+        if buffers is None:
+            buffers = self._buffers.inputs = {}
+        key = (channels, *input_size)
+        buffer = buffers.get(key)
+        if buffer is None:
+            buffer = buffers[key] = np.empty((1, *key), dtype=np.float32)
+        return buffer
+
+    def _detect(self, img: np.ndarray, input_size: Tuple[int, int]) -> List[List[int]]:
+        """
+        对已解码的BGR图像执行检测
+
+        Args:
+            img: (H, W, 3)的uint8 BGR数组
+            input_size: (height, width)
+
+        Returns:
+            边界框列表
+        """
+        tensor = self._input_buffer(input_size)
+        _, ratio = self.preproc(img, input_size, out=tensor[0])
+        predictions = self.demo_postprocess(self._run_session(tensor), input_size)[0]
+        return self._postprocess(predictions, ratio, img.shape)
+
+    @timed_stage('inference')
+    def _run_session(self, tensor: np.ndarray) -> np.ndarray:
+        """
+        调用推理会话
+
+        Args:
+            tensor: 形状为(N, 3, H, W)的输入张量
+
+        Returns:
+            模型第一个输出
+        """
+        meta = self._meta()
+        return meta.session.run(None, {meta.input_name: tensor})[0]
+
+    @timed_stage('preprocess')
+    def preproc(self, img, input_size, swap=(2, 0, 1), out=None):
+        """
+        预处理函数：等比缩放后填充到输入尺寸（填充值114）
+
+        Args:
+            img: (H, W, C)或(H, W)的uint8图像
+            input_size: (height, width)
+            swap: 输出轴顺序，默认HWC转CHW
+            out: 可复用的float32输出缓冲区，形状需与输出一致，None时新分配
+
+        Returns:
+            (预处理后的float32数组, 缩放比例)
+        """
+        if img.ndim == 2:
+            img = img[:, :, None]
         r = min(input_size[0] / img.shape[0], input_size[1] / img.shape[1])
-        resized_img = cv2.resize(
-            img,
-            (int(img.shape[1] * r), int(img.shape[0] * r)),
-            interpolation=cv2.INTER_LINEAR,
-        ).astype(np.uint8)
-        padded_img[: int(img.shape[0] * r), : int(img.shape[1] * r)] = resized_img
-        padded_img = padded_img.transpose(swap)
-        padded_img = np.ascontiguousarray(padded_img, dtype=np.float32)
-        return padded_img, r
+        resized_h, resized_w = int(img.shape[0] * r), int(img.shape[1] * r)
+        resized_img = cv2.resize(img, (resized_w, resized_h), interpolation=cv2.INTER_LINEAR)
+        if resized_img.ndim == 2:
+            resized_img = resized_img[:, :, None]
+
+        hwc_shape = (input_size[0], input_size[1], img.shape[2])
+        if out is None:
+            out = np.empty(tuple(hwc_shape[i] for i in swap), dtype=np.float32)
+        # 以HWC视图写入输出缓冲区，缩放结果与填充区域各写一次，无需中间填充图
+        padded = out.transpose(np.argsort(swap))
+        padded[:resized_h, :resized_w] = resized_img
+        padded[:resized_h, resized_w:] = 114
+        padded[resized_h:] = 114
+        return out, r
+
+    @classmethod
+    def _get_grids(cls, img_size: Tuple[int, int], p6: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        获取指定输入尺寸的网格坐标与步长（按尺寸缓存）
+
+        Args:
+            img_size: (height, width)
+            p6: 是否包含步长64的输出层
+
+        Returns:
+            (形状为(1, N, 2)的网格, 形状为(1, N, 1)的步长)
+        """
+        key = (int(img_size[0]), int(img_size[1]), bool(p6))
+        cached = cls._grid_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with cls._grid_lock:
+            cached = cls._grid_cache.get(key)
+            if cached is None:
+                grids = []
+                expanded_strides = []
+                strides = [8, 16, 32, 64] if p6 else [8, 16, 32]
+                for stride in strides:
+                    hsize, wsize = key[0] // stride, key[1] // stride
+                    xv, yv = np.meshgrid(np.arange(wsize), np.arange(hsize))
+                    grid = np.stack((xv, yv), 2).reshape(1, -1, 2)
+                    grids.append(grid)
+                    expanded_strides.append(np.full((*grid.shape[:2], 1), stride))
+                cached = (np.concatenate(grids, 1).astype(np.float32),
+                          np.concatenate(expanded_strides, 1).astype(np.float32))
+                for array in cached:
+                    array.setflags(write=False)
+                cls._grid_cache[key] = cached
+            return cached
 
+    @timed_stage('postprocess')
     def demo_postprocess(self, outputs, img_size, p6=False):
-        """后处理函数（来自原始代码）"""
-        grids = []
-        expanded_strides = []
-        if not p6:
-            strides = [8, 16, 32]
-        else:
-            strides = [8, 16, 32, 64]
-        hsizes = [img_size[0] // stride for stride in strides]
-        wsizes = [img_size[1] // stride for stride in strides]
-        for hsize, wsize, stride in zip(hsizes, wsizes, strides):
-            xv, yv = np.meshgrid(np.arange(wsize), np.arange(hsize))
-            grid = np.stack((xv, yv), 2).reshape(1, -1, 2)
-            grids.append(grid)
-            shape = grid.shape[:2]
-            expanded_strides.append(np.full((*shape, 1), stride))
-        grids = np.concatenate(grids, 1)
-        expanded_strides = np.concatenate(expanded_strides, 1)
+        """后处理函数：将网格偏移与对数尺寸还原为输入尺寸下的中心点和宽高"""
+        grids, expanded_strides = self._get_grids(img_size, p6)
         outputs[..., :2] = (outputs[..., :2] + grids) * expanded_strides
         outputs[..., 2:4] = np.exp(outputs[..., 2:4]) * expanded_strides
         return outputs
 
+    @timed_stage('postprocess')
+    def _postprocess(self, predictions: np.ndarray, ratio: float,
+                     image_shape: Tuple[int, ...]) -> List[List[int]]:
+        """
+        将单张图片的预测结果转换为原图坐标下的边界框
+
+        Args:
+            predictions: 形状为(N, 5 + 类别数)的预测结果
+            ratio: 预处理缩放比例
+            image_shape: 原图形状
+
+        Returns:
+            边界框列表
+        """
+        boxes_xyxy, scores = self._decode_predictions(predictions)
+        boxes_xyxy /= ratio
+        pred = self.multiclass_nms(boxes_xyxy, scores, nms_thr=0.45, score_thr=0.1)
+        if pred is None or len(pred) == 0:
+            return []
+        return self._clip_boxes(pred[:, :4], image_shape[1], image_shape[0])
+
+    @timed_stage('postprocess')
+    def _postprocess_batch(self, predictions: np.ndarray, ratios: np.ndarray,
+                           image_shapes: List[Tuple[int, ...]]) -> List[List[List[int]]]:
+        """
+        将一个batch的预测结果转换为各图像原图坐标下的边界框
+
+        Args:
+            predictions: 形状为(B, N, 5 + 类别数)的预测结果
+            ratios: 各图像的预处理缩放比例
+            image_shapes: 各图像的原图形状
+
+        Returns:
+            每张图像的边界框列表
+        """
+        boxes_xyxy, scores = self._decode_predictions(predictions)
+        boxes_xyxy /= ratios[:, None, None]
+
+        cls_scores = scores.max(axis=2)
+        image_ids, candidate_ids = np.nonzero(cls_scores > 0.1)
+        keep = self.batched_nms(boxes_xyxy[image_ids, candidate_ids],
+                                cls_scores[image_ids, candidate_ids], image_ids, nms_thr=0.45)
+
+        # 保留结果按图像分组排列，用每张图像的起止偏移切分
+        kept_ids = image_ids[keep]
+        kept_boxes = boxes_xyxy[kept_ids, candidate_ids[keep]]
+        offsets = np.searchsorted(kept_ids, np.arange(len(image_shapes) + 1))
+        results = []
+        for i, shape in enumerate(image_shapes):
+            boxes = kept_boxes[offsets[i]:offsets[i + 1]]
+            results.append(self._clip_boxes(boxes, shape[1], shape[0]) if len(boxes) else [])
+        return results
+
+    @staticmethod
+    def _decode_predictions(predictions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        将中心点宽高格式的预测结果转换为xyxy边界框和类别得分
+
+        Args:
+            predictions: 形状为(..., 5 + 类别数)的预测结果
+
+        Returns:
+            (xyxy边界框, 目标置信度与类别概率相乘后的得分)
+        """
+        boxes = predictions[..., :4]
+        scores = predictions[..., 4:5] * predictions[..., 5:]
+        boxes_xyxy = np.empty_like(boxes)
+        boxes_xyxy[..., :2] = boxes[..., :2] - boxes[..., 2:4] / 2.
+        boxes_xyxy[..., 2:] = boxes[..., :2] + boxes[..., 2:4] / 2.
+        return boxes_xyxy, scores
+
+    @staticmethod
+    def _clip_boxes(boxes: np.ndarray, width: int, height: int) -> List[List[int]]:
+        """
+        将边界框裁剪到图像范围内并取整
+
+        Args:
+            boxes: 形状为(N, 4)的xyxy边界框
+            width: 图像宽度
+            height: 图像高度
+
+        Returns:
+            [[x1, y1, x2, y2], ...]
+        """
+        clipped = np.empty(boxes.shape, dtype=np.int64)
+        clipped[:, :2] = np.where(boxes[:, :2] < 0, 0, boxes[:, :2])
+        clipped[:, 2] = np.where(boxes[:, 2] > width, width, boxes[:, 2])
+        clipped[:, 3] = np.where(boxes[:, 3] > height, height, boxes[:, 3])
+        return clipped.tolist()
+
     def nms(self, boxes, scores, nms_thr):
         """Single class NMS implemented in Numpy."""
+        order = scores.argsort()[::-1]
+        if order.size <= self.NMS_MATRIX_LIMIT:
+            return order[self._suppress(boxes[order][None], nms_thr)[0]].tolist()
+        return self._nms_loop(boxes, scores, nms_thr)
+
+    def batched_nms(self, boxes: np.ndarray, scores: np.ndarray, image_ids: np.ndarray,
+                    nms_thr: float) -> np.ndarray:
+        """
+        多图像NMS，不同图像的候选框互不抑制
+
+        各图像的候选框按得分排序后填充为(图像数, 最大候选数)的批量数组，
+        一次性完成所有图像的IoU计算与抑制
+
+        Args:
+            boxes: 形状为(K, 4)的xyxy边界框
+            scores: 形状为(K,)的得分
+            image_ids: 形状为(K,)的所属图像编号（非递减）
+            nms_thr: IoU阈值
+
+        Returns:
+            保留的候选框下标，按图像编号分组、组内按得分降序
+        """
+        if len(scores) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # 各图像候选框在扁平数组中的起止偏移
+        counts = np.bincount(image_ids)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+
+        # 每张图像内部按得分降序排列（与单张检测的排序一致）
+        order = np.concatenate([start + scores[start:end].argsort()[::-1]
+                                for start, end in zip(starts, ends) if end > start])
+        max_count = int(counts.max())
+        padded_size = len(counts) * max_count * max_count
+        if padded_size > self.NMS_BATCH_LIMIT or padded_size > 2 * int(np.sum(counts ** 2)):
+            # 候选框较多或各图像数量相差悬殊时逐图像处理，避免IoU矩阵过大或填充浪费
+            keep = [start + np.asarray(self.nms(boxes[start:end], scores[start:end], nms_thr), dtype=np.int64)
+                    for start, end in zip(starts, ends) if end > start]
+            return np.concatenate(keep)
+
+        rows = image_ids[order]
+        ranks = np.arange(len(order)) - starts[rows]
+        padded = np.zeros((len(counts), max_count, 4), dtype=boxes.dtype)
+        valid = np.zeros((len(counts), max_count), dtype=bool)
+        padded[rows, ranks] = boxes[order]
+        valid[rows, ranks] = True
+
+        keep = self._suppress(padded, nms_thr, valid)
+        return order[keep[rows, ranks]]
+
+    @staticmethod
+    def _suppress(boxes: np.ndarray, nms_thr: float, valid: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        在已按得分降序排列的候选框上执行向量化贪心NMS
+
+        先计算两两IoU，再以"仅由已保留的更高分框抑制"迭代到不动点，
+        结果与逐框循环的贪心NMS完全一致
+
+        Args:
+            boxes: 形状为(B, K, 4)的xyxy边界框（每组内已排序）
+            nms_thr: IoU阈值
+            valid: 形状为(B, K)的有效掩码，None表示全部有效
+
+        Returns:
+            形状为(B, K)的布尔保留掩码
+        """
+        x1 = boxes[..., 0]
+        y1 = boxes[..., 1]
+        x2 = boxes[..., 2]
+        y2 = boxes[..., 3]
+        areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+
+        # 与逐框循环相同的运算顺序，原地计算以减少(B, K, K)临时数组
+        inter = np.minimum(x2[:, :, None], x2[:, None, :])
+        inter -= np.maximum(x1[:, :, None], x1[:, None, :])
+        inter += 1
+        np.maximum(inter, 0.0, out=inter)
+        h = np.minimum(y2[:, :, None], y2[:, None, :])
+        h -= np.maximum(y1[:, :, None], y1[:, None, :])
+        h += 1
+        np.maximum(h, 0.0, out=h)
+        inter *= h
+        union = np.add(areas[:, :, None], areas[:, None, :], out=h)
+        union -= inter
+        ovr = np.divide(inter, union, out=inter)
+
+        # suppresses[b, i, j]: 排在前面的框i能够抑制框j
+        suppresses = np.triu(~(ovr <= nms_thr), k=1)
+        if valid is None:
+            valid = np.ones(boxes.shape[:2], dtype=bool)
+        else:
+            suppresses &= valid[:, :, None]
+        suppresses = suppresses.astype(np.float32)
+
+        keep = valid
+        while True:
+            # 统计每个框被多少个已保留的高分框抑制
+            hits = np.matmul(keep.astype(np.float32)[:, None, :], suppresses)[:, 0, :]
+            new_keep = valid & (hits == 0)
+            if np.array_equal(new_keep, keep):
+                return keep
+            keep = new_keep
+
+    def _nms_loop(self, boxes, scores, nms_thr):
+        """逐框循环的贪心NMS（候选框过多时使用）"""
         x1 = boxes[:, 0]
         y1 = boxes[:, 1]
         x2 = boxes[:, 2]
@@ -171,42 +642,11 @@ class DetectionEngine(BaseEngine):
         return self.multiclass_nms_class_agnostic(boxes, scores, nms_thr, score_thr)
 
     def get_bbox(self, image_bytes):
-        """原始的目标检测方法"""
+        """原始的目标检测方法（保留兼容，输入为编码后的图片字节）"""
         img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
-        im, ratio = self.preproc(img, (416, 416))
-        ort_inputs = {self.session.get_inputs()[0].name: im[None, :, :, :]}
-        output = self.session.run(None, ort_inputs)
-        predictions = self.demo_postprocess(output[0], (416, 416))[0]
-        boxes = predictions[:, :4]
-        scores = predictions[:, 4:5] * predictions[:, 5:]
-        boxes_xyxy = np.ones_like(boxes)
-        boxes_xyxy[:, 0] = boxes[:, 0] - boxes[:, 2] / 2.
-        boxes_xyxy[:, 1] = boxes[:, 1] - boxes[:, 3] / 2.
-        boxes_xyxy[:, 2] = boxes[:, 0] + boxes[:, 2] / 2.
-        boxes_xyxy[:, 3] = boxes[:, 1] + boxes[:, 3] / 2.
-        boxes_xyxy /= ratio
-        pred = self.multiclass_nms(boxes_xyxy, scores, nms_thr=0.45, score_thr=0.1)
-        try:
-            final_boxes = pred[:, :4].tolist()
-            result = []
-            for b in final_boxes:
-                if b[0] < 0:
-                    x_min = 0
-                else:
-                    x_min = int(b[0])
-                if b[1] < 0:
-                    y_min = 0
-                else:
-                    y_min = int(b[1])
-                if b[2] > img.shape[1]:
-                    x_max = int(img.shape[1])
-                else:
-                    x_max = int(b[2])
-                if b[3] > img.shape[0]:
-                    y_max = int(img.shape[0])
-                else:
-                    y_max = int(b[3])
-                result.append([x_min, y_min, x_max, y_max])
-        except Exception as e:
-            return []
-        return result
+        return self._detect(img, self.input_size)
+
+    def cleanup(self) -> None:
+        """清理资源（包括缓存的会话元数据，避免其继续引用已释放的推理会话）"""
+        self._session_meta = None
+        super().cleanup()
@@ -4,25 +4,79 @@ OCR识别引擎
 提供文字识别功能
 """
 
+import io
+import base64
+import threading
+from collections import OrderedDict
 from typing import Union, List, Optional, Dict, Any, Tuple
 import numpy as np
+import onnxruntime
 from PIL import Image
 
 from .base import BaseEngine
+from .ctc_decoder import CTCDecoder
 from ..models.charset_manager import CharsetManager
-from ..preprocessing.color_filter import ColorFilter
+from ..models.session_config import SessionConfig
+from ..preprocessing.color_filter import ColorFilter, CompiledColorFilter
 from ..preprocessing.image_processor import ImageProcessor
 from ..utils.image_io import load_image_from_input, png_rgba_black_preprocess
 from ..utils.exceptions import ModelLoadError, ImageProcessError
-from ..utils.validators import validate_image_input
+from ..utils.result_cache import ResultCache
+from ..utils.stage_timer import stage, timed_stage
+from ..utils.validators import validate_image_input, validate_probability_options
+
+
+class _SessionMeta:
+    """推理会话的输入输出元数据，会话创建后缓存以免每次推理查询"""
+    
+    __slots__ = ('session', 'input_name', 'output_name', 'dynamic_batch', 'dynamic_width')
+    
+    def __init__(self, session: onnxruntime.InferenceSession):
+        model_input = session.get_inputs()[0]
+        batch_dim = model_input.shape[0]
+        width_dim = model_input.shape[-1] if len(model_input.shape) == 4 else 1
+        self.session = session
+        self.input_name = model_input.name
+        self.output_name = session.get_outputs()[0].name
+        self.dynamic_batch = not (isinstance(batch_dim, int) and batch_dim == 1)
+        # 宽度维度为动态维度且输出为序列时才能按宽度分桶，首次分桶推理后确认
+        self.dynamic_width = not isinstance(width_dim, int)
+
+
+class _BoundBucket:
+    """单个宽度分桶的IOBinding，输入输出绑定到线程共享缓冲区的前缀视图"""
+    
+    __slots__ = ('binding', 'input', 'output')
+    
+    def __init__(self, meta: _SessionMeta, input_view: np.ndarray):
+        self.input = input_view
+        self.output: Optional[np.ndarray] = None
+        self.binding = meta.session.io_binding()
+        self.binding.bind_ortvalue_input(meta.input_name, onnxruntime.OrtValue.ortvalue_from_numpy(input_view))
+        # 输出形状在首次推理后确定，之后绑定到共享输出缓冲区
+        self.binding.bind_output(meta.output_name)
 
 
 class OCREngine(BaseEngine):
     """OCR识别引擎"""
     
+    # 单张推理时输入宽度向上取整到该值的倍数，同一分桶复用IOBinding，所有分桶共用预分配的输入输出缓冲区。
+    # 默认1即每个原始宽度一个分桶，不做填充，结果与直接调用会话一致；大于1时填充区域使用每行最右侧像素，
+    # 对应的时间步在解码前截去，但含序列上下文（如BiLSTM）的模型会读取填充列，末尾时间步的输出可能改变，
+    # 启用前需在自己的模型和图片上确认识别结果不变。0表示不使用IOBinding，按原始宽度直接调用会话
+    WIDTH_BUCKET = 1
+    
+    # 分桶的最大宽度，超过时按原始宽度推理
+    MAX_BUCKET_WIDTH = 2048
+    
+    # 每个线程最多保留的分桶数量，超过时淘汰最久未使用的分桶
+    MAX_BUCKETS = 64
+    
     def __init__(self, use_gpu: bool = False, device_id: int = 0, 
                  old: bool = False, beta: bool = False,
-                 import_onnx_path: str = "", charsets_path: str = ""):
+                 import_onnx_path: str = "", charsets_path: str = "",
+                 session_config: Optional[Union[SessionConfig, Dict[str, Any]]] = None,
+                 precision: str = 'fp32', fast_preprocess: bool = False):
         """
         初始化OCR引擎
         
@@ -33,8 +87,11 @@ class OCREngine(BaseEngine):
             beta: 是否使用beta版模型
             import_onnx_path: 自定义模型路径
             charsets_path: 自定义字符集路径
+            session_config: 推理会话配置
+            precision: 模型精度，'fp32'使用原始模型，'int8'使用动态量化模型
+            fast_preprocess: 是否使用OpenCV快速预处理路径（见fast_preprocess属性）
         """
-        super().__init__(use_gpu, device_id)
+        super().__init__(use_gpu, device_id, session_config, precision)
         
         self.old = old
         self.beta = beta
@@ -45,6 +102,23 @@ class OCREngine(BaseEngine):
         # 字符集管理器
         self.charset_manager = CharsetManager()
         
+        # CTC解码器（字符集加载后创建）
+        self.decoder: Optional[CTCDecoder] = None
+        
+        # 是否启用OpenCV解码到张量的快速预处理路径（失败时回退到PIL路径）。
+        # OpenCV的缩放核与PIL的LANCZOS不同，输入张量与PIL路径存在可见差异并可能改变识别结果，默认关闭。
+        # 输入张量（取值0~1）与PIL路径的平均绝对差约0.005，单个像素最大约0.19
+        self.fast_preprocess = fast_preprocess
+        self._buffers = threading.local()
+        
+        # 单张推理的输入宽度分桶粒度，0表示不分桶
+        self.width_bucket = self.WIDTH_BUCKET
+        
+        # 批量推理时是否将不同宽度的图片填充到相同宽度后合并推理。默认只合并相同宽度的图片，
+        # 结果与逐张识别一致；开启后推理次数更少，但含序列上下文的模型会读取填充列，末尾字符可能改变
+        self.pad_batch = False
+        self._session_meta: Optional[_SessionMeta] = None
+        
         # 模型配置
         self.word = False
         self.resize = []
@@ -62,10 +136,9 @@ class OCREngine(BaseEngine):
         """
         try:
             if self.use_import_onnx:
-                # 加载自定义模型
-                self.session, charset_info = self.model_loader.load_custom_model(
-                    self.import_onnx_path, self.charsets_path
-                )
+                # 加载自定义模型（共享会话，首次推理时创建）
+                charset_info = self.model_loader.load_charset_info(self.charsets_path)
+                self._acquire_session(self.import_onnx_path)
                 
                 # 设置模型配置
                 self.charset_manager.charset = charset_info['charset']
@@ -77,8 +150,8 @@ class OCREngine(BaseEngine):
                 self.resize = charset_info['image']
                 self.channel = charset_info['channel']
             else:
-                # 加载默认模型
-                self.session = self.model_loader.load_ocr_model(self.old, self.beta)
+                # 加载默认模型（共享会话，首次推理时创建）
+                self._acquire_session(self.model_loader.get_ocr_model_path(self.old, self.beta))
                 
                 # 加载默认字符集
                 self.charset_manager.load_default_charset(self.old, self.beta)
@@ -91,6 +164,13 @@ class OCREngine(BaseEngine):
                 self.resize = [64, 64]  # 默认尺寸
                 self.channel = 1
             
+            # 基于当前字符集构建解码查找表
+            self.decoder = CTCDecoder(self.charset_manager.charset)
+            
+            # 会话元数据在会话创建（首次推理）时缓存，各线程的分桶绑定随旧会话一并丢弃
+            self._session_meta = None
+            self._buffers = threading.local()
+            
             self.is_initialized = True
             
         except Exception as e:
@@ -100,7 +180,8 @@ class OCREngine(BaseEngine):
                 png_fix: bool = False, probability: bool = False,
                 color_filter_colors: Optional[List[str]] = None,
                 color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
-                charset_range: Optional[Union[int, str, List[str]]] = None) -> Union[str, Dict[str, Any]]:
+                charset_range: Optional[Union[int, str, List[str], Tuple[str, ...]]] = None,
+                top_k: Optional[int] = None, probability_encoding: str = 'list') -> Union[str, Dict[str, Any]]:
         """
         执行OCR识别
         
@@ -110,7 +191,10 @@ class OCREngine(BaseEngine):
             probability: 是否返回概率信息
             color_filter_colors: 颜色过滤预设颜色列表
             color_filter_custom_ranges: 自定义HSV颜色范围列表
-            charset_range: 字符集范围限制
+            charset_range: 本次识别的字符集范围限制，None表示使用默认范围
+            top_k: 设置后返回紧凑的置信度信息（每个识别出的字符前k个候选及其概率），
+                   不再返回完整的概率矩阵
+            probability_encoding: 概率数组编码方式，list为嵌套列表，float16为base64编码的二进制数据
             
         Returns:
             识别结果文本或包含概率信息的字典
@@ -124,38 +208,365 @@ class OCREngine(BaseEngine):
         
         # 验证输入
         validate_image_input(image)
+        validate_probability_options(top_k, probability_encoding)
         
+        params = dict(png_fix=png_fix, probability=probability,
+                      color_filter_colors=color_filter_colors,
+                      color_filter_custom_ranges=color_filter_custom_ranges,
+                      charset_range=charset_range, top_k=top_k,
+                      probability_encoding=probability_encoding)
+        if self.result_cache is not None:
+            return self.result_cache.get_or_compute(self.cache_key(image, **params),
+                                                    lambda: self._predict(image, **params))
+        return self._predict(image, **params)
+    
+    def _predict(self, image: Union[bytes, str, Image.Image], png_fix: bool, probability: bool,
+                 color_filter_colors: Optional[List[str]],
+                 color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]],
+                 charset_range: Optional[Union[int, str, List[str], Tuple[str, ...]]],
+                 top_k: Optional[int] = None, probability_encoding: str = 'list') -> Union[str, Dict[str, Any]]:
+        """执行单张图片的OCR识别（不经过结果缓存）"""
         try:
-            # 加载图像
-            pil_image = load_image_from_input(image)
-            
-            # 应用颜色过滤
-            if color_filter_colors or color_filter_custom_ranges:
-                try:
-                    color_filter = ColorFilter(colors=color_filter_colors, 
-                                             custom_ranges=color_filter_custom_ranges)
-                    pil_image = color_filter.filter_image(pil_image)
-                except Exception as e:
-                    print(f"颜色过滤警告: {str(e)}，将跳过颜色过滤步骤")
+            # 解析本次识别的字符集范围（不修改共享状态）
+            valid_indices = self.charset_manager.resolve_range(charset_range)
             
-            # 设置字符集范围
-            if charset_range is not None:
-                self.charset_manager.set_ranges(charset_range)
-            else:
-                # 确保在没有设置字符集范围时，有效索引被正确初始化
-                self.charset_manager._update_valid_indices()
+            # 预处理图像：优先直接解码（并过滤颜色）到复用的张量缓冲区
+            color_filter = self._color_filter(color_filter_colors, color_filter_custom_ranges)
+            processed_image = self._fast_preprocess(image, png_fix, reuse_buffer=True, color_filter=color_filter)
             
-            # 预处理图像
-            processed_image = self._preprocess_image(pil_image, png_fix)
+            if processed_image is None:
+                # 加载图像并应用颜色过滤
+                pil_image = self._load_image(image, color_filter)
+                processed_image = self._preprocess_image(pil_image, png_fix)
             
             # 执行推理
-            result = self._inference(processed_image, probability)
+            result = self._inference(processed_image, probability, valid_indices, top_k, probability_encoding)
             
             return result
             
         except Exception as e:
             raise ImageProcessError(f"OCR识别失败: {str(e)}") from e
     
+    def predict_batch(self, images: List[Union[bytes, str, Image.Image]],
+                      png_fix: bool = False, probability: bool = False,
+                      color_filter_colors: Optional[List[str]] = None,
+                      color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+                      charset_range: Optional[Union[int, str, List[str], Tuple[str, ...]]] = None,
+                      top_k: Optional[int] = None, probability_encoding: str = 'list',
+                      use_cache: bool = True) -> List[Union[str, Dict[str, Any]]]:
+        """
+        批量执行OCR识别
+        
+        预处理后尺寸相同的图像合并为一个batch调用一次推理会话，再逐行进行CTC解码，
+        结果与逐张识别一致（pad_batch为True时不同宽度的图像也填充到相同宽度后合并）
+        
+        Args:
+            images: 输入图像列表
+            png_fix: 是否修复PNG透明背景
+            probability: 是否返回概率信息
+            color_filter_colors: 颜色过滤预设颜色列表
+            color_filter_custom_ranges: 自定义HSV颜色范围列表
+            charset_range: 本次识别的字符集范围限制，None表示使用默认范围
+            top_k: 设置后返回每个识别出的字符前k个候选及其概率
+            probability_encoding: 概率数组编码方式（list或float16）
+            use_cache: 是否使用引擎的结果缓存。调用方已在外层通过缓存合并相同请求时需传False，
+                否则内层会等待外层持有的同一个缓存键而无法完成
+            
+        Returns:
+            与输入顺序一致的识别结果列表
+            
+        Raises:
+            ImageProcessError: 当图像处理失败时
+            ModelLoadError: 当模型未初始化时
+        """
+        if not self.is_ready():
+            raise ModelLoadError("OCR引擎未初始化")
+        
+        images = list(images)
+        if not images:
+            return []
+        
+        for image in images:
+            validate_image_input(image)
+        validate_probability_options(top_k, probability_encoding)
+        
+        params = dict(png_fix=png_fix, probability=probability,
+                      color_filter_colors=color_filter_colors,
+                      color_filter_custom_ranges=color_filter_custom_ranges,
+                      charset_range=charset_range, top_k=top_k,
+                      probability_encoding=probability_encoding)
+        if use_cache and self.result_cache is not None:
+            # 只对未命中缓存的图片执行一次批量推理
+            keys = [self.cache_key(image, **params) for image in images]
+            return self.result_cache.get_or_compute_many(keys, images,
+                                                         lambda misses: self._predict_batch(misses, **params))
+        return self._predict_batch(images, **params)
+    
+    def _predict_batch(self, images: List[Union[bytes, str, Image.Image]], png_fix: bool, probability: bool,
+                       color_filter_colors: Optional[List[str]],
+                       color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]],
+                       charset_range: Optional[Union[int, str, List[str], Tuple[str, ...]]],
+                       top_k: Optional[int] = None, probability_encoding: str = 'list') -> List[Union[str, Dict[str, Any]]]:
+        """批量执行OCR识别（不经过结果缓存）"""
+        try:
+            # 解析本次识别的字符集范围（不修改共享状态）
+            valid_indices = self.charset_manager.resolve_range(charset_range)
+            
+            color_filter = self._color_filter(color_filter_colors, color_filter_custom_ranges)
+            arrays = []
+            for image in images:
+                processed_image = self._fast_preprocess(image, png_fix, reuse_buffer=False, color_filter=color_filter)
+                if processed_image is None:
+                    pil_image = self._load_image(image, color_filter)
+                    processed_image = self._preprocess_image(pil_image, png_fix)
+                arrays.append(processed_image[0])
+            
+            # 模型输入batch维度固定为1时逐张推理
+            if not self._supports_batch() or len(arrays) == 1:
+                return [self._inference(array[np.newaxis], probability, valid_indices, top_k, probability_encoding)
+                        for array in arrays]
+            
+            if self.pad_batch:
+                groups = [list(range(len(arrays)))]
+            else:
+                # 相同尺寸的图片合并推理，不做填充
+                by_shape: Dict[Tuple[int, ...], List[int]] = {}
+                for index, array in enumerate(arrays):
+                    by_shape.setdefault(array.shape, []).append(index)
+                groups = list(by_shape.values())
+            
+            results: List[Union[str, Dict[str, Any]]] = [None] * len(arrays)
+            for indices in groups:
+                group = [arrays[index] for index in indices]
+                if len(group) == 1:
+                    values = [self._inference(group[0][np.newaxis], probability, valid_indices, top_k,
+                                              probability_encoding)]
+                else:
+                    values = self._inference_batch(group, probability, valid_indices, top_k, probability_encoding)
+                for index, value in zip(indices, values):
+                    results[index] = value
+            return results
+            
+        except Exception as e:
+            raise ImageProcessError(f"批量OCR识别失败: {str(e)}") from e
+    
+    def _inference_batch(self, arrays: List[np.ndarray], probability: bool,
+                         valid_indices: Optional[np.ndarray], top_k: Optional[int],
+                         probability_encoding: str) -> List[Union[str, Dict[str, Any]]]:
+        """
+        将多张图片合并为一次推理并逐张解码
+        
+        Args:
+            arrays: 预处理后的(C, H, W)数组列表，宽度不同时右侧填充到最大宽度
+            probability: 是否返回概率信息
+            valid_indices: 允许输出的字符索引，None表示不限制
+            top_k: 设置后返回每个字符前k个候选
+            probability_encoding: 概率数组编码方式
+            
+        Returns:
+            与输入顺序一致的识别结果列表
+        """
+        batch, widths = self._pad_batch(arrays)
+        output = self._run_session(batch)
+        
+        if probability or top_k is not None:
+            return [self._process_probability_output(row, valid_indices, top_k, probability_encoding)
+                    for row in self._split_batch_output(output, widths)]
+        
+        if len(output.shape) == 3:
+            # 整个batch一次argmax后逐行折叠
+            sequence_length = CTCDecoder.to_batch_major(output, len(widths)).shape[1]
+            lengths = self._valid_lengths(sequence_length, widths)
+            with stage('postprocess'):
+                return self.decoder.decode_batch(output, len(widths), valid_indices, lengths)
+        
+        return [self._process_text_output(row, valid_indices)
+                for row in self._split_batch_output(output, widths)]
+    
+    def cache_key(self, image: Union[bytes, str, Image.Image], png_fix: bool = False, probability: bool = False,
+                  color_filter_colors: Optional[List[str]] = None,
+                  color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+                  charset_range: Optional[Union[int, str, List[str], Tuple[str, ...]]] = None,
+                  top_k: Optional[int] = None, probability_encoding: str = 'list') -> Optional[Tuple]:
+        """
+        生成识别结果的缓存键
+        
+        未指定charset_range时使用set_ranges设置的默认范围，默认范围变化后不会命中旧结果
+        
+        Args:
+            image: 输入图像
+            png_fix: 是否修复PNG透明背景
+            probability: 是否返回概率信息
+            color_filter_colors: 颜色过滤预设颜色列表
+            color_filter_custom_ranges: 自定义HSV颜色范围列表
+            charset_range: 本次识别的字符集范围限制
+            top_k: 每个字符返回的候选数量
+            probability_encoding: 概率数组编码方式
+            
+        Returns:
+            缓存键，输入类型无法计算哈希时返回None
+        """
+        if charset_range is None:
+            range_key = ('default', tuple(sorted(self.charset_manager.charset_range)))
+        else:
+            range_key = CharsetManager.normalize_range(charset_range)
+        namespace = self.cache_namespace() + (self.charsets_path, self.fast_preprocess)
+        return ResultCache.make_key(namespace, image, png_fix=png_fix, probability=probability,
+                                    color_filter_colors=color_filter_colors,
+                                    color_filter_custom_ranges=color_filter_custom_ranges,
+                                    charset_range=range_key, top_k=top_k,
+                                    probability_encoding=probability_encoding)
+    
+    def batch_key(self, image: Union[bytes, str, Image.Image]) -> Optional[Tuple[int, int]]:
+        """
+        预测图片预处理后的模型输入尺寸，供调度器只把能合并推理的图片放入同一批次
+        
+        只读取图片头信息，不解码像素。未开启pad_batch时predict_batch只合并相同尺寸的图片，
+        不同尺寸的图片放入同一批次会在一个线程中依次推理
+        
+        Args:
+            image: 输入图像
+            
+        Returns:
+            (width, height)，开启pad_batch（任意尺寸均可合并）或无法预知尺寸时返回None
+        """
+        if self.pad_batch:
+            return None
+        try:
+            if isinstance(image, Image.Image):
+                size = image.size
+            elif isinstance(image, bytes):
+                with Image.open(io.BytesIO(image)) as header:
+                    size = header.size
+            else:
+                # 文件路径与base64字符串需要读取文件或解码，交给批次内按尺寸分组
+                return None
+            return self._target_size(*size)
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _color_filter(color_filter_colors: Optional[List[str]],
+                      color_filter_custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]]
+                      ) -> Optional[CompiledColorFilter]:
+        """
+        获取颜色过滤参数对应的编译过滤器（按参数缓存，不在每次识别时重新构建）
+        
+        Args:
+            color_filter_colors: 颜色过滤预设颜色列表
+            color_filter_custom_ranges: 自定义HSV颜色范围列表
+            
+        Returns:
+            编译后的过滤器，未指定颜色过滤或参数无效时返回None
+        """
+        if not (color_filter_colors or color_filter_custom_ranges):
+            return None
+        try:
+            return ColorFilter.compile(colors=color_filter_colors, custom_ranges=color_filter_custom_ranges)
+        except Exception as e:
+            print(f"颜色过滤警告: {str(e)}，将跳过颜色过滤步骤")
+            return None
+    
+    def _load_image(self, image: Union[bytes, str, Image.Image],
+                    color_filter: Optional[CompiledColorFilter] = None) -> Image.Image:
+        """
+        加载图像并按需应用颜色过滤
+        
+        Args:
+            image: 输入图像
+            color_filter: 编译后的颜色过滤器，None表示不过滤
+            
+        Returns:
+            PIL图像
+        """
+        with stage('decode'):
+            pil_image = load_image_from_input(image)
+        
+        if color_filter is not None:
+            try:
+                with stage('preprocess'):
+                    pil_image = color_filter.filter_image(pil_image)
+            except Exception as e:
+                print(f"颜色过滤警告: {str(e)}，将跳过颜色过滤步骤")
+        
+        return pil_image
+    
+    def _target_size(self, width: int, height: int) -> Tuple[int, int]:
+        """
+        计算模型输入尺寸
+        
+        Args:
+            width: 原图宽度
+            height: 原图高度
+            
+        Returns:
+            目标尺寸 (width, height)
+        """
+        if not self.use_import_onnx:
+            # 默认模型：高度固定为64，宽度按比例缩放
+            target_height = 64
+            return int(width * (target_height / height)), target_height
+        
+        if self.resize[0] == -1:
+            if self.word:
+                return self.resize[1], self.resize[1]
+            target_height = self.resize[1]
+            return int(width * (target_height / height)), target_height
+        
+        return self.resize[0], self.resize[1]
+    
+    def _fast_preprocess(self, image: Union[bytes, str, Image.Image, np.ndarray],
+                         png_fix: bool, reuse_buffer: bool = True,
+                         color_filter: Optional[CompiledColorFilter] = None) -> Optional[np.ndarray]:
+        """
+        快速预处理路径：OpenCV直接解码为灰度图、缩放并写入float32张量
+        
+        指定颜色过滤时解码为BGR数组，过滤后直接输出灰度图（与颜色过滤后再转换为灰度一致，
+        透明背景与旧路径相同不做合成），全程不经过PIL
+        
+        Args:
+            image: 原始输入图像
+            png_fix: 是否修复PNG透明背景
+            reuse_buffer: 是否写入当前线程复用的缓冲区（结果在下一次调用前有效）
+            color_filter: 编译后的颜色过滤器，None表示不过滤
+            
+        Returns:
+            (1, 1, H, W)的float32数组，不适用快速路径时返回None
+        """
+        if not self.fast_preprocess or (self.use_import_onnx and self.channel != 1):
+            return None
+        
+        if color_filter is None:
+            with stage('decode'):
+                gray = ImageProcessor.decode_to_grayscale(image, png_fix)
+        else:
+            with stage('decode'):
+                bgr = ImageProcessor.decode_to_bgr(image)
+            if bgr is None or bgr.size == 0:
+                return None
+            with stage('preprocess'):
+                gray = color_filter.filter_grayscale(bgr)
+        if gray is None or gray.size == 0:
+            return None
+        
+        target_width, target_height = self._target_size(gray.shape[1], gray.shape[0])
+        if target_width <= 0 or target_height <= 0:
+            return None
+        
+        with stage('preprocess'):
+            gray = ImageProcessor.resize_grayscale(gray, (target_width, target_height))
+            
+            if not reuse_buffer:
+                return ImageProcessor.grayscale_to_tensor(gray)
+            
+            buffer = getattr(self._buffers, 'tensor', None)
+            if buffer is None or buffer.size < gray.size:
+                # 缓冲区容量不足时按新尺寸重新分配并保留供后续复用
+                buffer = np.empty(gray.size, dtype=np.float32)
+                self._buffers.tensor = buffer
+            return ImageProcessor.grayscale_to_tensor(gray, buffer)
+    
+    @timed_stage('preprocess')
     def _preprocess_image(self, image: Image.Image, png_fix: bool) -> np.ndarray:
         """
         预处理图像
@@ -173,27 +584,11 @@ class OCREngine(BaseEngine):
                 image = png_rgba_black_preprocess(image)
             
             # 调整图像尺寸
-            if not self.use_import_onnx:
-                # 默认模型的预处理
-                target_height = 64
-                target_width = int(image.size[0] * (target_height / image.size[1]))
-                image = ImageProcessor.resize_image(image, (target_width, target_height))
+            image = ImageProcessor.resize_image(image, self._target_size(image.size[0], image.size[1]))
+            
+            # 默认模型为单通道，自定义模型根据通道数转换
+            if not self.use_import_onnx or self.channel == 1:
                 image = ImageProcessor.convert_to_grayscale(image)
-            else:
-                # 自定义模型的预处理
-                if self.resize[0] == -1:
-                    if self.word:
-                        image = ImageProcessor.resize_image(image, (self.resize[1], self.resize[1]))
-                    else:
-                        target_height = self.resize[1]
-                        target_width = int(image.size[0] * (target_height / image.size[1]))
-                        image = ImageProcessor.resize_image(image, (target_width, target_height))
-                else:
-                    image = ImageProcessor.resize_image(image, (self.resize[0], self.resize[1]))
-                
-                # 根据通道数转换
-                if self.channel == 1:
-                    image = ImageProcessor.convert_to_grayscale(image)
             
             # 转换为numpy数组并标准化
             img_array = np.array(image).astype(np.float32)
@@ -214,85 +609,252 @@ class OCREngine(BaseEngine):
         except Exception as e:
             raise ImageProcessError(f"图像预处理失败: {str(e)}") from e
     
-    def _inference(self, image_array: np.ndarray, probability: bool) -> Union[str, Dict[str, Any]]:
+    def _inference(self, image_array: np.ndarray, probability: bool,
+                   valid_indices: Optional[np.ndarray] = None, top_k: Optional[int] = None,
+                   probability_encoding: str = 'list') -> Union[str, Dict[str, Any]]:
         """
         执行模型推理
         
         Args:
             image_array: 预处理后的图像数组
             probability: 是否返回概率信息
+            valid_indices: 允许输出的字符索引，None表示不限制
+            top_k: 设置后返回每个字符前k个候选的紧凑概率信息
+            probability_encoding: 概率数组编码方式
             
         Returns:
             识别结果
         """
         try:
-            # 获取输入名称
-            input_name = self.session.get_inputs()[0].name
-            
             # 执行推理
-            outputs = self.session.run(None, {input_name: image_array})
+            output = self._run_session(image_array)
             
             # 处理输出
-            if probability:
-                return self._process_probability_output(outputs[0])
+            if probability or top_k is not None:
+                return self._process_probability_output(output, valid_indices, top_k, probability_encoding)
             else:
-                return self._process_text_output(outputs[0])
+                return self._process_text_output(output, valid_indices)
                 
         except Exception as e:
             raise ModelLoadError(f"模型推理失败: {str(e)}") from e
     
-    def _process_text_output(self, output: np.ndarray) -> str:
+    def _meta(self) -> _SessionMeta:
+        """
+        获取当前推理会话的元数据，会话变化（如重新加载模型）后重新读取
+        
+        Returns:
+            会话元数据
+        """
+        session = self.session
+        meta = self._session_meta
+        if meta is None or meta.session is not session:
+            meta = _SessionMeta(session)
+            self._session_meta = meta
+        return meta
+    
+    @timed_stage('inference')
+    def _run_session(self, image_array: np.ndarray) -> np.ndarray:
+        """
+        调用推理会话
+        
+        单张输入按宽度分桶后经复用的IOBinding推理，其他情况直接调用会话
+        
+        Args:
+            image_array: 形状为(N, C, H, W)的输入数组
+            
+        Returns:
+            模型第一个输出，分桶推理时为复用缓冲区的视图（在当前线程下一次推理前有效）
+        """
+        meta = self._meta()
+        if self.width_bucket > 0 and meta.dynamic_width and image_array.shape[0] == 1:
+            output = self._run_bucketed(meta, image_array)
+            if output is not None:
+                return output
+        return meta.session.run([meta.output_name], {meta.input_name: image_array})[0]
+    
+    def _run_bucketed(self, meta: _SessionMeta, image_array: np.ndarray) -> Optional[np.ndarray]:
+        """
+        按宽度分桶推理
+        
+        输入写入分桶的输入缓冲区；分桶粒度大于1时用每行最右侧像素填充到分桶宽度，
+        推理结果截去填充区域对应的时间步
+        
+        Args:
+            meta: 会话元数据
+            image_array: 形状为(1, C, H, W)的输入数组
+            
+        Returns:
+            截断后的模型输出，模型不适合分桶时返回None
+        """
+        _, channel, height, width = image_array.shape
+        step = self.width_bucket
+        padded_width = -(-width // step) * step
+        if padded_width > self.MAX_BUCKET_WIDTH:
+            return None
+        
+        state = self._buffers
+        buckets = getattr(state, 'buckets', None)
+        if buckets is None or getattr(state, 'bucket_session', None) is not meta.session:
+            buckets = OrderedDict()
+            state.buckets = buckets
+            state.bucket_session = meta.session
+            state.bound_input = np.empty(0, dtype=np.float32)
+            state.bound_output = np.empty(0, dtype=np.float32)
+        
+        key = (channel, height, padded_width)
+        bucket = buckets.get(key)
+        if bucket is None:
+            size = channel * height * padded_width
+            if state.bound_input.size < size:
+                # 所有分桶共用同一块输入、输出内存（保持在CPU缓存中），按最大分桶宽度一次分配，
+                # 输入尺寸变化导致扩容时原有绑定失效
+                state.bound_input = np.empty(channel * height * self.MAX_BUCKET_WIDTH, dtype=np.float32)
+                buckets.clear()
+            bucket = _BoundBucket(meta, state.bound_input[:size].reshape(1, channel, height, padded_width))
+            buckets[key] = bucket
+            if len(buckets) > self.MAX_BUCKETS:
+                buckets.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+        
+        bucket.input[:, :, :, :width] = image_array
+        if width < padded_width:
+            bucket.input[:, :, :, width:] = image_array[:, :, :, width - 1:width]
+        
+        meta.session.run_with_iobinding(bucket.binding)
+        if bucket.output is None:
+            output = bucket.binding.copy_outputs_to_cpu()[0]
+            if output.ndim != 3 or output.dtype != np.float32:
+                # 非序列输出无法截去填充区域，之后按原始宽度推理
+                meta.dynamic_width = False
+                buckets.clear()
+                return None
+            if state.bound_output.size < output.size:
+                state.bound_output = np.empty(output.size * 2, dtype=np.float32)
+                # 其他分桶仍绑定在旧的输出缓冲区上，重新绑定前需先推理一次确定输出形状
+                for other in buckets.values():
+                    if other is not bucket and other.output is not None:
+                        other.output = None
+                        other.binding.clear_binding_outputs()
+                        other.binding.bind_output(meta.output_name)
+            bucket.output = state.bound_output[:output.size].reshape(output.shape)
+            bucket.binding.clear_binding_outputs()
+            bucket.binding.bind_ortvalue_output(meta.output_name,
+                                                onnxruntime.OrtValue.ortvalue_from_numpy(bucket.output))
+        else:
+            output = bucket.output
+        
+        if width == padded_width:
+            return output
+        # 输出为(T, 1, C)或(1, T, C)布局
+        time_major = output.shape[1] == 1 and output.shape[0] != 1
+        sequence_length = output.shape[0] if time_major else output.shape[1]
+        length = self._valid_lengths(sequence_length, [width], padded_width)[0]
+        return output[:length] if time_major else output[:, :length]
+    
+    def _supports_batch(self) -> bool:
+        """
+        检查模型输入的batch维度是否为动态维度
+        
+        Returns:
+            是否支持batch大于1的输入
+        """
+        return self._meta().dynamic_batch
+    
+    @timed_stage('preprocess')
+    def _pad_batch(self, arrays: List[np.ndarray]) -> Tuple[np.ndarray, List[int]]:
+        """
+        将(C, H, W)数组右侧填充到相同宽度并堆叠为batch
+        
+        填充使用每行最右侧像素的值，使填充区域与背景保持一致
+        
+        Args:
+            arrays: 预处理后的单张图像数组列表
+            
+        Returns:
+            (batch数组, 每张图像的原始宽度)
+        """
+        widths = [array.shape[-1] for array in arrays]
+        max_width = max(widths)
+        channel, height = arrays[0].shape[:2]
+        
+        batch = np.empty((len(arrays), channel, height, max_width), dtype=np.float32)
+        for i, array in enumerate(arrays):
+            width = widths[i]
+            batch[i, :, :, :width] = array
+            if width < max_width:
+                batch[i, :, :, width:] = array[:, :, width - 1:width]
+        
+        return batch, widths
+    
+    def _split_batch_output(self, output: np.ndarray, widths: List[int]) -> List[np.ndarray]:
+        """
+        将batch输出拆分为每张图像的输出
+        
+        序列输出按宽度比例截断填充区域对应的时间步
+        
+        Args:
+            output: 模型batch输出
+            widths: 每张图像的原始宽度
+            
+        Returns:
+            每张图像的输出数组列表
+        """
+        batch_size = len(widths)
+        
+        if len(output.shape) == 3:
+            if output.shape[1] == batch_size:
+                # 形状为 (sequence_length, batch_size, num_classes)
+                rows = [output[:, i, :] for i in range(batch_size)]
+            else:
+                # 形状为 (batch_size, sequence_length, num_classes)
+                rows = [output[i] for i in range(batch_size)]
+            
+            lengths = self._valid_lengths(rows[0].shape[0], widths)
+            return [row[:length] for row, length in zip(rows, lengths)]
+        
+        return [output[i] for i in range(batch_size)]
+    
+    @staticmethod
+    def _valid_lengths(sequence_length: int, widths: List[int],
+                       padded_width: Optional[int] = None) -> List[int]:
+        """
+        计算每行对应原始宽度的有效时间步数
+        
+        先由填充后宽度与时间步数推断模型在宽度方向的整数下采样倍数，
+        并判断模型对余数是向下还是向上取整，再按各自宽度计算；
+        无法推断时按宽度比例向下取整
+        
+        Args:
+            sequence_length: 填充后输出的时间步数
+            widths: 每张图像的原始宽度
+            padded_width: 填充后宽度，None表示最大的原始宽度
+            
+        Returns:
+            每行有效时间步数列表
+        """
+        max_width = padded_width or max(widths)
+        stride = max(1, round(max_width / sequence_length))
+        if max_width // stride == sequence_length:
+            return [max(1, min(sequence_length, width // stride)) for width in widths]
+        if -(-max_width // stride) == sequence_length:
+            return [max(1, min(sequence_length, -(-width // stride))) for width in widths]
+        return [max(1, sequence_length * width // max_width) for width in widths]
+    
+    @timed_stage('postprocess')
+    def _process_text_output(self, output: np.ndarray, valid_indices: Optional[np.ndarray] = None) -> str:
         """
         处理文本输出
         
         Args:
             output: 模型输出
+            valid_indices: 允许输出的字符索引，None表示不限制
             
         Returns:
             识别的文本
         """
         try:
-            # 获取预测结果
-            if len(output.shape) == 3:
-                # 序列输出 (sequence_length, batch_size, num_classes) 或 (batch_size, sequence_length, num_classes)
-                # 需要判断哪个维度是batch_size=1
-                if output.shape[1] == 1:
-                    # 形状为 (sequence_length, 1, num_classes)
-                    predicted_indices = np.argmax(output[:, 0, :], axis=1)
-                elif output.shape[0] == 1:
-                    # 形状为 (1, sequence_length, num_classes)
-                    predicted_indices = np.argmax(output[0, :, :], axis=1)
-                else:
-                    # 默认取第一个batch
-                    predicted_indices = np.argmax(output[0, :, :], axis=1)
-            else:
-                # 单字符输出或2D序列输出
-                predicted_indices = np.argmax(output, axis=-1)
-                # 确保结果是数组形式，即使是单个值
-                if predicted_indices.ndim == 0:
-                    predicted_indices = np.array([predicted_indices])
-            
-            # 正确的CTC解码：在索引级别进行去重
-            charset = self.charset_manager.get_charset()
-            valid_indices = self.charset_manager.get_valid_indices()
-
-            # 步骤1：CTC解码 - 在索引级别去除连续重复
-            decoded_indices = self._ctc_decode_indices(predicted_indices)
-
-            # 步骤2：转换为字符并应用字符集范围限制
-            result_chars = []
-            for idx in decoded_indices:
-                # 检查字符集范围限制
-                if valid_indices and idx not in valid_indices:
-                    continue
-
-                # 检查索引有效性并转换为字符
-                if 0 <= idx < len(charset):
-                    char = charset[idx]
-                    # 注意：这里不跳过空字符，因为CTC解码已经处理了blank
-                    result_chars.append(char)
-
-            return ''.join(result_chars)
+            return self.decoder.decode(output, valid_indices)
             
         except Exception as e:
             raise ModelLoadError(f"文本输出处理失败: {str(e)}") from e
@@ -307,37 +869,28 @@ class OCREngine(BaseEngine):
         Returns:
             解码后的索引列表
         """
-        if len(predicted_indices) == 0:
-            return []
-
-        decoded_indices = []
-        prev_idx = None
+        return self.decoder.collapse(predicted_indices).tolist()
 
-        for idx in predicted_indices:
-            # 转换为Python int类型以确保一致性
-            idx = int(idx)
-
-            # CTC解码规则：
-            # 1. 跳过连续重复的索引
-            # 2. 跳过blank字符（索引0，对应空字符）
-            if idx != prev_idx:  # 不是连续重复
-                if idx != 0:  # 不是blank字符（假设索引0是blank）
-                    decoded_indices.append(idx)
-
-            prev_idx = idx
-
-        return decoded_indices
-
-    def _process_probability_output(self, output: np.ndarray) -> Dict[str, Any]:
+    @timed_stage('postprocess')
+    def _process_probability_output(self, output: np.ndarray,
+                                    valid_indices: Optional[np.ndarray] = None,
+                                    top_k: Optional[int] = None,
+                                    probability_encoding: str = 'list') -> Dict[str, Any]:
         """
         处理概率输出
         
         Args:
             output: 模型输出
+            valid_indices: 允许输出的字符索引，None表示不限制
+            top_k: 设置后只返回每个识别出的字符前k个候选，None表示返回完整概率矩阵
+            probability_encoding: 概率数组编码方式
             
         Returns:
             包含概率信息的字典
         """
+        if top_k is not None:
+            return self._process_top_k_output(output, valid_indices, top_k, probability_encoding)
+        
         try:
             # 应用softmax
             if len(output.shape) == 3:
@@ -346,13 +899,13 @@ class OCREngine(BaseEngine):
                 probabilities = self._softmax(output, axis=1)
             
             # 获取文本结果
-            text_result = self._process_text_output(output)
+            text_result = self._process_text_output(output, valid_indices)
             
             # 构建概率信息
             charset = self.charset_manager.get_charset()
             prob_info = {
                 'text': text_result,
-                'probabilities': probabilities.tolist(),
+                'probabilities': self._encode_probabilities(probabilities, probability_encoding),
                 'charset': charset,
                 'confidence': float(np.mean(np.max(probabilities, axis=-1)))
             }
@@ -362,6 +915,97 @@ class OCREngine(BaseEngine):
         except Exception as e:
             raise ModelLoadError(f"概率输出处理失败: {str(e)}") from e
     
+    def _process_top_k_output(self, output: np.ndarray, valid_indices: Optional[np.ndarray],
+                              top_k: int, probability_encoding: str = 'list') -> Dict[str, Any]:
+        """
+        处理紧凑概率输出
+        
+        只对解码后保留下来的时间步计算softmax，每个字符返回概率最高的k个候选
+        
+        Args:
+            output: 模型输出
+            valid_indices: 允许输出的字符索引，None表示不限制
+            top_k: 每个字符返回的候选数量
+            probability_encoding: 概率数组编码方式
+            
+        Returns:
+            包含文本、整体置信度及各字符候选的字典
+        """
+        try:
+            if len(output.shape) == 3:
+                logits = CTCDecoder.to_batch_major(output, 1)[0]
+            elif len(output.shape) == 1:
+                logits = output[np.newaxis, :]
+            else:
+                logits = output
+            
+            indices = self.decoder.argmax(logits, valid_indices)
+            positions = self.decoder.emit_positions(indices)
+            text = self.decoder.indices_to_text(indices[positions])
+            
+            columns = None
+            if valid_indices is not None:
+                columns = valid_indices[valid_indices < logits.shape[-1]]
+            num_classes = logits.shape[-1] if columns is None else len(columns)
+            k = min(top_k, num_classes)
+            
+            if len(positions) == 0 or k == 0:
+                candidates = np.empty((0, k), dtype=object)
+                top_probabilities = np.empty((0, k), dtype=np.float32)
+            else:
+                # 仅在输出字符的时间步、允许的类别上计算softmax
+                rows = logits[positions].astype(np.float32, copy=False)
+                if columns is not None:
+                    rows = rows[:, columns]
+                probabilities = self._softmax(rows, axis=-1)
+                
+                if k < num_classes:
+                    top = np.argpartition(-probabilities, k - 1, axis=-1)[:, :k]
+                else:
+                    top = np.broadcast_to(np.arange(num_classes), probabilities.shape)
+                top_probabilities = np.take_along_axis(probabilities, top, axis=-1)
+                order = np.argsort(-top_probabilities, axis=-1, kind='stable')
+                top = np.take_along_axis(top, order, axis=-1)
+                top_probabilities = np.take_along_axis(top_probabilities, order, axis=-1)
+                if columns is not None:
+                    top = columns[top]
+                candidates = self.decoder.char_table[top]
+            
+            confidences = top_probabilities[:, 0] if k else np.empty(0)
+            return {
+                'text': text,
+                'confidence': float(np.mean(confidences)) if len(confidences) else 0.0,
+                'min_confidence': float(np.min(confidences)) if len(confidences) else 0.0,
+                'top_k': k,
+                'candidates': candidates.tolist(),
+                'candidate_probabilities': self._encode_probabilities(top_probabilities, probability_encoding)
+            }
+            
+        except Exception as e:
+            raise ModelLoadError(f"概率输出处理失败: {str(e)}") from e
+    
+    @staticmethod
+    def _encode_probabilities(probabilities: np.ndarray, probability_encoding: str = 'list') -> Any:
+        """
+        编码概率数组
+        
+        Args:
+            probabilities: 概率数组
+            probability_encoding: list返回嵌套列表；float16返回包含dtype、shape
+                                  和base64编码的小端float16数据的字典
+            
+        Returns:
+            编码后的概率数组
+        """
+        if probability_encoding == 'float16':
+            data = np.ascontiguousarray(probabilities, dtype='<f2')
+            return {
+                'dtype': 'float16',
+                'shape': list(data.shape),
+                'data': base64.b64encode(data.tobytes()).decode('ascii')
+            }
+        return probabilities.tolist()
+    
     def _softmax(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
         """
         计算softmax
@@ -378,7 +1022,9 @@ class OCREngine(BaseEngine):
     
     def set_charset_range(self, charset_range: Union[int, str, List[str]]) -> None:
         """
-        设置字符集范围
+        设置默认字符集范围（predict未传入charset_range时使用）
+        
+        并发场景下建议改为在每次调用predict时传入charset_range
         
         Args:
             charset_range: 字符集范围参数
@@ -397,3 +1043,9 @@ class OCREngine(BaseEngine):
     def _reload_model(self) -> None:
         """重新加载模型"""
         self.initialize()
+    
+    def cleanup(self) -> None:
+        """清理资源（包括各线程绑定到推理会话的分桶缓冲区）"""
+        self._session_meta = None
+        self._buffers = threading.local()
+        super().cleanup()
@@ -4,18 +4,35 @@
 提供滑块验证码的匹配和比较功能
 """
 
-from typing import Union, Dict, Any, Tuple
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Dict, Any, List, Optional, Sequence, Tuple
 import numpy as np
 from PIL import Image
 
 from .base import BaseEngine
 from ..utils.image_io import load_image_from_input, image_to_numpy
 from ..utils.exceptions import ImageProcessError, safe_import_opencv
-from ..utils.validators import validate_image_input
+from ..utils.validators import validate_image_input, validate_slide_options
 
 # 安全导入OpenCV
 cv2 = safe_import_opencv()
 
+# 搜索区域 (x, y, width, height)
+Region = Tuple[int, int, int, int]
+
+# 边缘检测时向搜索区域外扩展的像素数，使区域边缘的梯度与整图计算一致
+EDGE_PADDING = 8
+
+# 金字塔模式在全分辨率下精匹配的粗匹配峰值数
+PYRAMID_CANDIDATES = 12
+# 金字塔模式精匹配得分的下限，低于该值时退回全分辨率匹配
+PYRAMID_MIN_SCORE = 0.5
+# 金字塔模式精匹配得分比粗匹配得分最多低多少，超过时退回全分辨率匹配
+PYRAMID_MAX_DROP = 0.2
+# 金字塔模式最优与次优候选精匹配得分的最小差距，不足时退回全分辨率匹配
+PYRAMID_MIN_MARGIN = 0.05
+
 
 class SlideEngine(BaseEngine):
     """滑块匹配引擎"""
@@ -44,7 +61,9 @@ class SlideEngine(BaseEngine):
     
     def slide_match(self, target_image: Union[bytes, str, Image.Image], 
                    background_image: Union[bytes, str, Image.Image],
-                   simple_target: bool = False) -> Dict[str, Any]:
+                   simple_target: bool = False, mode: str = 'exact',
+                   roi: Optional[Sequence[int]] = None, row_band: Optional[Sequence[int]] = None,
+                   tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         滑块匹配算法
         
@@ -52,9 +71,16 @@ class SlideEngine(BaseEngine):
             target_image: 滑块图片
             background_image: 背景图片
             simple_target: 是否为简单滑块
+            mode: 匹配模式，exact为全分辨率匹配，pyramid为先在缩小的图像上粗匹配，
+                  再在全分辨率的小窗口内精匹配
+            roi: 只在背景图的该区域 (x, y, width, height) 内搜索，滑块需完整位于区域内
+            row_band: 只在背景图的该行范围 (y_start, y_end) 内搜索，不能与roi同时指定
+            tolerance: 金字塔模式精匹配窗口在粗匹配换算误差之外额外扩展的像素数，
+                       粗匹配落在正确峰值附近时结果与exact模式一致
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
             
         Returns:
-            匹配结果字典，包含target坐标
+            匹配结果字典，包含target坐标（相对于整张背景图）
             
         Raises:
             ImageProcessError: 当图像处理失败时
@@ -62,6 +88,7 @@ class SlideEngine(BaseEngine):
         # 验证输入
         validate_image_input(target_image)
         validate_image_input(background_image)
+        validate_slide_options(mode, roi, row_band, tolerance, pyramid_scale)
         
         try:
             # 加载图像
@@ -73,24 +100,80 @@ class SlideEngine(BaseEngine):
             background_array = image_to_numpy(background_pil, 'RGB')
             
             # 执行匹配
-            result = self._perform_slide_match(target_array, background_array, simple_target)
+            region = self._resolve_region(background_array.shape, roi, row_band)
+            result = self._perform_slide_match(target_array, background_array, simple_target,
+                                               mode, region, tolerance, pyramid_scale)
             
             return result
             
         except Exception as e:
             raise ImageProcessError(f"滑块匹配失败: {str(e)}") from e
     
+    def slide_match_batch(self, pairs: Sequence[Tuple[Union[bytes, str, Image.Image], Union[bytes, str, Image.Image]]],
+                          simple_target: bool = False, mode: str = 'exact',
+                          roi: Optional[Sequence[int]] = None, row_band: Optional[Sequence[int]] = None,
+                          tolerance: int = 2, pyramid_scale: float = 0.5,
+                          max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        批量滑块匹配
+        
+        OpenCV的模板匹配会释放GIL，max_workers大于1时在线程池中并行处理
+        
+        Args:
+            pairs: (滑块图片, 背景图片) 列表
+            simple_target: 是否为简单滑块
+            mode: 匹配模式（exact或pyramid）
+            roi: 搜索区域 (x, y, width, height)
+            row_band: 搜索的行范围 (y_start, y_end)
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
+            max_workers: 并行线程数
+            
+        Returns:
+            与输入顺序一致的匹配结果列表
+            
+        Raises:
+            ImageProcessError: 当任一图像处理失败时
+        """
+        pairs = list(pairs)
+        for pair in pairs:
+            if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+                raise ImageProcessError("pairs中的每个元素必须为(滑块图片, 背景图片)")
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ImageProcessError("max_workers必须为正整数")
+        
+        def match(pair):
+            return self.slide_match(pair[0], pair[1], simple_target=simple_target, mode=mode,
+                                    roi=roi, row_band=row_band, tolerance=tolerance,
+                                    pyramid_scale=pyramid_scale)
+        
+        if max_workers == 1 or len(pairs) <= 1:
+            return [match(pair) for pair in pairs]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs)),
+                                thread_name_prefix="ddddocr-slide") as executor:
+            return list(executor.map(match, pairs))
+    
     def slide_comparison(self, target_image: Union[bytes, str, Image.Image],
-                        background_image: Union[bytes, str, Image.Image]) -> Dict[str, Any]:
+                        background_image: Union[bytes, str, Image.Image],
+                        mode: str = 'exact', roi: Optional[Sequence[int]] = None,
+                        row_band: Optional[Sequence[int]] = None,
+                        tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         滑块比较算法（用于带坑位的图片）
         
         Args:
             target_image: 带坑位的图片
             background_image: 完整背景图片
+            mode: 比较模式，exact为全分辨率比较，pyramid为先在缩小的图像上定位缺口，
+                  再在全分辨率的缺口窗口内比较
+            roi: 只比较该区域 (x, y, width, height)
+            row_band: 只比较该行范围 (y_start, y_end)，不能与roi同时指定
+            tolerance: 金字塔模式缺口窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式定位缺口的缩放比例
             
         Returns:
-            比较结果字典，包含target坐标
+            比较结果字典，包含target坐标（相对于整张图片）
             
         Raises:
             ImageProcessError: 当图像处理失败时
@@ -98,6 +181,7 @@ class SlideEngine(BaseEngine):
         # 验证输入
         validate_image_input(target_image)
         validate_image_input(background_image)
+        validate_slide_options(mode, roi, row_band, tolerance, pyramid_scale)
         
         try:
             # 加载图像
@@ -109,15 +193,44 @@ class SlideEngine(BaseEngine):
             background_array = image_to_numpy(background_pil, 'RGB')
             
             # 执行比较
-            result = self._perform_slide_comparison(target_array, background_array)
+            region = self._resolve_region(target_array.shape, roi, row_band)
+            result = self._perform_slide_comparison(target_array, background_array,
+                                                    mode, region, tolerance, pyramid_scale)
             
             return result
             
         except Exception as e:
             raise ImageProcessError(f"滑块比较失败: {str(e)}") from e
     
+    @staticmethod
+    def _resolve_region(shape: Tuple[int, ...], roi: Optional[Sequence[int]],
+                        row_band: Optional[Sequence[int]]) -> Optional[Region]:
+        """
+        将roi或row_band转换为裁剪到图像范围内的搜索区域
+        
+        Args:
+            shape: 图像数组形状
+            roi: 搜索区域 (x, y, width, height)
+            row_band: 搜索的行范围 (y_start, y_end)
+            
+        Returns:
+            (x, y, width, height)，未限制时返回None
+        """
+        height, width = shape[:2]
+        if row_band is not None:
+            roi = (0, row_band[0], width, row_band[1] - row_band[0])
+        if roi is None:
+            return None
+        
+        x, y = min(roi[0], width), min(roi[1], height)
+        w, h = min(roi[2], width - x), min(roi[3], height - y)
+        if w <= 0 or h <= 0:
+            raise ImageProcessError(f"搜索区域 {tuple(roi)} 位于图像 {width}x{height} 之外")
+        return x, y, w, h
+    
     def _perform_slide_match(self, target: np.ndarray, background: np.ndarray, 
-                           simple_target: bool) -> Dict[str, Any]:
+                           simple_target: bool, mode: str = 'exact', region: Optional[Region] = None,
+                           tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         执行滑块匹配
         
@@ -125,6 +238,10 @@ class SlideEngine(BaseEngine):
             target: 滑块图像数组
             background: 背景图像数组
             simple_target: 是否为简单滑块
+            mode: 匹配模式
+            region: 搜索区域，None表示整张背景图
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
             
         Returns:
             匹配结果
@@ -136,57 +253,65 @@ class SlideEngine(BaseEngine):
             
             if simple_target:
                 # 简单滑块匹配
-                result = self._simple_template_match(target_gray, background_gray)
+                result = self._simple_template_match(target_gray, background_gray,
+                                                     mode, region, tolerance, pyramid_scale)
             else:
                 # 复杂滑块匹配（边缘检测）
-                result = self._edge_based_match(target_gray, background_gray)
+                result = self._edge_based_match(target_gray, background_gray,
+                                                mode, region, tolerance, pyramid_scale)
             
             return result
             
         except Exception as e:
             raise ImageProcessError(f"滑块匹配执行失败: {str(e)}") from e
     
-    def _perform_slide_comparison(self, target: np.ndarray, background: np.ndarray) -> Dict[str, Any]:
+    def _perform_slide_comparison(self, target: np.ndarray, background: np.ndarray,
+                                  mode: str = 'exact', region: Optional[Region] = None,
+                                  tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         执行滑块比较
         
         Args:
             target: 带坑位的图像数组
             background: 完整背景图像数组
+            mode: 比较模式
+            region: 比较区域，None表示整张图片
+            tolerance: 金字塔模式缺口窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式定位缺口的缩放比例
             
         Returns:
             比较结果
         """
         try:
-            # 计算图像差异
-            diff = cv2.absdiff(target, background)
-            
-            # 转换为灰度图
-            diff_gray = cv2.cvtColor(diff, cv2.COLOR_RGB2GRAY)
-            
-            # 二值化
-            _, binary = cv2.threshold(diff_gray, 30, 255, cv2.THRESH_BINARY)
-            
-            # 形态学操作去噪
-            kernel = np.ones((3, 3), np.uint8)
-            binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-            binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
-            
-            # 查找轮廓
-            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if not contours:
+            x, y, w, h = region if region is not None else (0, 0, target.shape[1], target.shape[0])
+            target = target[y:y + h, x:x + w]
+            background = background[y:y + h, x:x + w]
+            
+            box = None
+            if mode == 'pyramid':
+                coarse = self._gap_box(self._downscale(target, pyramid_scale),
+                                       self._downscale(background, pyramid_scale))
+                if coarse is not None:
+                    # 缺口框换算回全分辨率并扩展，覆盖缩放误差和形态学操作的影响
+                    margin = math.ceil(1 / pyramid_scale) + tolerance + 2
+                    left = max(0, int(coarse[0] / pyramid_scale) - margin)
+                    top = max(0, int(coarse[1] / pyramid_scale) - margin)
+                    right = min(w, math.ceil((coarse[0] + coarse[2]) / pyramid_scale) + margin)
+                    bottom = min(h, math.ceil((coarse[1] + coarse[3]) / pyramid_scale) + margin)
+                    box = self._gap_box(target[top:bottom, left:right], background[top:bottom, left:right])
+                    if box is not None:
+                        box = (box[0] + left, box[1] + top, box[2], box[3])
+            
+            if box is None:
+                # 精确模式，或缩小后未能定位缺口时在全分辨率下比较
+                box = self._gap_box(target, background)
+            
+            if box is None:
                 return {'target': [0, 0]}
             
-            # 找到最大的轮廓（假设是缺口）
-            largest_contour = max(contours, key=cv2.contourArea)
-            
-            # 获取边界框
-            x, y, w, h = cv2.boundingRect(largest_contour)
-            
             # 计算中心点
-            center_x = x + w // 2
-            center_y = y + h // 2
+            center_x = x + box[0] + box[2] // 2
+            center_y = y + box[1] + box[3] // 2
             
             return {
                 'target': [center_x, center_y],
@@ -197,78 +322,267 @@ class SlideEngine(BaseEngine):
         except Exception as e:
             raise ImageProcessError(f"滑块比较执行失败: {str(e)}") from e
     
-    def _simple_template_match(self, target: np.ndarray, background: np.ndarray) -> Dict[str, Any]:
+    @staticmethod
+    def _gap_box(target: np.ndarray, background: np.ndarray) -> Optional[Region]:
+        """
+        计算两张图片差异最大的区域
+        
+        Args:
+            target: 带坑位的图像数组
+            background: 完整背景图像数组
+            
+        Returns:
+            最大差异轮廓的边界框 (x, y, width, height)，没有差异时返回None
+        """
+        # 计算图像差异
+        diff = cv2.absdiff(target, background)
+        
+        # 转换为灰度图
+        diff_gray = cv2.cvtColor(diff, cv2.COLOR_RGB2GRAY)
+        
+        # 二值化
+        _, binary = cv2.threshold(diff_gray, 30, 255, cv2.THRESH_BINARY)
+        
+        # 形态学操作去噪
+        kernel = np.ones((3, 3), np.uint8)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+        
+        # 查找轮廓
+        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        if not contours:
+            return None
+        
+        # 找到最大的轮廓（假设是缺口）
+        largest_contour = max(contours, key=cv2.contourArea)
+        
+        # 获取边界框
+        return cv2.boundingRect(largest_contour)
+    
+    @staticmethod
+    def _downscale(image: np.ndarray, scale: float) -> np.ndarray:
+        """按比例缩小图像（区域插值）"""
+        width = max(1, int(round(image.shape[1] * scale)))
+        height = max(1, int(round(image.shape[0] * scale)))
+        return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+    
+    @staticmethod
+    def _crop(image: np.ndarray, region: Optional[Region], padding: int = 0) -> Tuple[np.ndarray, int, int]:
+        """
+        裁剪搜索区域
+        
+        Args:
+            image: 图像数组
+            region: 搜索区域，None表示整张图像
+            padding: 向区域外扩展的像素数（不超出图像）
+            
+        Returns:
+            (裁剪后的图像, 区域左上角在裁剪结果中的x偏移, y偏移)
+        """
+        if region is None:
+            return image, 0, 0
+        x, y, w, h = region
+        left, top = max(0, x - padding), max(0, y - padding)
+        right = min(image.shape[1], x + w + padding)
+        bottom = min(image.shape[0], y + h + padding)
+        return image[top:bottom, left:right], x - left, y - top
+    
+    def _locate(self, target: np.ndarray, background: np.ndarray, mode: str,
+                tolerance: int, pyramid_scale: float) -> Tuple[float, Tuple[int, int]]:
+        """
+        模板匹配定位
+        
+        金字塔模式的结果无法通过校验时（见_pyramid_locate）退回全分辨率匹配
+        
+        Args:
+            target: 全分辨率模板
+            background: 全分辨率搜索图像
+            mode: 匹配模式
+            tolerance: 精匹配窗口额外扩展的像素数
+            pyramid_scale: 粗匹配的缩放比例
+            
+        Returns:
+            (匹配得分, 模板左上角在background中的位置)
+        """
+        target_h, target_w = target.shape[:2]
+        if background.shape[0] < target_h or background.shape[1] < target_w:
+            raise ImageProcessError(f"搜索区域 {background.shape[1]}x{background.shape[0]} 小于滑块尺寸 {target_w}x{target_h}")
+        
+        if mode == 'pyramid':
+            located = self._pyramid_locate(target, background, tolerance, pyramid_scale)
+            if located is not None:
+                return located
+        
+        # 模板匹配
+        result = cv2.matchTemplate(background, target, cv2.TM_CCOEFF_NORMED)
+        
+        # 找到最佳匹配位置
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return float(max_val), max_loc
+    
+    def _pyramid_locate(self, target: np.ndarray, background: np.ndarray, tolerance: int,
+                        pyramid_scale: float) -> Optional[Tuple[float, Tuple[int, int]]]:
+        """
+        金字塔模板匹配
+        
+        先在缩小的图像上匹配，取得分最高的PYRAMID_CANDIDATES个精匹配窗口互不重叠的粗匹配峰值，
+        再在全分辨率下只搜索各峰值周围的窗口，取精匹配得分最高者。
+        以下情况下结果不可信，返回None由调用方退回全分辨率匹配：
+        精匹配峰值落在窗口边缘（真实峰值可能在窗口外）、精匹配得分低于PYRAMID_MIN_SCORE、
+        精匹配得分比对应的粗匹配得分低PYRAMID_MAX_DROP以上、
+        或位置不同的次优候选精匹配得分与最优者相差不足PYRAMID_MIN_MARGIN
+        
+        Args:
+            target: 全分辨率模板
+            background: 全分辨率搜索图像
+            tolerance: 精匹配窗口额外扩展的像素数
+            pyramid_scale: 粗匹配的缩放比例
+            
+        Returns:
+            (匹配得分, 模板左上角在background中的位置)，需要退回全分辨率匹配时返回None
+        """
+        target_h, target_w = target.shape[:2]
+        positions_h = background.shape[0] - target_h + 1
+        positions_w = background.shape[1] - target_w + 1
+        
+        coarse_background = self._downscale(background, pyramid_scale)
+        coarse_target = self._downscale(target, pyramid_scale)
+        radius = math.ceil(1 / pyramid_scale) + tolerance
+        window_area = (2 * radius + 1) ** 2
+        
+        # 窗口已接近整个搜索范围或缩小后的模板过小时粗匹配没有意义
+        if (PYRAMID_CANDIDATES * window_area >= positions_h * positions_w or min(coarse_target.shape[:2]) < 4
+                or coarse_background.shape[0] < coarse_target.shape[0]
+                or coarse_background.shape[1] < coarse_target.shape[1]):
+            return None
+        
+        coarse = cv2.matchTemplate(coarse_background, coarse_target, cv2.TM_CCOEFF_NORMED)
+        # 只保留局部极大值作为候选，避免一条平缓的高分边沿占满所有候选
+        coarse[coarse < cv2.dilate(coarse, np.ones((3, 3), np.uint8))] = -np.inf
+        # 抑制已被精匹配窗口覆盖的粗匹配位置，使各候选的窗口互不重叠
+        suppress = max(1, math.ceil(radius * pyramid_scale))
+        
+        refined = []
+        for _ in range(PYRAMID_CANDIDATES):
+            _, coarse_val, _, coarse_loc = cv2.minMaxLoc(coarse)
+            if not np.isfinite(coarse_val):
+                break
+            coarse[max(0, coarse_loc[1] - suppress):coarse_loc[1] + suppress + 1,
+                   max(0, coarse_loc[0] - suppress):coarse_loc[0] + suppress + 1] = -np.inf
+            
+            center_x = int(round(coarse_loc[0] / pyramid_scale))
+            center_y = int(round(coarse_loc[1] / pyramid_scale))
+            left = min(max(0, center_x - radius), positions_w - 1)
+            top = min(max(0, center_y - radius), positions_h - 1)
+            right = min(positions_w, center_x + radius + 1)
+            bottom = min(positions_h, center_y + radius + 1)
+            if right <= left or bottom <= top:
+                return None
+            
+            window = background[top:bottom + target_h - 1, left:right + target_w - 1]
+            result = cv2.matchTemplate(window, target, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            loc_x, loc_y = max_loc[0] + left, max_loc[1] + top
+            refined.append((float(max_val), float(coarse_val), (loc_x, loc_y),
+                            (max_loc[0] == 0 and left > 0) or (max_loc[1] == 0 and top > 0)
+                            or (loc_x == right - 1 and right < positions_w)
+                            or (loc_y == bottom - 1 and bottom < positions_h)))
+        
+        if not refined:
+            return None
+        refined.sort(key=lambda item: item[0], reverse=True)
+        max_val, coarse_val, loc, on_edge = refined[0]
+        if on_edge or max_val < PYRAMID_MIN_SCORE or coarse_val - max_val > PYRAMID_MAX_DROP:
+            return None
+        # 相邻窗口可能找到同一个峰值，只与位置不同的候选比较
+        for other_val, _, other_loc, _ in refined[1:]:
+            if max(abs(other_loc[0] - loc[0]), abs(other_loc[1] - loc[1])) > radius:
+                if max_val - other_val < PYRAMID_MIN_MARGIN:
+                    return None
+                break
+        return max_val, loc
+    
+    @staticmethod
+    def _match_result(max_val: float, max_loc: Tuple[int, int], target: np.ndarray,
+                      offset_x: int = 0, offset_y: int = 0) -> Dict[str, Any]:
+        """根据匹配位置计算滑块中心坐标"""
+        if len(target.shape) == 3:
+            target_h, target_w, _ = target.shape
+        else:
+            target_h, target_w = target.shape
+        center_x = offset_x + max_loc[0] + target_w // 2
+        center_y = offset_y + max_loc[1] + target_h // 2
+        
+        return {
+            'target': [center_x, center_y],
+            'target_x': center_x,
+            'target_y': center_y,
+            'confidence': float(max_val)
+        }
+    
+    def _simple_template_match(self, target: np.ndarray, background: np.ndarray,
+                               mode: str = 'exact', region: Optional[Region] = None,
+                               tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         简单模板匹配
         
         Args:
             target: 滑块模板
             background: 背景图像
+            mode: 匹配模式
+            region: 搜索区域，None表示整张背景图
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
             
         Returns:
             匹配结果
         """
         try:
-            # 模板匹配
-            result = cv2.matchTemplate(background, target, cv2.TM_CCOEFF_NORMED)
+            search, _, _ = self._crop(background, region)
+            offset_x, offset_y = (region[0], region[1]) if region is not None else (0, 0)
             
-            # 找到最佳匹配位置
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            # 模板匹配
+            max_val, max_loc = self._locate(target, search, mode, tolerance, pyramid_scale)
             
-            # 计算滑块中心位置
-            if len(target.shape) == 3:
-                target_h, target_w, _ = target.shape
-            else:
-                target_h, target_w = target.shape
-            center_x = max_loc[0] + target_w // 2
-            center_y = max_loc[1] + target_h // 2
-            
-            return {
-                'target': [center_x, center_y],
-                'target_x': center_x,
-                'target_y': center_y,
-                'confidence': float(max_val)
-            }
+            return self._match_result(max_val, max_loc, target, offset_x, offset_y)
             
         except Exception as e:
             raise ImageProcessError(f"简单模板匹配失败: {str(e)}") from e
     
-    def _edge_based_match(self, target: np.ndarray, background: np.ndarray) -> Dict[str, Any]:
+    def _edge_based_match(self, target: np.ndarray, background: np.ndarray,
+                          mode: str = 'exact', region: Optional[Region] = None,
+                          tolerance: int = 2, pyramid_scale: float = 0.5) -> Dict[str, Any]:
         """
         基于边缘检测的滑块匹配
         
+        指定搜索区域时只对区域（向外扩展EDGE_PADDING像素）做边缘检测；
+        金字塔模式的粗匹配使用缩小后的全分辨率边缘图，精匹配与exact模式使用同一张边缘图
+        
         Args:
             target: 滑块图像
             background: 背景图像
+            mode: 匹配模式
+            region: 搜索区域，None表示整张背景图
+            tolerance: 金字塔模式精匹配窗口额外扩展的像素数
+            pyramid_scale: 金字塔模式粗匹配的缩放比例
             
         Returns:
             匹配结果
         """
         try:
             # 边缘检测
+            padded, inner_x, inner_y = self._crop(background, region, EDGE_PADDING)
             target_edges = cv2.Canny(target, 50, 150)
-            background_edges = cv2.Canny(background, 50, 150)
+            background_edges = cv2.Canny(padded, 50, 150)
+            if region is not None:
+                background_edges = background_edges[inner_y:inner_y + region[3], inner_x:inner_x + region[2]]
+            offset_x, offset_y = (region[0], region[1]) if region is not None else (0, 0)
             
             # 模板匹配
-            result = cv2.matchTemplate(background_edges, target_edges, cv2.TM_CCOEFF_NORMED)
-            
-            # 找到最佳匹配位置
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            max_val, max_loc = self._locate(target_edges, background_edges, mode, tolerance, pyramid_scale)
             
-            # 计算滑块中心位置
-            if len(target.shape) == 3:
-                target_h, target_w, _ = target.shape
-            else:
-                target_h, target_w = target.shape
-            center_x = max_loc[0] + target_w // 2
-            center_y = max_loc[1] + target_h // 2
-            
-            return {
-                'target': [center_x, center_y],
-                'target_x': center_x,
-                'target_y': center_y,
-                'confidence': float(max_val)
-            }
+            return self._match_result(max_val, max_loc, target, offset_x, offset_y)
             
         except Exception as e:
             raise ImageProcessError(f"边缘匹配失败: {str(e)}") from e
@@ -6,8 +6,19 @@
 
 from .model_loader import ModelLoader
 from .charset_manager import CharsetManager
+from .session_config import SessionConfig
+from .session_registry import SessionRegistry, SharedSession, session_registry
+from .shared_weights import SharedWeights
+from .quantization import quantize_model, quantized_model_path
 
 __all__ = [
     'ModelLoader',
-    'CharsetManager'
+    'CharsetManager',
+    'SessionConfig',
+    'SessionRegistry',
+    'SharedSession',
+    'session_registry',
+    'SharedWeights',
+    'quantize_model',
+    'quantized_model_path'
 ]
@@ -0,0 +1,149 @@
+# coding=utf-8
+"""
+字符集资源模块
+负责内置字符集资源文件的读写、延迟加载与进程内共享
+"""
+
+import os
+import sys
+import struct
+import threading
+from array import array
+from typing import Dict, Sequence, Tuple
+
+from ..utils.exceptions import ModelLoadError
+
+
+# 资源文件格式：文件头 + (count + 1)个uint32码点偏移 + UTF-8字符数据
+_MAGIC = b'DDCS'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+
+# 内置字符集名称与资源文件的对应关系
+BUILTIN_CHARSETS = {
+    'old': 'old.charset',
+    'beta': 'beta.charset',
+}
+
+_RESOURCE_DIR = os.path.join(os.path.dirname(__file__), 'charsets')
+
+_builtin_tables: Dict[str, 'CharsetTable'] = {}
+_builtin_lock = threading.Lock()
+
+
+class CharsetTable:
+    """不可变字符集表，包含字符元组与字符到索引的映射"""
+
+    __slots__ = ('chars', 'index')
+
+    def __init__(self, chars: Sequence[str]):
+        """
+        初始化字符集表
+
+        Args:
+            chars: 字符序列，下标即模型输出类别索引
+        """
+        self.chars: Tuple[str, ...] = tuple(chars)
+        self.index: Dict[str, int] = {}
+        for i, char in enumerate(self.chars):
+            # 重复字符保留第一次出现的索引，与list.index行为一致
+            self.index.setdefault(char, i)
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    def __repr__(self) -> str:
+        return f"CharsetTable(size={len(self.chars)})"
+
+
+def write_charset_resource(path: str, chars: Sequence[str]) -> None:
+    """
+    将字符集写入资源文件
+
+    Args:
+        path: 资源文件路径
+        chars: 字符序列
+    """
+    offsets = array('I', [0])
+    for char in chars:
+        offsets.append(offsets[-1] + len(char))
+
+    blob = ''.join(chars).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(chars)))
+        f.write(offsets.tobytes() if sys.byteorder == 'little' else _swapped(offsets))
+        f.write(blob)
+
+
+def read_charset_resource(path: str) -> Tuple[str, ...]:
+    """
+    读取字符集资源文件
+
+    Args:
+        path: 资源文件路径
+
+    Returns:
+        字符元组
+
+    Raises:
+        ModelLoadError: 当文件不存在或格式错误时
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ModelLoadError(f"字符集资源文件格式错误: {path}")
+
+        offsets = array('I')
+        start = _HEADER.size
+        end = start + (count + 1) * 4
+        offsets.frombytes(data[start:end])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        text = data[end:].decode('utf-8')
+        return tuple(text[offsets[i]:offsets[i + 1]] for i in range(count))
+
+    except ModelLoadError:
+        raise
+    except Exception as e:
+        raise ModelLoadError(f"字符集资源文件读取失败: {str(e)}") from e
+
+
+def load_builtin_charset(name: str) -> CharsetTable:
+    """
+    获取内置字符集表，首次调用时加载，之后在进程内共享
+
+    Args:
+        name: 内置字符集名称（'old'或'beta'）
+
+    Returns:
+        共享的字符集表
+
+    Raises:
+        ModelLoadError: 当名称不存在或加载失败时
+    """
+    table = _builtin_tables.get(name)
+    if table is not None:
+        return table
+
+    if name not in BUILTIN_CHARSETS:
+        available = ', '.join(BUILTIN_CHARSETS.keys())
+        raise ModelLoadError(f"不支持的内置字符集: {name}。可用字符集: {available}")
+
+    with _builtin_lock:
+        table = _builtin_tables.get(name)
+        if table is None:
+            path = os.path.join(_RESOURCE_DIR, BUILTIN_CHARSETS[name])
+            table = CharsetTable(read_charset_resource(path))
+            _builtin_tables[name] = table
+        return table
+
+
+def _swapped(offsets: array) -> bytes:
+    """返回字节序翻转后的数组数据（用于大端平台写入小端格式）"""
+    swapped = array('I', offsets)
+    swapped.byteswap()
+    return swapped.tobytes()
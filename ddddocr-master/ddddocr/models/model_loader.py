@@ -6,26 +6,36 @@
 
 import os
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 import onnxruntime
 
+from .quantization import quantize_model
+from .session_config import SessionConfig, create_inference_session
+from .session_registry import SharedSession, session_registry
 from ..utils.exceptions import ModelLoadError
-from ..utils.validators import validate_model_config
+from ..utils.validators import validate_model_config, validate_precision
 
 
 class ModelLoader:
     """ONNX模型加载器"""
     
-    def __init__(self, use_gpu: bool = False, device_id: int = 0):
+    def __init__(self, use_gpu: bool = False, device_id: int = 0,
+                 session_config: Optional[Union[SessionConfig, Dict[str, Any]]] = None,
+                 precision: str = 'fp32'):
         """
         初始化模型加载器
         
         Args:
             use_gpu: 是否使用GPU
             device_id: GPU设备ID
+            session_config: 推理会话配置（SessionConfig或配置字典），None表示使用默认设置
+            precision: 模型精度，'fp32'使用原始模型，'int8'使用动态量化模型（首次使用时生成并缓存在原模型旁）
         """
+        validate_precision(precision)
         self.use_gpu = use_gpu
         self.device_id = device_id
+        self.session_config = SessionConfig.from_value(session_config)
+        self.precision = precision
         self._setup_providers()
     
     def _setup_providers(self) -> None:
@@ -52,6 +62,23 @@ class ModelLoader:
             if self.use_gpu:
                 print(f"GPU设置失败，回退到CPU模式: {str(e)}")
     
+    def resolve_model_path(self, model_path: str) -> str:
+        """
+        获取按模型精度实际加载的模型路径
+        
+        Args:
+            model_path: 原始模型路径
+            
+        Returns:
+            fp32精度返回原路径，int8精度返回量化模型路径（缓存不存在或已过期时先生成）
+            
+        Raises:
+            ModelLoadError: 当模型文件不存在或量化失败时
+        """
+        if self.precision == 'int8':
+            return quantize_model(model_path)
+        return model_path
+    
     def load_model(self, model_path: str) -> onnxruntime.InferenceSession:
         """
         加载ONNX模型
@@ -69,17 +96,30 @@ class ModelLoader:
             if not os.path.exists(model_path):
                 raise ModelLoadError(f"模型文件不存在: {model_path}")
             
-            # 设置ONNX运行时日志级别
-            onnxruntime.set_default_logger_severity(3)
-            
             # 创建推理会话
-            session = onnxruntime.InferenceSession(model_path, providers=self.providers)
-            
-            return session
+            return create_inference_session(self.resolve_model_path(model_path), self.providers, self.session_config)
             
         except Exception as e:
             raise ModelLoadError(f"模型加载失败: {str(e)}") from e
     
+    def acquire_session(self, model_path: str) -> SharedSession:
+        """
+        从进程级注册表获取共享推理会话句柄
+        
+        相同模型路径、执行提供者与会话配置的引擎共享同一个会话，会话在首次推理时才创建；
+        int8精度在获取句柄时即完成量化，不同精度的会话互不共享
+        
+        Args:
+            model_path: 模型文件路径
+            
+        Returns:
+            共享会话句柄，使用完毕后需调用release()
+            
+        Raises:
+            ModelLoadError: 当模型文件不存在或量化失败时
+        """
+        return session_registry.acquire(self.resolve_model_path(model_path), self.providers, self.session_config)
+    
     def get_model_info(self, session: onnxruntime.InferenceSession) -> Dict[str, Any]:
         """
         获取模型信息
@@ -133,22 +173,40 @@ class ModelLoader:
             ModelLoadError: 当模型加载失败时
         """
         try:
-            if import_onnx_path:
-                model_path = import_onnx_path
-            else:
-                base_dir = os.path.dirname(os.path.dirname(__file__))
-                if old:
-                    model_path = os.path.join(base_dir, 'common_old.onnx')
-                elif beta:
-                    model_path = os.path.join(base_dir, 'common.onnx')
-                else:
-                    model_path = os.path.join(base_dir, 'common_old.onnx')
-            
+            model_path = import_onnx_path or self.get_ocr_model_path(old, beta)
             return self.load_model(model_path)
             
         except Exception as e:
             raise ModelLoadError(f"OCR模型加载失败: {str(e)}") from e
     
+    def get_ocr_model_path(self, old: bool = False, beta: bool = False) -> str:
+        """
+        获取内置OCR模型路径
+        
+        Args:
+            old: 是否使用旧版模型
+            beta: 是否使用beta版模型
+            
+        Returns:
+            模型文件路径
+        """
+        base_dir = os.path.dirname(os.path.dirname(__file__))
+        if old:
+            return os.path.join(base_dir, 'common_old.onnx')
+        elif beta:
+            return os.path.join(base_dir, 'common.onnx')
+        return os.path.join(base_dir, 'common_old.onnx')
+    
+    def get_detection_model_path(self) -> str:
+        """
+        获取内置目标检测模型路径
+        
+        Returns:
+            模型文件路径
+        """
+        base_dir = os.path.dirname(os.path.dirname(__file__))
+        return os.path.join(base_dir, 'common_det.onnx')
+    
     def load_detection_model(self) -> onnxruntime.InferenceSession:
         """
         加载目标检测模型
@@ -160,9 +218,7 @@ class ModelLoader:
             ModelLoadError: 当模型加载失败时
         """
         try:
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            model_path = os.path.join(base_dir, 'common_det.onnx')
-            return self.load_model(model_path)
+            return self.load_model(self.get_detection_model_path())
             
         except Exception as e:
             raise ModelLoadError(f"检测模型加载失败: {str(e)}") from e
@@ -186,23 +242,40 @@ class ModelLoader:
             session = self.load_model(model_path)
             
             # 加载字符集信息
-            if not os.path.exists(charset_path):
-                raise ModelLoadError(f"字符集文件不存在: {charset_path}")
-            
-            with open(charset_path, 'r', encoding="utf-8") as f:
-                charset_info = json.loads(f.read())
-            
-            # 验证字符集信息格式
-            required_keys = ['charset', 'word', 'image', 'channel']
-            for key in required_keys:
-                if key not in charset_info:
-                    raise ModelLoadError(f"字符集文件缺少必需字段: {key}")
+            charset_info = self.load_charset_info(charset_path)
             
             return session, charset_info
             
         except Exception as e:
             raise ModelLoadError(f"自定义模型加载失败: {str(e)}") from e
     
+    def load_charset_info(self, charset_path: str) -> Dict[str, Any]:
+        """
+        加载自定义模型的字符集信息
+        
+        Args:
+            charset_path: 字符集文件路径
+            
+        Returns:
+            字符集信息字典
+            
+        Raises:
+            ModelLoadError: 当文件不存在或格式错误时
+        """
+        if not os.path.exists(charset_path):
+            raise ModelLoadError(f"字符集文件不存在: {charset_path}")
+        
+        with open(charset_path, 'r', encoding="utf-8") as f:
+            charset_info = json.loads(f.read())
+        
+        # 验证字符集信息格式
+        required_keys = ['charset', 'word', 'image', 'channel']
+        for key in required_keys:
+            if key not in charset_info:
+                raise ModelLoadError(f"字符集文件缺少必需字段: {key}")
+        
+        return charset_info
+    
     def validate_model_compatibility(self, session: onnxruntime.InferenceSession, 
                                    expected_input_shape: Optional[List[int]] = None) -> bool:
         """
@@ -257,4 +330,5 @@ class ModelLoader:
         self._setup_providers()
     
     def __repr__(self) -> str:
-        return f"ModelLoader(use_gpu={self.use_gpu}, device_id={self.device_id})"
+        return (f"ModelLoader(use_gpu={self.use_gpu}, device_id={self.device_id}, "
+                f"session_config={self.session_config}, precision={self.precision!r})")
@@ -0,0 +1,118 @@
+# coding=utf-8
+"""
+模型量化模块
+使用ONNX运行时量化工具生成动态量化的INT8模型，并缓存在原模型旁以便之后启动时复用
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+from typing import Optional, Sequence
+
+from ..utils.exceptions import ModelLoadError
+
+# 默认量化的算子：全连接与循环层的权重占模型体积和计算量的大部分，
+# 动态量化的卷积（ConvInteger）在CPU上通常比float32卷积更慢，需要时可显式指定
+DEFAULT_OP_TYPES = ('MatMul', 'Gemm', 'LSTM', 'GRU', 'Attention')
+
+# 原模型目录不可写（如安装在只读的site-packages中）时使用的缓存目录
+FALLBACK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'ddddocr-int8')
+
+# 同一进程内同一模型只量化一次
+_quantize_lock = threading.Lock()
+
+
+def quantized_model_path(model_path: str, op_types: Optional[Sequence[str]] = None,
+                         directory: Optional[str] = None) -> str:
+    """
+    获取量化模型缓存文件路径
+
+    使用默认算子时文件名为 <模型名>.int8.onnx，自定义算子时追加算子列表的摘要，互不覆盖
+
+    Args:
+        model_path: 原始模型路径
+        op_types: 量化的算子类型，None表示使用默认算子
+        directory: 缓存目录，None表示与原模型位于同一目录
+
+    Returns:
+        缓存文件路径
+    """
+    name = os.path.splitext(os.path.basename(model_path))[0]
+    suffix = 'int8'
+    if op_types is not None and tuple(op_types) != DEFAULT_OP_TYPES:
+        digest = hashlib.md5(','.join(sorted(op_types)).encode('utf-8')).hexdigest()[:8]
+        suffix = f'int8-{digest}'
+    directory = directory or os.path.dirname(os.path.abspath(model_path))
+    return os.path.join(directory, f"{name}.{suffix}.onnx")
+
+
+def _is_fresh(cache_path: str, model_path: str) -> bool:
+    """缓存文件存在且不早于原模型"""
+    return os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(model_path)
+
+
+def quantize_model(model_path: str, op_types: Optional[Sequence[str]] = None,
+                   directory: Optional[str] = None) -> str:
+    """
+    生成动态量化的INT8模型，已有不早于原模型的缓存时直接返回缓存路径
+
+    权重离线量化为int8，激活值在推理时动态量化，无需校准数据
+
+    Args:
+        model_path: 原始float32模型路径
+        op_types: 量化的算子类型，None表示使用DEFAULT_OP_TYPES
+        directory: 缓存目录，None表示与原模型位于同一目录（不可写时使用FALLBACK_CACHE_DIR）
+
+    Returns:
+        量化模型路径
+
+    Raises:
+        ModelLoadError: 当原模型不存在或量化失败时
+    """
+    if not os.path.exists(model_path):
+        raise ModelLoadError(f"模型文件不存在: {model_path}")
+
+    op_types = tuple(op_types) if op_types is not None else DEFAULT_OP_TYPES
+    cache_path = quantized_model_path(model_path, op_types, directory)
+    if _is_fresh(cache_path, model_path):
+        return cache_path
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        pass
+    if not os.access(cache_dir, os.W_OK):
+        if directory is not None:
+            raise ModelLoadError(f"量化模型缓存目录不可写: {cache_dir}")
+        print(f"模型目录不可写，量化模型将缓存到: {FALLBACK_CACHE_DIR}")
+        return quantize_model(model_path, op_types, FALLBACK_CACHE_DIR)
+
+    with _quantize_lock:
+        if _is_fresh(cache_path, model_path):
+            return cache_path
+
+        # 量化工具依赖onnx包，默认安装不包含
+        try:
+            import onnx  # noqa: F401
+        except ImportError as e:
+            raise ModelLoadError("生成INT8模型需要onnx，请安装: pip install ddddocr[quant]（或 pip install onnx）") from e
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+        except ImportError as e:
+            raise ModelLoadError(f"当前ONNX运行时不支持量化: {str(e)}") from e
+
+        # 先写入临时文件再原子替换，避免多个进程同时启动时读到不完整的模型
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            quantize_dynamic(model_path, temp_path, op_types_to_quantize=list(op_types),
+                             weight_type=QuantType.QInt8)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            raise ModelLoadError(f"模型量化失败: {str(e)}") from e
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    return cache_path
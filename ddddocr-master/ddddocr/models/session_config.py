@@ -0,0 +1,190 @@
+# coding=utf-8
+"""
+推理会话配置模块
+描述ONNX运行时SessionOptions及优化模型缓存设置
+"""
+
+import os
+from dataclasses import dataclass, asdict, fields
+from typing import Any, Dict, List, Optional, Union
+import onnxruntime
+
+from ..utils.exceptions import DDDDOCRError
+
+
+_EXECUTION_MODES = {
+    'sequential': onnxruntime.ExecutionMode.ORT_SEQUENTIAL,
+    'parallel': onnxruntime.ExecutionMode.ORT_PARALLEL,
+}
+
+_OPTIMIZATION_LEVELS = {
+    'disabled': onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    'basic': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    'extended': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    'all': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """
+    推理会话配置
+
+    不可变且可哈希，作为会话注册表键的一部分，
+    相同模型在不同配置下会创建不同的会话
+
+    Attributes:
+        intra_op_num_threads: 单个算子内部并行线程数，0表示由ONNX运行时决定
+        inter_op_num_threads: 算子之间并行线程数（仅parallel模式生效），0表示由ONNX运行时决定
+        execution_mode: 执行模式，'sequential'或'parallel'
+        graph_optimization_level: 图优化级别，'disabled'、'basic'、'extended'或'all'
+        enable_cpu_mem_arena: 是否启用CPU内存池
+        enable_mem_pattern: 是否启用内存复用模式
+        cache_optimized_model: 是否将优化后的模型缓存到磁盘并在之后启动时复用
+        optimized_model_dir: 优化模型缓存目录，默认与原模型位于同一目录
+    """
+
+    intra_op_num_threads: int = 0
+    inter_op_num_threads: int = 0
+    execution_mode: str = 'sequential'
+    graph_optimization_level: str = 'all'
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+    cache_optimized_model: bool = False
+    optimized_model_dir: Optional[str] = None
+
+    def __post_init__(self):
+        if not isinstance(self.intra_op_num_threads, int) or self.intra_op_num_threads < 0:
+            raise DDDDOCRError("intra_op_num_threads必须为非负整数")
+        if not isinstance(self.inter_op_num_threads, int) or self.inter_op_num_threads < 0:
+            raise DDDDOCRError("inter_op_num_threads必须为非负整数")
+        if self.execution_mode not in _EXECUTION_MODES:
+            available = ', '.join(_EXECUTION_MODES.keys())
+            raise DDDDOCRError(f"不支持的执行模式: {self.execution_mode}。可用模式: {available}")
+        if self.graph_optimization_level not in _OPTIMIZATION_LEVELS:
+            available = ', '.join(_OPTIMIZATION_LEVELS.keys())
+            raise DDDDOCRError(f"不支持的图优化级别: {self.graph_optimization_level}。可用级别: {available}")
+
+    @classmethod
+    def from_value(cls, value: Union['SessionConfig', Dict[str, Any], None]) -> Optional['SessionConfig']:
+        """
+        从配置对象或字典创建会话配置
+
+        Args:
+            value: SessionConfig对象、配置字典或None
+
+        Returns:
+            会话配置，输入为None时返回None
+
+        Raises:
+            DDDDOCRError: 当配置项无效时
+        """
+        if value is None or isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise DDDDOCRError(f"不支持的会话配置类型: {type(value)}")
+
+        known = {f.name for f in fields(cls)}
+        unknown = set(value) - known
+        if unknown:
+            raise DDDDOCRError(f"未知的会话配置项: {', '.join(sorted(unknown))}")
+        return cls(**{k: v for k, v in value.items() if v is not None})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为字典
+
+        Returns:
+            配置字典
+        """
+        return asdict(self)
+
+    def to_session_options(self) -> onnxruntime.SessionOptions:
+        """
+        构建ONNX运行时会话选项
+
+        Returns:
+            SessionOptions对象
+        """
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_num_threads
+        options.inter_op_num_threads = self.inter_op_num_threads
+        options.execution_mode = _EXECUTION_MODES[self.execution_mode]
+        options.graph_optimization_level = _OPTIMIZATION_LEVELS[self.graph_optimization_level]
+        options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        options.enable_mem_pattern = self.enable_mem_pattern
+        return options
+
+    def optimized_model_path(self, model_path: str, providers: List[Any]) -> str:
+        """
+        获取优化模型缓存文件路径
+
+        文件名包含优化级别和首个执行提供者，不同设备的优化结果互不覆盖
+
+        Args:
+            model_path: 原始模型路径
+            providers: ONNX运行时执行提供者
+
+        Returns:
+            缓存文件路径
+        """
+        provider = providers[0] if providers else 'CPUExecutionProvider'
+        if not isinstance(provider, str):
+            provider = provider[0]
+        provider = provider.replace('ExecutionProvider', '').lower()
+
+        directory = self.optimized_model_dir or os.path.dirname(os.path.abspath(model_path))
+        name = os.path.splitext(os.path.basename(model_path))[0]
+        return os.path.join(directory, f"{name}.{self.graph_optimization_level}.{provider}.opt.onnx")
+
+
+def create_inference_session(model_path: str, providers: List[Any],
+                             session_config: Optional[SessionConfig] = None) -> onnxruntime.InferenceSession:
+    """
+    按会话配置创建推理会话，开启缓存时优先加载已优化的模型
+
+    Args:
+        model_path: 模型文件路径
+        providers: ONNX运行时执行提供者
+        session_config: 会话配置，None表示使用ONNX运行时默认设置
+
+    Returns:
+        ONNX推理会话对象
+    """
+    onnxruntime.set_default_logger_severity(3)
+
+    if session_config is None:
+        return onnxruntime.InferenceSession(model_path, providers=providers)
+
+    options = session_config.to_session_options()
+    if not session_config.cache_optimized_model:
+        return onnxruntime.InferenceSession(model_path, sess_options=options, providers=providers)
+
+    cache_path = session_config.optimized_model_path(model_path, providers)
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(model_path):
+        try:
+            # 缓存的模型已完成图优化，加载时跳过优化
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return onnxruntime.InferenceSession(cache_path, sess_options=options, providers=providers)
+        except Exception as e:
+            print(f"优化模型缓存加载失败，将重新优化: {str(e)}")
+            options = session_config.to_session_options()
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        pass
+    if not os.access(cache_dir, os.W_OK):
+        print(f"优化模型缓存目录不可写，跳过缓存: {cache_dir}")
+        return onnxruntime.InferenceSession(model_path, sess_options=options, providers=providers)
+
+    # 先写入临时文件再原子替换，避免多个进程同时启动时读到不完整的缓存
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    options.optimized_model_filepath = temp_path
+    session = onnxruntime.InferenceSession(model_path, sess_options=options, providers=providers)
+    try:
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"优化模型缓存写入失败: {str(e)}")
+    return session
@@ -0,0 +1,276 @@
+# coding=utf-8
+"""
+推理会话注册表模块
+在进程内按(模型路径, 执行提供者, 会话配置)共享ONNX推理会话，并在首次推理时延迟创建，
+引用全部释放后的会话按LRU保留一段时间，反复创建短生命周期的实例时无需重新加载模型；
+预派生多进程模式下可在主进程中加载共享权重，工作进程创建的会话引用同一份权重内存
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import onnxruntime
+
+from .session_config import SessionConfig, create_inference_session
+from .shared_weights import SharedWeights
+from ..utils.exceptions import ModelLoadError
+from ..utils.hashable import freeze
+
+# 引用计数归零后保留的会话数上限
+DEFAULT_MAX_IDLE = 4
+
+
+class SharedSession:
+    """共享推理会话句柄，引用计数由注册表维护"""
+
+    def __init__(self, registry: 'SessionRegistry', key: Tuple, model_path: str, providers: List[Any],
+                 session_config: Optional[SessionConfig] = None):
+        """
+        初始化会话句柄
+
+        Args:
+            registry: 所属注册表
+            key: 注册表键
+            model_path: 模型文件路径
+            providers: ONNX运行时执行提供者
+            session_config: 会话配置
+        """
+        self.registry = registry
+        self.key = key
+        self.model_path = model_path
+        self.providers = providers
+        self.session_config = session_config
+        self.ref_count = 0
+        self.model_mtime = os.path.getmtime(model_path)
+        self._session: Optional[onnxruntime.InferenceSession] = None
+        self._weights: Optional[SharedWeights] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """会话是否已创建"""
+        return self._session is not None
+
+    @property
+    def shared_weights(self) -> Optional[SharedWeights]:
+        """主进程中加载的共享权重，未加载时为None"""
+        return self._weights
+
+    def get(self) -> onnxruntime.InferenceSession:
+        """
+        获取推理会话，首次调用时创建
+
+        Returns:
+            ONNX推理会话对象
+
+        Raises:
+            ModelLoadError: 当会话创建失败时
+        """
+        session = self._session
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._session is None:
+                try:
+                    if self._weights is not None:
+                        self._session = self._weights.create_session(self.providers, self.session_config)
+                    else:
+                        self._session = create_inference_session(self.model_path, self.providers,
+                                                                 self.session_config)
+                except Exception as e:
+                    raise ModelLoadError(f"模型加载失败: {str(e)}") from e
+            return self._session
+
+    def share_weights(self) -> SharedWeights:
+        """
+        加载共享权重，之后创建的会话引用这份权重而不是各自从模型文件加载
+
+        需在派生工作进程前于主进程中调用，且主进程自身不应创建会话
+
+        Returns:
+            共享权重对象
+
+        Raises:
+            ModelLoadError: 当共享权重加载失败时
+        """
+        with self._lock:
+            if self._weights is None:
+                self._weights = SharedWeights.load(self.model_path, self.providers, self.session_config)
+            return self._weights
+
+    def release(self) -> None:
+        """释放一次引用"""
+        self.registry.release(self)
+
+    def _close(self) -> None:
+        """丢弃会话对象"""
+        with self._lock:
+            self._session = None
+
+    def __repr__(self) -> str:
+        return f"SharedSession(model={self.model_path}, refs={self.ref_count}, loaded={self.loaded})"
+
+
+class SessionRegistry:
+    """
+    进程级推理会话注册表
+
+    引用计数归零的会话不会立即丢弃，而是进入空闲队列，最多保留max_idle个，
+    超出时按最久未使用的顺序丢弃；再次获取时直接复用（模型文件被修改过则重新加载）
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        """
+        初始化注册表
+
+        Args:
+            max_idle: 引用计数归零后保留的会话数上限，0表示立即丢弃
+        """
+        if max_idle < 0:
+            raise ValueError("max_idle不能为负数")
+        self.max_idle = max_idle
+        self._entries: Dict[Tuple, SharedSession] = {}
+        self._idle: 'OrderedDict[Tuple, SharedSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_path: str, providers: List[Any],
+                 session_config: Optional[SessionConfig] = None) -> Tuple:
+        """
+        生成注册表键
+
+        Args:
+            model_path: 模型文件路径
+            providers: ONNX运行时执行提供者
+            session_config: 会话配置
+
+        Returns:
+            可哈希的注册表键
+        """
+        return (os.path.realpath(model_path), freeze(providers), session_config)
+
+    def acquire(self, model_path: str, providers: List[Any],
+                session_config: Optional[SessionConfig] = None) -> SharedSession:
+        """
+        获取共享会话句柄并增加引用计数，会话本身在首次使用时才创建
+
+        Args:
+            model_path: 模型文件路径
+            providers: ONNX运行时执行提供者
+            session_config: 会话配置
+
+        Returns:
+            共享会话句柄
+
+        Raises:
+            ModelLoadError: 当模型文件不存在时
+        """
+        if not os.path.exists(model_path):
+            raise ModelLoadError(f"模型文件不存在: {model_path}")
+
+        key = self.make_key(model_path, providers, session_config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.ref_count == 0:
+                self._idle.pop(key, None)
+                if entry.model_mtime != os.path.getmtime(model_path):
+                    # 空闲期间模型文件被替换，丢弃旧会话
+                    del self._entries[key]
+                    entry._close()
+                    entry = None
+            if entry is None:
+                entry = SharedSession(self, key, model_path, list(providers), session_config)
+                self._entries[key] = entry
+            entry.ref_count += 1
+            return entry
+
+    def release(self, entry: SharedSession) -> None:
+        """
+        释放一次引用，引用计数归零时转入空闲队列
+
+        Args:
+            entry: 共享会话句柄
+        """
+        with self._lock:
+            if entry.ref_count > 0:
+                entry.ref_count -= 1
+            if entry.ref_count == 0 and self._entries.get(entry.key) is entry:
+                self._idle[entry.key] = entry
+                self._idle.move_to_end(entry.key)
+                self._trim_idle(self.max_idle)
+
+    def trim(self, max_idle: int = 0) -> None:
+        """
+        丢弃多余的空闲会话，如内存紧张时调用
+
+        Args:
+            max_idle: 保留的空闲会话数
+        """
+        with self._lock:
+            self._trim_idle(max_idle)
+
+    def _trim_idle(self, max_idle: int) -> None:
+        """按最久未使用的顺序丢弃空闲会话（调用方需持有锁）"""
+        while len(self._idle) > max_idle:
+            key, entry = self._idle.popitem(last=False)
+            del self._entries[key]
+            entry._close()
+
+    def share_weights(self) -> int:
+        """
+        为注册表中的所有会话加载共享权重，预派生多进程模式下由主进程在派生前调用
+
+        无法共享的会话（如非CPU执行提供者、缺少onnx）输出警告后仍由各工作进程各自加载
+
+        Returns:
+            已共享的权重总字节数
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        total = 0
+        for entry in entries:
+            try:
+                total += entry.share_weights().nbytes
+            except ModelLoadError as e:
+                print(f"警告: 模型 {entry.model_path} 无法共享权重，各工作进程将各自加载: {str(e)}")
+        return total
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        获取注册表中各会话的状态
+
+        Returns:
+            会话状态列表
+        """
+        with self._lock:
+            return [
+                {
+                    'model_path': entry.model_path,
+                    'providers': [p if isinstance(p, str) else p[0] for p in entry.providers],
+                    'ref_count': entry.ref_count,
+                    'loaded': entry.loaded,
+                    'shared_weights': entry.shared_weights is not None,
+                    'idle': entry.ref_count == 0
+                }
+                for entry in self._entries.values()
+            ]
+
+    def clear(self) -> None:
+        """清空注册表（已持有句柄的引擎需重新初始化）"""
+        with self._lock:
+            for entry in self._entries.values():
+                entry._close()
+            self._entries.clear()
+            self._idle.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SessionRegistry(sessions={len(self._entries)})"
+
+
+# 全局会话注册表
+session_registry = SessionRegistry()
@@ -0,0 +1,143 @@
+# coding=utf-8
+"""
+共享模型权重模块
+预派生多进程模式下由主进程完成一次图优化并将权重读入内存，派生后的工作进程以这些数组
+作为会话初始化器创建推理会话，权重所在的内存页在工作进程间写时复制共享，不随工作进程数成倍增长
+"""
+
+import os
+import sys
+import ctypes
+import tempfile
+from typing import Any, Dict, List, Optional
+import numpy as np
+import onnxruntime
+
+from .session_config import SessionConfig
+from ..utils.exceptions import ModelLoadError
+
+# 共享权重只支持CPU推理：其他执行提供者会把权重复制到设备内存，且设备上下文不能跨fork使用
+SHAREABLE_PROVIDERS = ('CPUExecutionProvider',)
+
+
+def release_free_memory() -> None:
+    """
+    将已释放的堆内存归还操作系统（仅glibc）
+
+    模型解析时的临时缓冲区释放后可能仍驻留在堆中，在工作进程里表现为私有内存
+    """
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        ctypes.CDLL('libc.so.6').malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class SharedWeights:
+    """
+    主进程中加载的优化后模型及其权重
+
+    工作进程创建会话时关闭图优化（主进程已完成）和权重预打包（预打包会为每个会话生成私有副本），
+    并用add_initializer让ONNX运行时直接引用这些numpy数组，而不是从模型中复制一份
+    """
+
+    def __init__(self, model_bytes: bytes, initializers: Dict[str, np.ndarray]):
+        """
+        初始化共享权重
+
+        Args:
+            model_bytes: 优化后的模型
+            initializers: 权重名到数组的映射
+        """
+        self.model_bytes = model_bytes
+        self.initializers = initializers
+        self._values: Optional[Dict[str, onnxruntime.OrtValue]] = None
+
+    @property
+    def nbytes(self) -> int:
+        """共享权重的字节数"""
+        return sum(array.nbytes for array in self.initializers.values())
+
+    @classmethod
+    def load(cls, model_path: str, providers: List[Any],
+             session_config: Optional[SessionConfig] = None) -> 'SharedWeights':
+        """
+        按会话配置优化模型并将权重读入内存，需在派生工作进程前于主进程中调用
+
+        Args:
+            model_path: 模型文件路径
+            providers: ONNX运行时执行提供者
+            session_config: 会话配置，决定图优化级别
+
+        Returns:
+            共享权重对象
+
+        Raises:
+            ModelLoadError: 当执行提供者不支持、缺少onnx或模型优化失败时
+        """
+        names = [p if isinstance(p, str) else p[0] for p in providers]
+        unsupported = [name for name in names if name not in SHAREABLE_PROVIDERS]
+        if unsupported:
+            raise ModelLoadError(f"共享权重仅支持CPU推理，当前执行提供者: {', '.join(unsupported)}")
+
+        # 读取优化后模型的权重需要onnx包，默认安装不包含
+        try:
+            import onnx
+            from onnx import numpy_helper
+        except ImportError as e:
+            raise ModelLoadError("共享权重需要onnx，请安装: pip install ddddocr[api]（或 pip install onnx）") from e
+
+        options = session_config.to_session_options() if session_config else onnxruntime.SessionOptions()
+        fd, temp_path = tempfile.mkstemp(suffix='.opt.onnx')
+        os.close(fd)
+        try:
+            # 在本机完成的优化结果只在本机的工作进程中使用，可以使用全部优化级别
+            options.optimized_model_filepath = temp_path
+            onnxruntime.set_default_logger_severity(3)
+            onnxruntime.InferenceSession(model_path, sess_options=options, providers=providers)
+            model = onnx.load(temp_path)
+        except Exception as e:
+            raise ModelLoadError(f"模型优化失败: {str(e)}") from e
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+        initializers = {tensor.name: numpy_helper.to_array(tensor) for tensor in model.graph.initializer}
+        model_bytes = model.SerializeToString()
+        del model
+        release_free_memory()
+        return cls(model_bytes, initializers)
+
+    def create_session(self, providers: List[Any],
+                       session_config: Optional[SessionConfig] = None) -> onnxruntime.InferenceSession:
+        """
+        创建引用共享权重的推理会话，在工作进程中调用
+
+        Args:
+            providers: ONNX运行时执行提供者
+            session_config: 会话配置（图优化级别与优化模型缓存设置不生效）
+
+        Returns:
+            ONNX推理会话对象
+        """
+        if self._values is None:
+            # OrtValue直接引用numpy数组的内存，需与会话同生命周期
+            self._values = {name: onnxruntime.OrtValue.ortvalue_from_numpy(array)
+                            for name, array in self.initializers.items()}
+
+        options = session_config.to_session_options() if session_config else onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        options.add_session_config_entry('session.disable_prepacking', '1')
+        for name, value in self._values.items():
+            options.add_initializer(name, value)
+
+        onnxruntime.set_default_logger_severity(3)
+        session = onnxruntime.InferenceSession(self.model_bytes, sess_options=options, providers=providers)
+        release_free_memory()
+        return session
+
+    def __repr__(self) -> str:
+        return f"SharedWeights(initializers={len(self.initializers)}, nbytes={self.nbytes})"
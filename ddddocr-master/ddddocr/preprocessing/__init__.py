@@ -4,10 +4,11 @@
 提供颜色过滤、图像增强等预处理功能
 """
 
-from .color_filter import ColorFilter
+from .color_filter import ColorFilter, CompiledColorFilter
 from .image_processor import ImageProcessor
 
 __all__ = [
     'ColorFilter',
+    'CompiledColorFilter',
     'ImageProcessor'
 ]
@@ -4,7 +4,9 @@
 提供基于HSV颜色空间的图像颜色过滤功能
 """
 
-from typing import List, Tuple, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Tuple, Optional, Sequence, Union
 import numpy as np
 from PIL import Image
 
@@ -15,6 +17,182 @@ from ..utils.image_io import image_to_numpy, numpy_to_image
 # 安全导入OpenCV
 cv2 = safe_import_opencv()
 
+HSVRange = Tuple[Tuple[int, int, int], Tuple[int, int, int]]
+
+# PIL转换为灰度（L模式）使用的ITU-R 601-2亮度系数（R、G、B，16位定点，结果四舍五入）。
+# OpenCV的灰度转换使用14位定点系数，少量像素与PIL相差1个灰度级
+PIL_LUMA_WEIGHTS = (19595, 38470, 7471)
+
+
+def _pil_grayscale(image: np.ndarray, rgb: bool) -> np.ndarray:
+    """按PIL的convert('L')计算uint8彩色数组的灰度，结果与PIL逐像素一致"""
+    red, blue = (0, 2) if rgb else (2, 0)
+    gray = image[..., red].astype(np.uint32) * PIL_LUMA_WEIGHTS[0]
+    gray += image[..., 1].astype(np.uint32) * PIL_LUMA_WEIGHTS[1]
+    gray += image[..., blue].astype(np.uint32) * PIL_LUMA_WEIGHTS[2]
+    gray += 0x8000
+    gray >>= 16
+    return gray.astype(np.uint8)
+
+
+class CompiledColorFilter:
+    """
+    编译后的颜色过滤器（不可变，可被多个线程共享）
+    
+    编译时合并S、V范围相同且H范围相邻或重叠的范围并预先生成上下界数组；
+    范围较多时改为每8个范围一组生成H、S、V三个通道的位查找表（第i位表示该值落在第i个范围内），
+    过滤时一次HSV转换后分通道查表并按位与，结果与逐个范围执行cv2.inRange再合并完全一致
+    """
+    
+    # 合并后的范围数不超过该值时逐个执行cv2.inRange（查表的固定开销约为3次inRange）
+    INRANGE_MAX_RANGES = 3
+    
+    def __init__(self, ranges: Sequence[HSVRange]):
+        """
+        编译颜色范围
+        
+        Args:
+            ranges: HSV范围列表，如 [((0,50,50), (10,255,255))]，为空时不命中任何像素
+        """
+        self.ranges = tuple((tuple(int(v) for v in lower), tuple(int(v) for v in upper))
+                            for lower, upper in ranges)
+        merged = self._merge_ranges(self.ranges)
+        
+        self._bounds = []
+        self._tables = []
+        if len(merged) <= self.INRANGE_MAX_RANGES:
+            for lower, upper in merged:
+                self._bounds.append((np.array(lower, dtype=np.uint8), np.array(upper, dtype=np.uint8)))
+            return
+        
+        for start in range(0, len(merged), 8):
+            tables = np.zeros((3, 256), dtype=np.uint8)
+            for bit, (lower, upper) in enumerate(merged[start:start + 8]):
+                for channel in range(3):
+                    tables[channel, lower[channel]:upper[channel] + 1] |= np.uint8(1 << bit)
+            tables.setflags(write=False)
+            self._tables.append(tables)
+    
+    @staticmethod
+    def _merge_ranges(ranges: Sequence[HSVRange]) -> List[HSVRange]:
+        """合并S、V上下界相同且H范围相邻或重叠的范围"""
+        groups = {}
+        for lower, upper in ranges:
+            groups.setdefault((lower[1:], upper[1:]), []).append((lower[0], upper[0]))
+        
+        merged = []
+        for (sv_lower, sv_upper), hue_ranges in groups.items():
+            hue_ranges.sort()
+            current = list(hue_ranges[0])
+            for low, high in hue_ranges[1:]:
+                if low <= current[1] + 1:
+                    current[1] = max(current[1], high)
+                else:
+                    merged.append(((current[0],) + sv_lower, (current[1],) + sv_upper))
+                    current = [low, high]
+            merged.append(((current[0],) + sv_lower, (current[1],) + sv_upper))
+        return merged
+    
+    def _match(self, image: np.ndarray, rgb: bool) -> np.ndarray:
+        """
+        计算命中掩码
+        
+        Args:
+            image: uint8彩色图片数组
+            rgb: 通道顺序是否为RGB（否则为BGR）
+            
+        Returns:
+            uint8数组，命中任一范围的像素非零
+        """
+        hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV if rgb else cv2.COLOR_BGR2HSV)
+        
+        if not self._tables:
+            if not self._bounds:
+                return np.zeros(hsv.shape[:2], dtype=np.uint8)
+            matched = cv2.inRange(hsv, *self._bounds[0])
+            for lower, upper in self._bounds[1:]:
+                cv2.bitwise_or(matched, cv2.inRange(hsv, lower, upper), dst=matched)
+            return matched
+        
+        planes = cv2.split(hsv)
+        matched = None
+        for tables in self._tables:
+            group = cv2.LUT(planes[0], tables[0])
+            cv2.bitwise_and(group, cv2.LUT(planes[1], tables[1]), dst=group)
+            cv2.bitwise_and(group, cv2.LUT(planes[2], tables[2]), dst=group)
+            matched = group if matched is None else cv2.bitwise_or(matched, group, dst=matched)
+        return matched
+    
+    def get_mask(self, image: np.ndarray, rgb: bool = False) -> np.ndarray:
+        """
+        获取颜色过滤的掩码
+        
+        Args:
+            image: uint8彩色图片数组
+            rgb: 通道顺序是否为RGB（否则为BGR）
+            
+        Returns:
+            二值掩码数组（命中为255，其余为0）
+        """
+        return cv2.compare(self._match(image, rgb), 0, cv2.CMP_NE)
+    
+    def apply(self, image: np.ndarray, rgb: bool = False) -> np.ndarray:
+        """
+        保留命中颜色的像素，其余像素设为白色
+        
+        Args:
+            image: uint8彩色图片数组
+            rgb: 通道顺序是否为RGB（否则为BGR）
+            
+        Returns:
+            与输入通道顺序相同的新数组
+        """
+        result = image.copy()
+        result[self._match(image, rgb) == 0] = 255
+        return result
+    
+    def filter_grayscale(self, image: np.ndarray, rgb: bool = False) -> np.ndarray:
+        """
+        过滤颜色并直接输出灰度图，未命中的像素为白色
+        
+        等价于filter_image后再用PIL转换为灰度（convert('L')，逐像素一致），但不生成中间的彩色结果
+        
+        Args:
+            image: uint8彩色图片数组
+            rgb: 通道顺序是否为RGB（否则为BGR）
+            
+        Returns:
+            形状为(H, W)的uint8灰度数组
+        """
+        gray = _pil_grayscale(image, rgb)
+        background = cv2.compare(self._match(image, rgb), 0, cv2.CMP_EQ)
+        return cv2.bitwise_or(gray, background, dst=gray)
+    
+    def filter_image(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
+        """
+        对图片进行颜色过滤
+        
+        Args:
+            image: 输入图片（PIL.Image，或BGR通道顺序的numpy.ndarray）
+            
+        Returns:
+            过滤后的PIL Image对象
+            
+        Raises:
+            ImageProcessError: 当图片处理失败时
+        """
+        try:
+            if isinstance(image, Image.Image):
+                # PIL图片直接在RGB空间处理，不再转换为BGR
+                return numpy_to_image(self.apply(image_to_numpy(image, 'RGB'), rgb=True), 'RGB')
+            return numpy_to_image(cv2.cvtColor(self.apply(image), cv2.COLOR_BGR2RGB), 'RGB')
+            
+        except Exception as e:
+            raise ImageProcessError(f"颜色过滤处理失败: {str(e)}") from e
+    
+    def __repr__(self) -> str:
+        return f"CompiledColorFilter(ranges={len(self.ranges)})"
+
 
 class ColorFilter:
     """图片颜色过滤器类，支持HSV颜色空间的颜色范围过滤"""
@@ -33,6 +211,11 @@ class ColorFilter:
         'gray': [((0, 0, 50), (180, 30, 200))]
     }
     
+    # 编译结果缓存的最大条目数
+    COMPILED_CACHE_SIZE = 64
+    _compiled_cache: 'OrderedDict[Hashable, CompiledColorFilter]' = OrderedDict()
+    _compiled_lock = threading.Lock()
+    
     def __init__(self, colors: Optional[List[str]] = None, 
                  custom_ranges: Optional[List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None):
         """
@@ -64,13 +247,72 @@ class ColorFilter:
         
         if not self.hsv_ranges:
             raise ValueError("必须指定colors或custom_ranges参数")
+        
+        self._compiled: Optional[CompiledColorFilter] = None
+    
+    @classmethod
+    def compile(cls, colors: Optional[List[str]] = None,
+                custom_ranges: Optional[List[HSVRange]] = None) -> CompiledColorFilter:
+        """
+        获取预设颜色和自定义范围组合对应的编译过滤器
+        
+        编译结果按参数缓存（LRU），相同组合只编译一次
+        
+        Args:
+            colors: 预设颜色名称列表，如 ['red', 'blue']
+            custom_ranges: 自定义HSV范围列表，如 [((0,50,50), (10,255,255))]
+            
+        Returns:
+            编译后的过滤器
+            
+        Raises:
+            ValueError: 当参数无效时
+        """
+        key = cls._compile_key(colors, custom_ranges)
+        if key is not None:
+            with cls._compiled_lock:
+                compiled = cls._compiled_cache.get(key)
+                if compiled is not None:
+                    cls._compiled_cache.move_to_end(key)
+                    return compiled
+        
+        compiled = cls(colors=colors, custom_ranges=custom_ranges)._compile()
+        if key is not None:
+            with cls._compiled_lock:
+                cls._compiled_cache[key] = compiled
+                cls._compiled_cache.move_to_end(key)
+                while len(cls._compiled_cache) > cls.COMPILED_CACHE_SIZE:
+                    cls._compiled_cache.popitem(last=False)
+        return compiled
+    
+    @staticmethod
+    def _compile_key(colors: Optional[List[str]],
+                     custom_ranges: Optional[List[HSVRange]]) -> Optional[Hashable]:
+        """生成编译缓存键，参数类型不符合要求时返回None（不缓存，由参数验证报错）"""
+        if colors is not None and not isinstance(colors, list):
+            return None
+        if custom_ranges is not None and not isinstance(custom_ranges, list):
+            return None
+        try:
+            key = (tuple(colors or ()),
+                   tuple((tuple(lower), tuple(upper)) for lower, upper in custom_ranges or ()))
+            hash(key)
+            return key
+        except (TypeError, ValueError):
+            return None
+    
+    def _compile(self) -> CompiledColorFilter:
+        """编译当前的颜色范围（范围变化后重新编译）"""
+        if self._compiled is None:
+            self._compiled = CompiledColorFilter(self.hsv_ranges)
+        return self._compiled
     
     def filter_image(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
         """
         对图片进行颜色过滤
         
         Args:
-            image: 输入图片（PIL.Image或numpy.ndarray）
+            image: 输入图片（PIL.Image，或BGR通道顺序的numpy.ndarray）
             
         Returns:
             过滤后的PIL Image对象
@@ -78,71 +320,25 @@ class ColorFilter:
         Raises:
             ImageProcessError: 当图片处理失败时
         """
-        try:
-            # 转换为numpy数组
-            if isinstance(image, Image.Image):
-                img_array = cv2.cvtColor(image_to_numpy(image, 'RGB'), cv2.COLOR_RGB2BGR)
-            else:
-                img_array = image.copy()
-            
-            # 转换到HSV颜色空间
-            hsv = cv2.cvtColor(img_array, cv2.COLOR_BGR2HSV)
-            
-            # 创建掩码
-            mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-            
-            for lower, upper in self.hsv_ranges:
-                # 创建当前颜色范围的掩码
-                range_mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-                # 合并到总掩码
-                mask = cv2.bitwise_or(mask, range_mask)
-            
-            # 应用掩码
-            result = cv2.bitwise_and(img_array, img_array, mask=mask)
-            
-            # 将背景设为白色
-            result[mask == 0] = [255, 255, 255]
-            
-            # 转换回PIL Image
-            result_rgb = cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-            return numpy_to_image(result_rgb, 'RGB')
-            
-        except Exception as e:
-            raise ImageProcessError(f"颜色过滤处理失败: {str(e)}") from e
+        return self._compile().filter_image(image)
     
     def get_mask(self, image: Union[Image.Image, np.ndarray]) -> np.ndarray:
         """
         获取颜色过滤的掩码
         
         Args:
-            image: 输入图片
+            image: 输入图片（PIL.Image，或BGR通道顺序的numpy.ndarray）
             
         Returns:
-            二值掩码数组
+            二值掩码数组（命中为255，其余为0）
             
         Raises:
             ImageProcessError: 当处理失败时
         """
         try:
-            # 转换为numpy数组
             if isinstance(image, Image.Image):
-                img_array = cv2.cvtColor(image_to_numpy(image, 'RGB'), cv2.COLOR_RGB2BGR)
-            else:
-                img_array = image.copy()
-            
-            # 转换到HSV颜色空间
-            hsv = cv2.cvtColor(img_array, cv2.COLOR_BGR2HSV)
-            
-            # 创建掩码
-            mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-            
-            for lower, upper in self.hsv_ranges:
-                # 创建当前颜色范围的掩码
-                range_mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-                # 合并到总掩码
-                mask = cv2.bitwise_or(mask, range_mask)
-            
-            return mask
+                return self._compile().get_mask(image_to_numpy(image, 'RGB'), rgb=True)
+            return self._compile().get_mask(image)
             
         except Exception as e:
             raise ImageProcessError(f"掩码生成失败: {str(e)}") from e
@@ -157,6 +353,7 @@ class ColorFilter:
         """
         validate_color_filter_params(None, [(lower, upper)])
         self.hsv_ranges.append((lower, upper))
+        self._compiled = None
     
     def add_preset_color(self, color: str) -> None:
         """
@@ -171,6 +368,7 @@ class ColorFilter:
         color_lower = color.lower()
         if color_lower in self.COLOR_PRESETS:
             self.hsv_ranges.extend(self.COLOR_PRESETS[color_lower])
+            self._compiled = None
         else:
             available_colors = ', '.join(self.COLOR_PRESETS.keys())
             raise ValueError(f"不支持的颜色预设: {color}。可用颜色: {available_colors}")
@@ -178,6 +376,7 @@ class ColorFilter:
     def clear_ranges(self) -> None:
         """清空所有颜色范围"""
         self.hsv_ranges.clear()
+        self._compiled = None
     
     def get_ranges(self) -> List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
         """
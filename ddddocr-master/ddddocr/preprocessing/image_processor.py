@@ -4,6 +4,9 @@
 提供图像预处理、增强、变换等功能
 """
 
+import os
+import base64
+import pathlib
 from typing import Tuple, Union, Optional
 import numpy as np
 from PIL import Image
@@ -285,3 +288,162 @@ class ImageProcessor:
             
         except Exception as e:
             raise ImageProcessError(f"OCR预处理失败: {str(e)}") from e
+    
+    @staticmethod
+    def decode_to_grayscale(image: Union[bytes, str, pathlib.PurePath, Image.Image, np.ndarray],
+                            png_fix: bool = False) -> Optional[np.ndarray]:
+        """
+        将输入直接解码为uint8灰度数组（OpenCV快速路径）
+        
+        bytes、文件路径和base64字符串由OpenCV直接解码为灰度图；
+        uint8的numpy数组（按RGB/RGBA通道顺序）和灰度数组不经过PIL；
+        PIL图像只做一次灰度转换，不再复制原图
+        
+        Args:
+            image: 输入图像
+            png_fix: 是否将RGBA透明背景合成为白色（与png_rgba_black_preprocess一致）
+            
+        Returns:
+            形状为(H, W)的uint8灰度数组，无法走快速路径时返回None
+        """
+        try:
+            image = ImageProcessor._read_encoded(image)
+            
+            if isinstance(image, (bytes, bytearray, memoryview)):
+                buffer = np.frombuffer(image, dtype=np.uint8)
+                if png_fix and ImageProcessor._is_rgba_png(image):
+                    decoded = cv2.imdecode(buffer, cv2.IMREAD_UNCHANGED)
+                    if decoded is None or decoded.ndim != 3 or decoded.shape[2] != 4 or decoded.dtype != np.uint8:
+                        return None
+                    return ImageProcessor._composite_on_white(
+                        cv2.cvtColor(decoded, cv2.COLOR_BGRA2GRAY), decoded[:, :, 3]
+                    )
+                return cv2.imdecode(buffer, cv2.IMREAD_GRAYSCALE)
+            
+            if isinstance(image, np.ndarray):
+                if image.dtype != np.uint8:
+                    return None
+                if image.ndim == 2:
+                    return image
+                if image.ndim == 3 and image.shape[2] == 1:
+                    return image[:, :, 0]
+                if image.ndim == 3 and image.shape[2] == 3:
+                    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+                if image.ndim == 3 and image.shape[2] == 4:
+                    gray = cv2.cvtColor(image, cv2.COLOR_RGBA2GRAY)
+                    return ImageProcessor._composite_on_white(gray, image[:, :, 3]) if png_fix else gray
+                return None
+            
+            if isinstance(image, Image.Image):
+                if png_fix and image.mode == 'RGBA':
+                    return None
+                return np.asarray(image if image.mode == 'L' else image.convert('L'))
+            
+            return None
+            
+        except Exception:
+            return None
+    
+    @staticmethod
+    def decode_to_bgr(image: Union[bytes, str, pathlib.PurePath, Image.Image, np.ndarray]) -> Optional[np.ndarray]:
+        """
+        将输入直接解码为OpenCV使用的uint8 BGR数组
+        
+        bytes、文件路径和base64字符串由OpenCV直接解码（忽略alpha通道）；
+        uint8的numpy数组按RGB/RGBA/灰度处理，PIL图像转换为RGB后按同样方式处理
+        
+        Args:
+            image: 输入图像
+            
+        Returns:
+            形状为(H, W, 3)的uint8 BGR数组，无法解码时返回None
+        """
+        try:
+            image = ImageProcessor._read_encoded(image)
+            
+            if isinstance(image, (bytes, bytearray, memoryview)):
+                return cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+            
+            if isinstance(image, Image.Image):
+                image = np.asarray(image if image.mode in ('RGB', 'L') else image.convert('RGB'))
+            
+            if isinstance(image, np.ndarray):
+                if image.dtype != np.uint8:
+                    return None
+                if image.ndim == 2:
+                    return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+                if image.ndim == 3 and image.shape[2] == 1:
+                    return cv2.cvtColor(image[:, :, 0], cv2.COLOR_GRAY2BGR)
+                if image.ndim == 3 and image.shape[2] == 3:
+                    return cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+                if image.ndim == 3 and image.shape[2] == 4:
+                    return cv2.cvtColor(image, cv2.COLOR_RGBA2BGR)
+            
+            return None
+            
+        except Exception:
+            return None
+    
+    @staticmethod
+    def resize_grayscale(gray: np.ndarray, target_size: Tuple[int, int]) -> np.ndarray:
+        """
+        使用OpenCV调整灰度图尺寸，缩小时使用区域插值，放大时使用Lanczos插值
+        
+        Args:
+            gray: uint8灰度数组
+            target_size: 目标尺寸 (width, height)
+            
+        Returns:
+            调整尺寸后的灰度数组
+        """
+        width, height = target_size
+        if gray.shape[1] == width and gray.shape[0] == height:
+            return gray
+        shrinking = width * height < gray.shape[0] * gray.shape[1]
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+        return cv2.resize(gray, (width, height), interpolation=interpolation)
+    
+    @staticmethod
+    def grayscale_to_tensor(gray: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        将uint8灰度图归一化写入形状为(1, 1, H, W)的float32张量
+        
+        Args:
+            gray: uint8灰度数组
+            out: 可复用的一维float32缓冲区，容量不足或为None时新分配
+            
+        Returns:
+            (1, 1, H, W)的连续float32数组（out不为None时为其视图）
+        """
+        height, width = gray.shape
+        size = height * width
+        if out is None or out.size < size:
+            out = np.empty(size, dtype=np.float32)
+        tensor = out[:size].reshape(1, 1, height, width)
+        np.divide(gray, np.float32(255.0), out=tensor[0, 0])
+        return tensor
+    
+    @staticmethod
+    def _read_encoded(image: Union[bytes, str, pathlib.PurePath, Image.Image, np.ndarray]):
+        """将文件路径或base64字符串读取为编码后的图片字节，其他输入原样返回"""
+        if isinstance(image, pathlib.PurePath):
+            with open(image, 'rb') as f:
+                return f.read()
+        if isinstance(image, str):
+            if os.path.exists(image):
+                with open(image, 'rb') as f:
+                    return f.read()
+            return base64.b64decode(image)
+        return image
+    
+    @staticmethod
+    def _is_rgba_png(data: bytes) -> bool:
+        """检查PNG文件头中的颜色类型是否为RGBA"""
+        return len(data) > 25 and data[:8] == b'\x89PNG\r\n\x1a\n' and data[25] == 6
+    
+    @staticmethod
+    def _composite_on_white(gray: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+        """按alpha通道将灰度图合成到白色背景上"""
+        alpha = alpha.astype(np.float32) / 255.0
+        composed = gray.astype(np.float32) * alpha + 255.0 * (1.0 - alpha)
+        return np.clip(np.rint(composed), 0, 255).astype(np.uint8)
@@ -4,9 +4,25 @@
 提供图像处理、异常处理、输入验证等工具函数
 """
 
-from .image_io import base64_to_image, get_img_base64, png_rgba_black_preprocess
+from typing import TYPE_CHECKING
+
 from .exceptions import DDDDOCRError, ModelLoadError, ImageProcessError
-from .validators import validate_image_input, validate_model_config
+from .lazy_import import lazy_attributes
+
+# 依赖PIL、NumPy的工具函数在首次访问时才导入，导入异常类不加载图像库
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'base64_to_image': '.image_io',
+    'get_img_base64': '.image_io',
+    'png_rgba_black_preprocess': '.image_io',
+    'validate_image_input': '.validators',
+    'validate_model_config': '.validators',
+    'ResultCache': '.result_cache',
+}, globals())
+
+if TYPE_CHECKING:
+    from .image_io import base64_to_image, get_img_base64, png_rgba_black_preprocess
+    from .validators import validate_image_input, validate_model_config
+    from .result_cache import ResultCache
 
 __all__ = [
     'base64_to_image',
@@ -16,5 +32,6 @@ __all__ = [
     'ModelLoadError',
     'ImageProcessError',
     'validate_image_input',
-    'validate_model_config'
+    'validate_model_config',
+    'ResultCache'
 ]
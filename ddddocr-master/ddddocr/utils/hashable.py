@@ -0,0 +1,24 @@
+# coding=utf-8
+"""
+可哈希转换模块
+将参数、提供者配置等嵌套的列表和字典转换为可作为字典键的形式
+"""
+
+from typing import Any, Hashable
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    将嵌套的列表、元组和字典递归转换为元组，字典按键排序，结果可用作缓存键或批次键
+
+    Args:
+        value: 任意嵌套结构
+
+    Returns:
+        可哈希的值
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
@@ -0,0 +1,47 @@
+# coding=utf-8
+"""
+延迟导入模块
+为包提供模块级__getattr__/__dir__（PEP 562），公共接口在首次访问时才导入所在模块
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str], namespace: Dict[str, Any],
+                    on_first_load: Optional[Callable[[], None]] = None) -> Tuple[Callable[[str], Any],
+                                                                                Callable[[], List[str]]]:
+    """
+    创建按需导入公共接口的模块级__getattr__和__dir__
+
+    导入后的对象写回包的命名空间，之后的访问不再经过__getattr__
+
+    Args:
+        package: 包名，通常为 __name__
+        attributes: 公共名称到所在模块（相对包的模块名，如 '.compat.legacy'）的映射，
+            名称与模块名相同（如 'core': '.core'）时返回子模块本身
+        namespace: 包的命名空间，通常为 globals()
+        on_first_load: 首次导入任一延迟对象前调用的函数
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+    state = {'loaded': False}
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        if not state['loaded']:
+            state['loaded'] = True
+            if on_first_load is not None:
+                on_first_load()
+        module = importlib.import_module(module_name, package)
+        value = module if module_name == f'.{name}' else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
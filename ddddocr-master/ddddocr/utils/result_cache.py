@@ -0,0 +1,428 @@
+# coding=utf-8
+"""
+识别结果缓存模块
+按图片内容哈希与识别参数缓存结果，支持LRU与TTL淘汰、内存上限以及相同请求的合并执行
+"""
+
+import os
+import asyncio
+import sys
+import copy
+import time
+import hashlib
+import pathlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .hashable import freeze
+
+
+def _estimate_size(value: Any) -> int:
+    """粗略估算缓存结果占用的内存字节数"""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_estimate_size(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class _Abandoned(Exception):
+    """计算方被取消或中断，等待的请求应重新查询缓存并在需要时接手计算"""
+
+
+class _Entry:
+    """缓存条目"""
+
+    __slots__ = ('value', 'size', 'expires_at')
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """
+    识别结果缓存
+
+    键由图片内容的blake2b哈希、模型标识和影响输出的参数组成。
+    同一键的并发请求只执行一次识别，其余请求等待并共享该结果（single-flight）；
+    识别失败的结果不会被缓存，计算方被取消时由等待的请求接手计算。缓存在线程间共享，可同时用于多个引擎实例
+    """
+
+    def __init__(self, max_entries: int = 10000, max_memory_mb: float = 64.0,
+                 ttl: Optional[float] = 300.0):
+        """
+        初始化结果缓存
+
+        Args:
+            max_entries: 最大缓存条目数
+            max_memory_mb: 缓存结果的内存上限（MB，按结果大小估算）
+            ttl: 条目有效期（秒），None或0表示不过期
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries必须大于等于1")
+        if max_memory_mb <= 0:
+            raise ValueError("max_memory_mb必须大于0")
+
+        self.max_entries = max_entries
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.ttl = ttl or None
+
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # 统计信息
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest(image: Any) -> Optional[str]:
+        """
+        计算图片内容哈希
+
+        Args:
+            image: bytes、文件路径、base64字符串、numpy数组或PIL图像
+
+        Returns:
+            十六进制哈希字符串，不支持的输入类型返回None
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            hasher.update(image)
+        elif isinstance(image, pathlib.PurePath) or (isinstance(image, str) and os.path.exists(image)):
+            with open(image, 'rb') as f:
+                hasher.update(f.read())
+        elif isinstance(image, str):
+            hasher.update(image.encode('utf-8'))
+        elif isinstance(image, np.ndarray):
+            hasher.update(f"{image.dtype.str}{image.shape}".encode('utf-8'))
+            hasher.update(np.ascontiguousarray(image).data)
+        elif isinstance(image, Image.Image):
+            hasher.update(f"{image.mode}{image.size}".encode('utf-8'))
+            hasher.update(image.tobytes())
+        else:
+            return None
+        return hasher.hexdigest()
+
+    @classmethod
+    def make_key(cls, namespace: Hashable, image: Any, **params) -> Optional[Tuple]:
+        """
+        生成缓存键
+
+        Args:
+            namespace: 模型标识（区分不同模型和功能）
+            image: 图片数据
+            **params: 影响识别结果的参数
+
+        Returns:
+            缓存键，无法计算图片哈希时返回None
+        """
+        image_digest = cls.digest(image)
+        if image_digest is None:
+            return None
+        return (freeze(namespace), image_digest, freeze(params))
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            (是否命中, 结果副本)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry.value
+        return True, self._copy(value)
+
+    def begin(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        登记一次未命中的计算，相同键已在计算中时返回该计算的future
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            (future, 是否由调用方负责计算)。调用方负责计算时需在结束后调用complete或fail
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            self.misses += 1
+            return future, True
+
+    def complete(self, key: Hashable, future: Future, value: Any) -> None:
+        """
+        写入计算结果并唤醒等待的请求
+
+        Args:
+            key: 缓存键
+            future: begin返回的future
+            value: 计算结果
+        """
+        self.put(key, value)
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        future.set_result(value)
+
+    def fail(self, key: Hashable, future: Future, error: BaseException) -> None:
+        """
+        标记计算失败（不缓存）并将异常传递给等待的请求
+
+        Args:
+            key: 缓存键
+            future: begin返回的future
+            error: 异常
+        """
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        future.set_exception(error)
+
+    def abandon(self, key: Hashable, future: Future) -> None:
+        """
+        放弃计算（如计算方的协程被取消），不缓存也不向等待的请求传递取消，
+        等待的请求会重新查询并由其中一个接手计算
+
+        Args:
+            key: 缓存键
+            future: begin返回的future
+        """
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        future.set_exception(_Abandoned())
+
+    def get_or_compute(self, key: Optional[Hashable], compute: Callable[[], Any]) -> Any:
+        """
+        读取缓存，未命中时计算并写入；相同键的并发调用只计算一次
+
+        Args:
+            key: 缓存键，None表示不使用缓存
+            compute: 计算函数
+
+        Returns:
+            结果
+        """
+        if key is None:
+            return compute()
+
+        while True:
+            hit, value = self.lookup(key)
+            if hit:
+                return value
+            future, owner = self.begin(key)
+            if owner:
+                break
+            try:
+                return self._copy(future.result())
+            except _Abandoned:
+                continue
+
+        try:
+            value = compute()
+        except Exception as e:
+            self.fail(key, future, e)
+            raise
+        except BaseException:
+            self.abandon(key, future)
+            raise
+        self.complete(key, future, value)
+        return self._copy(value)
+
+    async def get_or_compute_async(self, key: Optional[Hashable], compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        get_or_compute的协程版本，等待相同请求时不阻塞事件循环
+
+        Args:
+            key: 缓存键，None表示不使用缓存
+            compute: 返回可等待对象的计算函数
+
+        Returns:
+            结果
+        """
+        if key is None:
+            return await compute()
+
+        while True:
+            hit, value = self.lookup(key)
+            if hit:
+                return value
+            future, owner = self.begin(key)
+            if owner:
+                break
+            try:
+                # shield：等待方自身被取消时不能取消共享的future，否则会影响计算方和其他等待方
+                return self._copy(await asyncio.shield(asyncio.wrap_future(future)))
+            except _Abandoned:
+                continue
+
+        try:
+            value = await compute()
+        except Exception as e:
+            self.fail(key, future, e)
+            raise
+        except BaseException:
+            # 计算方被取消（如客户端断开）与等待方无关，交由等待方接手计算
+            self.abandon(key, future)
+            raise
+        self.complete(key, future, value)
+        return self._copy(value)
+
+    def get_or_compute_many(self, keys: List[Optional[Hashable]], items: List[Any],
+                            compute_batch: Callable[[List[Any]], List[Any]]) -> List[Any]:
+        """
+        批量读取缓存，只对未命中且未在计算中的项调用一次批量计算
+
+        Args:
+            keys: 与items等长的缓存键列表，None表示该项不使用缓存
+            items: 输入列表
+            compute_batch: 批量计算函数，接收输入列表并返回等长的结果列表
+
+        Returns:
+            与输入顺序一致的结果列表
+        """
+        results: List[Any] = [None] * len(items)
+        owned: List[Tuple[int, Optional[Hashable], Optional[Future]]] = []
+        waiting: List[Tuple[int, Future]] = []
+
+        for index, key in enumerate(keys):
+            if key is None:
+                owned.append((index, None, None))
+                continue
+            hit, value = self.lookup(key)
+            if hit:
+                results[index] = value
+                continue
+            future, owner = self.begin(key)
+            if owner:
+                owned.append((index, key, future))
+            else:
+                waiting.append((index, future))
+
+        if owned:
+            try:
+                values = compute_batch([items[index] for index, _, _ in owned])
+                if len(values) != len(owned):
+                    raise ValueError(f"批量计算结果数量不匹配: 期望{len(owned)}，实际{len(values)}")
+            except Exception as e:
+                for _, key, future in owned:
+                    if future is not None:
+                        self.fail(key, future, e)
+                raise
+            except BaseException:
+                for _, key, future in owned:
+                    if future is not None:
+                        self.abandon(key, future)
+                raise
+            for (index, key, future), value in zip(owned, values):
+                if future is not None:
+                    self.complete(key, future, value)
+                    value = self._copy(value)
+                results[index] = value
+
+        for index, future in waiting:
+            try:
+                results[index] = self._copy(future.result())
+            except _Abandoned:
+                item = items[index]
+                results[index] = self.get_or_compute(keys[index], lambda: compute_batch([item])[0])
+
+        return results
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        写入缓存，超出条目数或内存上限时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            value: 结果
+        """
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        value = self._copy(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """删除条目（调用方需持有锁）"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """返回结果副本，避免调用方修改缓存中的可变结果"""
+        if isinstance(value, (str, bytes, int, float, type(None))):
+            return value
+        return copy.deepcopy(value)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息
+
+        Returns:
+            统计信息字典
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_memory_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'inflight': len(self._inflight),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def clear(self) -> None:
+        """清空缓存条目（不影响计算中的请求）"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResultCache(entries={len(self._entries)}, hits={self.hits}, misses={self.misses})"
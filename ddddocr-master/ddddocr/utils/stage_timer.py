@@ -0,0 +1,162 @@
+# coding=utf-8
+"""
+阶段耗时统计模块
+记录一次请求在解码、预处理、推理、后处理等阶段的耗时，未激活计时器时不产生开销
+"""
+
+import time
+import functools
+import threading
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+_current_timer: ContextVar[Optional['StageTimer']] = ContextVar('ddddocr_stage_timer', default=None)
+
+
+class StageTimer:
+    """
+    阶段计时器
+
+    同一阶段多次执行时耗时累加；计时器可在线程间共享，
+    推理线程中记录的耗时可通过merge合并到请求的计时器
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.failed = False
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        累加阶段耗时
+
+        Args:
+            name: 阶段名称
+            seconds: 耗时（秒）
+        """
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def merge(self, other: 'StageTimer') -> None:
+        """
+        合并另一个计时器记录的阶段耗时
+
+        Args:
+            other: 其他计时器
+        """
+        with other._lock:
+            stages = list(other.stages.items())
+        for name, seconds in stages:
+            self.add(name, seconds)
+
+    def elapsed(self) -> float:
+        """计时器创建以来经过的秒数"""
+        return time.perf_counter() - self.start
+
+    def server_timing(self) -> str:
+        """
+        生成Server-Timing响应头的值
+
+        Returns:
+            如 "decode;dur=0.42, inference;dur=3.10, total;dur=4.05"（毫秒）
+        """
+        with self._lock:
+            stages = list(self.stages.items())
+        stages.append(('total', self.elapsed()))
+        return ', '.join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in stages)
+
+    def activate(self) -> '_Activation':
+        """
+        在当前上下文中激活计时器
+
+        Returns:
+            上下文管理器，退出时恢复之前的计时器
+        """
+        return _Activation(self)
+
+
+class _Activation:
+    """计时器激活上下文"""
+
+    __slots__ = ('timer', 'token')
+
+    def __init__(self, timer: StageTimer):
+        self.timer = timer
+        self.token = None
+
+    def __enter__(self) -> StageTimer:
+        self.token = _current_timer.set(self.timer)
+        return self.timer
+
+    def __exit__(self, *exc_info) -> None:
+        _current_timer.reset(self.token)
+
+
+class _Stage:
+    """阶段计时上下文"""
+
+    __slots__ = ('name', 'timer', 'begin')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.timer = None
+        self.begin = 0.0
+
+    def __enter__(self) -> '_Stage':
+        self.timer = _current_timer.get()
+        if self.timer is not None:
+            self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.timer is not None:
+            self.timer.add(self.name, time.perf_counter() - self.begin)
+
+
+def current_timer() -> Optional[StageTimer]:
+    """
+    获取当前上下文中激活的计时器
+
+    Returns:
+        计时器，未激活时返回None
+    """
+    return _current_timer.get()
+
+
+def stage(name: str) -> _Stage:
+    """
+    记录代码块耗时到当前计时器的指定阶段
+
+    Args:
+        name: 阶段名称，如 decode、preprocess、inference、postprocess
+
+    Returns:
+        上下文管理器
+    """
+    return _Stage(name)
+
+
+def timed_stage(name: str) -> Callable[[Callable], Callable]:
+    """
+    将函数执行耗时记录到当前计时器的指定阶段（装饰器）
+
+    Args:
+        name: 阶段名称
+
+    Returns:
+        装饰器
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = _current_timer.get()
+            if timer is None:
+                return func(*args, **kwargs)
+            begin = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.add(name, time.perf_counter() - begin)
+        return wrapper
+    return decorator
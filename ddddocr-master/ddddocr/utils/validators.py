@@ -5,12 +5,21 @@
 """
 
 import pathlib
-from typing import Union, List, Tuple, Any
+from typing import Union, List, Tuple, Any, Optional, Sequence
 from PIL import Image
 import numpy as np
 
 from .exceptions import DDDDOCRError
 
+# 概率数组编码方式：list为嵌套列表，float16为base64编码的float16二进制数据
+PROBABILITY_ENCODINGS = ('list', 'float16')
+
+# 滑块匹配模式：exact为全分辨率匹配，pyramid为先在缩小的图像上粗匹配再在全分辨率小窗口内精匹配
+SLIDE_MODES = ('exact', 'pyramid')
+
+# 模型精度：fp32为原始模型，int8为动态量化后的模型
+MODEL_PRECISIONS = ('fp32', 'int8')
+
 
 def validate_image_input(img_input: Any) -> bool:
     """
@@ -137,7 +146,7 @@ def validate_color_filter_params(colors: List[str] = None,
     return True
 
 
-def validate_charset_range(charset_range: Union[int, str, List[str]]) -> bool:
+def validate_charset_range(charset_range: Union[int, str, List[str], Tuple[str, ...]]) -> bool:
     """
     验证字符集范围参数
     
@@ -159,7 +168,7 @@ def validate_charset_range(charset_range: Union[int, str, List[str]]) -> bool:
     elif isinstance(charset_range, str):
         if len(charset_range) == 0:
             raise DDDDOCRError("字符集范围字符串不能为空")
-    elif isinstance(charset_range, list):
+    elif isinstance(charset_range, (list, tuple)):
         if len(charset_range) == 0:
             raise DDDDOCRError("字符集范围列表不能为空")
         for char in charset_range:
@@ -169,3 +178,91 @@ def validate_charset_range(charset_range: Union[int, str, List[str]]) -> bool:
         raise DDDDOCRError(f"不支持的字符集范围类型: {type(charset_range)}")
     
     return True
+
+
+def validate_probability_options(top_k: Optional[int] = None, probability_encoding: str = 'list') -> bool:
+    """
+    验证概率输出参数
+    
+    Args:
+        top_k: 每个字符返回的候选数量
+        probability_encoding: 概率数组的编码方式
+        
+    Returns:
+        bool: 参数是否有效
+        
+    Raises:
+        DDDDOCRError: 当参数无效时
+    """
+    if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1):
+        raise DDDDOCRError("top_k必须为正整数")
+    
+    if probability_encoding not in PROBABILITY_ENCODINGS:
+        raise DDDDOCRError(f"不支持的概率编码方式: {probability_encoding}，可选: {', '.join(PROBABILITY_ENCODINGS)}")
+    
+    return True
+
+
+def validate_slide_options(mode: str = 'exact', roi: Optional[Sequence[int]] = None,
+                           row_band: Optional[Sequence[int]] = None, tolerance: int = 2,
+                           pyramid_scale: float = 0.5) -> bool:
+    """
+    验证滑块匹配参数
+    
+    Args:
+        mode: 匹配模式
+        roi: 搜索区域 (x, y, width, height)
+        row_band: 搜索的行范围 (y_start, y_end)
+        tolerance: 金字塔模式允许的偏差像素数
+        pyramid_scale: 金字塔模式粗匹配的缩放比例
+        
+    Returns:
+        bool: 参数是否有效
+        
+    Raises:
+        DDDDOCRError: 当参数无效时
+    """
+    if mode not in SLIDE_MODES:
+        raise DDDDOCRError(f"不支持的滑块匹配模式: {mode}，可选: {', '.join(SLIDE_MODES)}")
+    
+    if roi is not None and row_band is not None:
+        raise DDDDOCRError("roi和row_band不能同时指定")
+    
+    for name, value, size in (('roi', roi, 4), ('row_band', row_band, 2)):
+        if value is None:
+            continue
+        if not isinstance(value, (list, tuple)) or len(value) != size:
+            raise DDDDOCRError(f"{name}必须为包含{size}个整数的列表或元组")
+        if not all(isinstance(v, int) and not isinstance(v, bool) and v >= 0 for v in value):
+            raise DDDDOCRError(f"{name}中的值必须为非负整数")
+    
+    if roi is not None and (roi[2] <= 0 or roi[3] <= 0):
+        raise DDDDOCRError("roi的宽度和高度必须大于0")
+    if row_band is not None and row_band[1] <= row_band[0]:
+        raise DDDDOCRError("row_band的结束行必须大于起始行")
+    
+    if not isinstance(tolerance, int) or isinstance(tolerance, bool) or tolerance < 0:
+        raise DDDDOCRError("tolerance必须为非负整数")
+    
+    if not isinstance(pyramid_scale, (int, float)) or not (0 < pyramid_scale < 1):
+        raise DDDDOCRError("pyramid_scale必须在0到1之间")
+    
+    return True
+
+
+def validate_precision(precision: str) -> bool:
+    """
+    验证模型精度参数
+
+    Args:
+        precision: 模型精度
+
+    Returns:
+        bool: 参数是否有效
+
+    Raises:
+        DDDDOCRError: 当精度不支持时
+    """
+    if precision not in MODEL_PRECISIONS:
+        raise DDDDOCRError(f"不支持的模型精度: {precision}，可选: {', '.join(MODEL_PRECISIONS)}")
+    return True
@@ -35,11 +35,15 @@ setup(
     ],
     install_requires=['numpy', 'onnxruntime', 'Pillow', 'opencv-python-headless'],
     extras_require={
-        'api': ['fastapi>=0.100.0', 'uvicorn[standard]>=0.20.0', 'pydantic>=2.0.0'],
-        'all': ['fastapi>=0.100.0', 'uvicorn[standard]>=0.20.0', 'pydantic>=2.0.0']
+        'api': ['fastapi>=0.100.0', 'uvicorn[standard]>=0.20.0', 'pydantic>=2.0.0', 'python-multipart>=0.0.6',
+                'onnx'],
+        'quant': ['onnx'],
+        'all': ['fastapi>=0.100.0', 'uvicorn[standard]>=0.20.0', 'pydantic>=2.0.0', 'python-multipart>=0.0.6',
+                'onnx']
     },
     python_requires='<=3.13',
     include_package_data=True,
+    package_data={'ddddocr.models': ['charsets/*.charset']},
     install_package_data=True,
     entry_points={
         'console_scripts': [
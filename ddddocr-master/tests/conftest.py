@@ -0,0 +1,43 @@
+# coding=utf-8
+"""
+测试公共夹具
+内置模型权重不在仓库中，测试使用形状与真实模型一致的替身模型（需安装onnx）
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def stand_in_models(tmp_path_factory):
+    """生成OCR与目标检测替身模型，返回 {'ocr', 'charsets', 'detection'} 路径"""
+    pytest.importorskip('onnx')
+    from ddddocr.benchmark.stand_in import build_stand_in_models
+    from ddddocr.models.charset_resource import load_builtin_charset
+
+    directory = tmp_path_factory.mktemp('models')
+    return build_stand_in_models(str(directory), load_builtin_charset('old').chars)
+
+
+@pytest.fixture(scope='session')
+def captcha_images():
+    """不同宽度的合成验证码图片"""
+    from ddddocr.benchmark.images import captcha_image
+    return [captcha_image(width=width, height=40, seed=index)
+            for index, width in enumerate((60, 97, 100, 131, 160, 203, 250, 400))]
+
+
+@pytest.fixture(scope='session')
+def context_ocr_model(tmp_path_factory):
+    """时间步之间有序列上下文的OCR替身模型，返回 {'ocr', 'charsets'} 路径"""
+    pytest.importorskip('onnx')
+    from ddddocr.benchmark.stand_in import build_ocr_model
+    from ddddocr.models.charset_resource import load_builtin_charset
+
+    path = str(tmp_path_factory.mktemp('context') / 'ocr_context.onnx')
+    charsets = build_ocr_model(path, load_builtin_charset('old').chars, context=2)
+    return {'ocr': path, 'charsets': charsets}
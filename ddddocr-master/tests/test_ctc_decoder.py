@@ -0,0 +1,80 @@
+# coding=utf-8
+"""
+CTC解码测试
+向量化解码结果与原逐时间步循环实现一致
+"""
+
+import numpy as np
+
+from ddddocr.core.ctc_decoder import CTCDecoder
+
+CHARSET = [''] + list('abcdefghij')
+
+
+def _reference_decode(output: np.ndarray, charset, valid_indices=None) -> str:
+    """原实现：逐时间步argmax后去除连续重复和blank，再按字符集范围过滤"""
+    predicted = np.argmax(output, axis=1)
+    decoded = []
+    previous = None
+    for index in predicted:
+        index = int(index)
+        if index != previous and index != 0:
+            decoded.append(index)
+        previous = index
+    return ''.join(charset[i] for i in decoded
+                   if (valid_indices is None or i in valid_indices) and 0 <= i < len(charset))
+
+
+def _logits(rng, steps, batch=None):
+    # 类别数少、时间步多，保证出现大量连续重复和blank
+    shape = (steps, len(CHARSET)) if batch is None else (steps, batch, len(CHARSET))
+    return rng.randn(*shape).astype(np.float32)
+
+
+def test_decode_matches_reference():
+    rng = np.random.RandomState(0)
+    decoder = CTCDecoder(CHARSET)
+    for steps in (1, 2, 7, 50):
+        for _ in range(20):
+            output = _logits(rng, steps)
+            expected = _reference_decode(output, CHARSET)
+            assert decoder.decode(output) == expected
+            assert decoder.decode(output[:, np.newaxis, :]) == expected
+            assert decoder.decode(output[np.newaxis]) == expected
+
+
+def test_decode_batch_matches_reference():
+    rng = np.random.RandomState(1)
+    decoder = CTCDecoder(CHARSET)
+    output = _logits(rng, 40, batch=6)
+    expected = [_reference_decode(output[:, i], CHARSET) for i in range(6)]
+    assert decoder.decode_batch(output, 6) == expected
+    assert decoder.decode_batch(output.transpose(1, 0, 2), 6) == expected
+
+
+def test_decode_batch_lengths_match_truncated_reference():
+    rng = np.random.RandomState(2)
+    decoder = CTCDecoder(CHARSET)
+    output = _logits(rng, 40, batch=4)
+    lengths = [40, 1, 17, 33]
+    expected = [_reference_decode(output[:length, i], CHARSET) for i, length in enumerate(lengths)]
+    assert decoder.decode_batch(output, 4, lengths=lengths) == expected
+
+
+def test_valid_indices_restrict_argmax():
+    """字符集范围限制在允许的类别上取argmax，等价于把其余类别的logits置为负无穷后按原实现解码"""
+    rng = np.random.RandomState(3)
+    decoder = CTCDecoder(CHARSET)
+    valid = np.array([0, 2, 3, 5])
+    for _ in range(20):
+        output = _logits(rng, 30)
+        masked = np.full_like(output, -np.inf)
+        masked[:, valid] = output[:, valid]
+        assert decoder.decode(output, valid) == _reference_decode(masked, CHARSET)
+        assert set(decoder.decode(output, valid)) <= {CHARSET[i] for i in valid}
+
+
+def test_empty_valid_indices_returns_empty_text():
+    decoder = CTCDecoder(CHARSET)
+    output = np.random.RandomState(4).randn(10, len(CHARSET)).astype(np.float32)
+    assert decoder.decode(output, np.array([], dtype=np.int64)) == ''
@@ -0,0 +1,99 @@
+# coding=utf-8
+"""
+目标检测测试
+向量化NMS与逐框循环的贪心NMS结果一致，批量检测与逐张检测结果一致
+"""
+
+import numpy as np
+import pytest
+
+
+def _greedy_nms(boxes, scores, nms_thr):
+    """原实现：逐框循环的贪心NMS"""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+    order = scores.argsort()[::-1]
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(int(i))
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+        inter = np.maximum(0.0, xx2 - xx1 + 1) * np.maximum(0.0, yy2 - yy1 + 1)
+        ovr = inter / (areas[i] + areas[order[1:]] - inter)
+        order = order[np.where(ovr <= nms_thr)[0] + 1]
+    return keep
+
+
+def _random_boxes(rng, count, extent=200.0):
+    """生成聚集在少数中心附近、大量相互重叠的候选框"""
+    centers = rng.rand(max(1, count // 8), 2) * extent
+    picked = centers[rng.randint(len(centers), size=count)] + rng.randn(count, 2) * 6
+    sizes = rng.rand(count, 2) * 40 + 10
+    boxes = np.concatenate([picked - sizes / 2, picked + sizes / 2], axis=1).astype(np.float32)
+    scores = rng.rand(count).astype(np.float32)
+    return boxes, scores
+
+
+@pytest.fixture(scope='module')
+def engine(stand_in_models):
+    from ddddocr.benchmark.engine_bench import _StandInDetectionEngine
+    return _StandInDetectionEngine(stand_in_models['detection'])
+
+
+@pytest.mark.parametrize('count', [1, 2, 10, 100, 500])
+@pytest.mark.parametrize('nms_thr', [0.3, 0.45, 0.7])
+def test_vectorized_nms_matches_greedy(engine, count, nms_thr):
+    rng = np.random.RandomState(count)
+    boxes, scores = _random_boxes(rng, count)
+    expected = _greedy_nms(boxes, scores, nms_thr)
+    assert [int(i) for i in engine.nms(boxes, scores, nms_thr)] == expected
+    assert [int(i) for i in engine._nms_loop(boxes, scores, nms_thr)] == expected
+
+
+def test_batched_nms_matches_per_image(engine):
+    """多图像NMS中不同图像的候选框互不抑制，结果与逐图像NMS一致"""
+    rng = np.random.RandomState(7)
+    groups = [_random_boxes(rng, count) for count in (30, 0, 5, 60, 1)]
+    boxes = np.concatenate([g[0] for g in groups])
+    scores = np.concatenate([g[1] for g in groups])
+    image_ids = np.concatenate([np.full(len(g[1]), i) for i, g in enumerate(groups)]).astype(np.int64)
+
+    expected = []
+    offset = 0
+    for group_boxes, group_scores in groups:
+        expected.extend(offset + i for i in _greedy_nms(group_boxes, group_scores, 0.45))
+        offset += len(group_scores)
+    assert engine.batched_nms(boxes, scores, image_ids, 0.45).tolist() == expected
+
+
+def test_batched_nms_empty(engine):
+    empty = np.zeros((0, 4), dtype=np.float32)
+    assert engine.batched_nms(empty, np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64), 0.45).size == 0
+
+
+def test_detect_batch_matches_single(engine):
+    """批量检测与逐张检测结果一致"""
+    from ddddocr.benchmark.images import detection_image
+
+    images = [detection_image(320, 160, seed=seed) for seed in range(4)]
+    expected = [engine.predict(image) for image in images]
+    assert any(expected)
+    assert engine.detect_batch(images) == expected
+
+
+def test_detect_batch_reads_session_inputs_once(engine, monkeypatch):
+    """会话的输入元数据只在首次使用时读取，之后的批量检测不再查询"""
+    from ddddocr.benchmark.images import detection_image
+
+    images = [detection_image(320, 160, seed=seed) for seed in range(2)]
+    engine.detect_batch(images)
+    session = engine.session
+    calls = []
+    original = session.get_inputs
+    monkeypatch.setattr(session, 'get_inputs', lambda: calls.append(1) or original())
+    engine.detect_batch(images)
+    engine.predict(images[0])
+    assert calls == []
@@ -0,0 +1,74 @@
+# coding=utf-8
+"""
+模型实例槽位测试
+替换后新请求只拿到新实例，旧实例等租用全部结束后才能释放
+"""
+
+import threading
+
+from ddddocr.api.model_slot import ModelSlot
+
+
+class _Model:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_swap_routes_new_leases_to_new_instance():
+    old, new = _Model('old'), _Model('new')
+    slot = ModelSlot('ocr', old)
+    with slot.lease() as leased:
+        assert leased is old
+        assert slot.swap(new) is old
+        with slot.lease() as second:
+            assert second is new
+        assert slot.in_flight(old) == 1
+        assert slot.in_flight(new) == 0
+    assert slot.in_flight() == 0
+
+
+def test_drain_waits_for_in_flight_leases():
+    old, new = _Model('old'), _Model('new')
+    slot = ModelSlot('ocr', old)
+    entered = threading.Event()
+    finish = threading.Event()
+
+    def request():
+        with slot.lease():
+            entered.set()
+            finish.wait(5)
+
+    worker = threading.Thread(target=request)
+    worker.start()
+    entered.wait(5)
+
+    slot.swap(new)
+    assert slot.drain(old, timeout=0.05) is False
+
+    drained = []
+    waiter = threading.Thread(target=lambda: drained.append(slot.drain(old, timeout=5)))
+    waiter.start()
+    finish.set()
+    worker.join(5)
+    waiter.join(5)
+    assert drained == [True]
+    assert slot.in_flight(old) == 0
+
+
+def test_drain_idle_instance_returns_immediately():
+    old = _Model('old')
+    slot = ModelSlot('ocr', old)
+    slot.swap(None)
+    assert slot.drain(old, timeout=0) is True
+    with slot.lease() as leased:
+        assert leased is None
+    assert slot.in_flight() == 0
+
+
+def test_nested_leases_are_counted():
+    model = _Model('m')
+    slot = ModelSlot('ocr', model)
+    with slot.lease(), slot.lease():
+        assert slot.in_flight(model) == 2
+        assert slot.drain(model, timeout=0) is False
+    assert slot.drain(model, timeout=0) is True
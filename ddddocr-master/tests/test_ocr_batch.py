@@ -0,0 +1,46 @@
+# coding=utf-8
+"""
+批量OCR测试
+"""
+
+from ddddocr.compat.legacy import DdddOcr
+
+
+def _create(models):
+    return DdddOcr(show_ad=False, import_onnx_path=models['ocr'], charsets_path=models['charsets'])
+
+
+def test_batch_matches_single(stand_in_models, captcha_images):
+    """批量识别与逐张识别结果一致，顺序与输入一致"""
+    ocr = _create(stand_in_models)
+    images = captcha_images + captcha_images[::-1]
+    assert ocr.classification_batch(images) == [ocr.classification(image) for image in images]
+
+
+def test_batch_matches_single_with_sequence_context(context_ocr_model, captcha_images):
+    """有序列上下文的模型上批量识别也与逐张识别一致（不同宽度的图片不会被填充合并）"""
+    ocr = _create(context_ocr_model)
+    images = captcha_images + [captcha_images[0]] * 3
+    assert ocr.classification_batch(images) == [ocr.classification(image) for image in images]
+
+
+def test_batch_probability_matches_single(context_ocr_model, captcha_images):
+    """概率输出的批量结果与逐张结果一致"""
+    import numpy as np
+
+    ocr = _create(context_ocr_model)
+    images = [captcha_images[1]] * 2 + [captcha_images[2]]
+    batch = ocr.classification_batch(images, probability=True)
+    for image, result in zip(images, batch):
+        single = ocr.classification(image, probability=True)
+        assert result['text'] == single['text']
+        # 逐张识别的概率矩阵保留了大小为1的batch维度
+        np.testing.assert_allclose(np.squeeze(result['probabilities']), np.squeeze(single['probabilities']),
+                                   atol=1e-6)
+
+
+def test_padded_batch_matches_single_for_independent_steps(stand_in_models, captcha_images):
+    """开启pad_batch时，时间步相互独立的模型结果不变"""
+    ocr = _create(stand_in_models)
+    ocr.ocr_engine.pad_batch = True
+    assert ocr.classification_batch(captcha_images) == [ocr.classification(image) for image in captcha_images]
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+OCR预处理测试
+"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+from ddddocr.core.ocr_engine import OCREngine
+
+
+# 快速路径与PIL路径输入张量（取值0~1）的差异上限：缩放插值不同，个别边缘像素相差较大，整体平均差异很小
+MAX_ABS_DIFF = 0.2
+MEAN_ABS_DIFF = 0.01
+
+
+def _engine(models, **kwargs):
+    return OCREngine(import_onnx_path=models['ocr'], charsets_path=models['charsets'], **kwargs)
+
+
+def test_default_preprocess_uses_pil_path(stand_in_models, captcha_images):
+    """默认不使用OpenCV快速路径，识别结果与旧版PIL预处理一致"""
+    engine = _engine(stand_in_models)
+    assert engine.fast_preprocess is False
+    assert engine._fast_preprocess(captcha_images[0], False) is None
+
+
+def test_fast_preprocess_matches_pil_within_tolerance(stand_in_models):
+    """开启快速路径时输入张量的形状与PIL路径一致，数值只在缩放插值的误差范围内"""
+    from ddddocr.benchmark.images import captcha_image
+
+    engine = _engine(stand_in_models, fast_preprocess=True)
+    assert engine.fast_preprocess is True
+    for seed in range(20):
+        for width, height in ((100, 40), (160, 60), (250, 50), (90, 30)):
+            image = captcha_image(width=width, height=height, seed=seed)
+            fast = engine._fast_preprocess(image, False, reuse_buffer=False)
+            reference = engine._preprocess_image(Image.open(io.BytesIO(image)), False)
+            assert fast.shape == reference.shape
+            diff = np.abs(fast - reference)
+            assert diff.max() < MAX_ABS_DIFF
+            assert diff.mean() < MEAN_ABS_DIFF
+
+
+def test_ddddocr_fast_preprocess_argument(stand_in_models, captcha_images):
+    from ddddocr.compat.legacy import DdddOcr
+
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'],
+                  fast_preprocess=True)
+    assert ocr.ocr_engine.fast_preprocess is True
+    assert ocr.get_model_info()['fast_preprocess'] is True
+    assert ocr.ocr_engine._fast_preprocess(captcha_images[0], False) is not None
+    assert isinstance(ocr.classification(captcha_images[0]), str)
+
+
+def test_compiled_filter_grayscale_matches_pil():
+    """颜色过滤后直接输出的灰度图与过滤后再用PIL转换为灰度逐像素一致"""
+    from ddddocr.preprocessing.color_filter import ColorFilter
+
+    rng = np.random.RandomState(0)
+    rgb = rng.randint(0, 256, (60, 180, 3), dtype=np.uint8)
+    for colors in (['red'], ['red', 'blue', 'green'], ['black', 'white', 'gray', 'yellow']):
+        compiled = ColorFilter.compile(colors=colors)
+        expected = np.array(compiled.filter_image(Image.fromarray(rgb)).convert('L'))
+        assert np.array_equal(compiled.filter_grayscale(rgb, rgb=True), expected)
+        assert np.array_equal(compiled.filter_grayscale(np.ascontiguousarray(rgb[..., ::-1])), expected)
+
+
+def test_bulk_runner_fast_preprocess(stand_in_models, captcha_images, tmp_path):
+    from ddddocr.bulk import BulkRunner
+
+    paths = []
+    for index, image in enumerate(captcha_images[:3]):
+        path = tmp_path / f'{index}.png'
+        path.write_bytes(image)
+        paths.append(str(path))
+    runner = BulkRunner('ocr', workers=1, import_onnx_path=stand_in_models['ocr'],
+                        charsets_path=stand_in_models['charsets'], color_filter_colors=['red', 'blue'],
+                        fast_preprocess=True)
+    records = list(runner.run(paths))
+    assert [record['path'] for record in records] == paths
+    assert all('text' in record for record in records)
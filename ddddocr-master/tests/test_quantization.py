@@ -0,0 +1,25 @@
+# coding=utf-8
+"""
+模型量化测试
+"""
+
+import sys
+
+import pytest
+
+from ddddocr.models.quantization import quantize_model
+from ddddocr.utils.exceptions import ModelLoadError
+
+
+def test_quantize_reports_missing_onnx(stand_in_models, tmp_path, monkeypatch):
+    """未安装onnx时错误信息指出缺少的包及安装方式"""
+    monkeypatch.setitem(sys.modules, 'onnx', None)
+    with pytest.raises(ModelLoadError, match=r'pip install ddddocr\[quant\]'):
+        quantize_model(stand_in_models['ocr'], directory=str(tmp_path))
+
+
+def test_quantize_caches_model(stand_in_models, tmp_path):
+    pytest.importorskip('onnxruntime.quantization')
+    path = quantize_model(stand_in_models['ocr'], directory=str(tmp_path))
+    assert path.endswith('.int8.onnx')
+    assert quantize_model(stand_in_models['ocr'], directory=str(tmp_path)) == path
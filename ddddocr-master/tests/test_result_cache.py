@@ -0,0 +1,214 @@
+# coding=utf-8
+"""
+识别结果缓存测试
+"""
+
+from ddddocr.compat.legacy import DdddOcr
+from ddddocr.utils.result_cache import ResultCache
+
+
+def test_shared_empty_cache_instance_is_used(stand_in_models, captcha_images):
+    """传入的空缓存实例不能因为长度为0被当作未启用"""
+    cache = ResultCache(100)
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'],
+                  charsets_path=stand_in_models['charsets'], result_cache=cache)
+    assert ocr.result_cache is cache
+    assert ocr.ocr_engine.result_cache is cache
+
+    first = ocr.classification(captcha_images[0])
+    second = ocr.classification(captcha_images[0])
+    assert first == second
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 1
+    assert ocr.get_model_info()['result_cache']['entries'] == 1
+
+
+def test_result_cache_false_disables_cache(stand_in_models):
+    """result_cache=False 与不传入相同"""
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'],
+                  charsets_path=stand_in_models['charsets'], result_cache=False)
+    assert ocr.result_cache is None
+    assert ocr.ocr_engine.result_cache is None
+
+
+def test_cancelled_owner_hands_computation_to_waiter():
+    """计算方协程被取消时，等待相同键的请求接手计算而不是收到取消"""
+    import asyncio
+
+    cache = ResultCache(100)
+    calls = []
+
+    async def main():
+        started = asyncio.Event()
+
+        async def slow():
+            calls.append('slow')
+            started.set()
+            await asyncio.sleep(10)
+            return 'slow'
+
+        async def fast():
+            calls.append('fast')
+            return 'fast'
+
+        owner = asyncio.ensure_future(cache.get_or_compute_async(('k',), slow))
+        await started.wait()
+        waiter = asyncio.ensure_future(cache.get_or_compute_async(('k',), fast))
+        await asyncio.sleep(0)
+        owner.cancel()
+        result = await waiter
+        assert owner.cancelled()
+        return result
+
+    assert asyncio.run(main()) == 'fast'
+    assert calls == ['slow', 'fast']
+    assert cache.stats()['inflight'] == 0
+    assert cache.lookup(('k',)) == (True, 'fast')
+
+
+def test_cancelled_waiter_does_not_cancel_owner():
+    """等待方被取消不影响计算方及其结果写入缓存"""
+    import asyncio
+
+    cache = ResultCache(100)
+
+    async def main():
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return 'value'
+
+        owner = asyncio.ensure_future(cache.get_or_compute_async(('k',), compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute_async(('k',), compute))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await owner
+
+    assert asyncio.run(main()) == 'value'
+    assert cache.lookup(('k',)) == (True, 'value')
+
+
+def test_hit_returns_copy():
+    """命中返回结果副本，调用方修改结果不影响缓存"""
+    cache = ResultCache(10)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'text': 'ab', 'boxes': [[1, 2, 3, 4]]}
+
+    first = cache.get_or_compute(('k',), compute)
+    first['boxes'].append([0, 0, 0, 0])
+    second = cache.get_or_compute(('k',), compute)
+    assert second == {'text': 'ab', 'boxes': [[1, 2, 3, 4]]}
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    from ddddocr.utils import result_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, 'monotonic', lambda: now[0])
+    cache = ResultCache(10, ttl=5)
+    cache.put(('k',), 'v')
+    now[0] += 4.9
+    assert cache.lookup(('k',)) == (True, 'v')
+    now[0] += 0.2
+    assert cache.lookup(('k',)) == (False, None)
+    assert len(cache) == 0
+
+
+def test_lru_eviction_and_memory_limit():
+    cache = ResultCache(max_entries=2)
+    cache.put(('a',), 'a')
+    cache.put(('b',), 'b')
+    cache.lookup(('a',))
+    cache.put(('c',), 'c')
+    assert cache.lookup(('b',)) == (False, None)
+    assert cache.lookup(('a',)) == (True, 'a')
+    assert cache.stats()['evictions'] == 1
+
+    small = ResultCache(max_entries=100, max_memory_mb=0.001)
+    small.put(('big',), 'x' * 4096)
+    assert len(small) == 0
+
+
+def test_failures_are_not_cached():
+    cache = ResultCache(10)
+
+    def fail():
+        raise ValueError('boom')
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute(('k',), fail)
+        except ValueError:
+            pass
+    assert cache.stats()['misses'] == 2
+    assert cache.stats()['inflight'] == 0
+    assert len(cache) == 0
+
+
+def test_single_flight_across_threads():
+    """相同键的并发请求只计算一次"""
+    import threading
+    import time
+
+    cache = ResultCache(10)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.get_or_compute(('k',), compute)))
+    owner.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=lambda: results.append(cache.get_or_compute(('k',), compute)))
+               for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()['coalesced'] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [owner] + waiters:
+        thread.join(5)
+
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+    assert cache.stats()['coalesced'] == 4
+
+
+def test_get_or_compute_many_only_computes_misses():
+    cache = ResultCache(10)
+    cache.put(('b',), 'B')
+    batches = []
+
+    def compute_batch(items):
+        batches.append(list(items))
+        return [item.upper() for item in items]
+
+    keys = [('a',), ('b',), None, ('a',)]
+    assert cache.get_or_compute_many(keys[:3], ['a', 'b', 'c'], compute_batch) == ['A', 'B', 'C']
+    assert batches == [['a', 'c']]
+    assert cache.get_or_compute_many([('a',)], ['a'], compute_batch) == ['A']
+    assert len(batches) == 1
+
+
+def test_make_key_distinguishes_params():
+    image = b'image-bytes'
+    assert ResultCache.make_key('ocr', image, colors=['red']) == ResultCache.make_key('ocr', image, colors=['red'])
+    assert ResultCache.make_key('ocr', image, colors=['red']) != ResultCache.make_key('ocr', image, colors=['blue'])
+    assert ResultCache.make_key('ocr', image) != ResultCache.make_key('det', image)
+    assert ResultCache.make_key('ocr', object()) is None
@@ -0,0 +1,179 @@
+# coding=utf-8
+"""
+推理调度测试
+并发请求合并为批次，整批失败时逐个重试
+"""
+
+import asyncio
+
+import pytest
+
+from ddddocr.api.scheduler import InferenceScheduler
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_concurrent_requests_are_batched():
+    scheduler = InferenceScheduler(max_batch_size=4, max_wait_ms=50, num_workers=1)
+    batches = []
+
+    def run_batch(items):
+        batches.append(list(items))
+        return [item * 10 for item in items]
+
+    async def main():
+        return await asyncio.gather(*(scheduler.submit('k', run_batch, i) for i in range(6)))
+
+    try:
+        assert _run(main()) == [0, 10, 20, 30, 40, 50]
+    finally:
+        scheduler.shutdown()
+    # 满4个立即提交，剩余2个在等待超时后提交
+    assert batches == [[0, 1, 2, 3], [4, 5]]
+    assert scheduler.stats()['batches'] == 2
+    assert scheduler.stats()['average_batch_size'] == 3.0
+
+
+def test_different_keys_are_not_merged():
+    scheduler = InferenceScheduler(max_batch_size=8, max_wait_ms=5, num_workers=1)
+    batches = []
+
+    def run_batch(items):
+        batches.append(sorted(items))
+        return list(items)
+
+    async def main():
+        return await asyncio.gather(scheduler.submit('a', run_batch, 1), scheduler.submit('b', run_batch, 2),
+                                    scheduler.submit('a', run_batch, 3))
+
+    try:
+        assert _run(main()) == [1, 2, 3]
+    finally:
+        scheduler.shutdown()
+    assert sorted(batches) == [[1, 3], [2]]
+
+
+def test_failed_batch_falls_back_to_items():
+    """整批失败时逐个重试，只有异常的请求收到异常"""
+    scheduler = InferenceScheduler(max_batch_size=3, max_wait_ms=50, num_workers=1)
+    calls = []
+
+    def run_batch(items):
+        calls.append(list(items))
+        if 'bad' in items:
+            raise ValueError('bad image')
+        return [item.upper() for item in items]
+
+    async def main():
+        return await asyncio.gather(*(scheduler.submit('k', run_batch, item) for item in ('a', 'bad', 'c')),
+                                    return_exceptions=True)
+
+    try:
+        results = _run(main())
+    finally:
+        scheduler.shutdown()
+    assert results[0] == 'A' and results[2] == 'C'
+    assert isinstance(results[1], ValueError)
+    assert calls == [['a', 'bad', 'c'], ['a'], ['bad'], ['c']]
+
+
+def test_max_batch_size_one_runs_each_request():
+    scheduler = InferenceScheduler(max_batch_size=1, num_workers=1)
+    batches = []
+
+    def run_batch(items):
+        batches.append(list(items))
+        return list(items)
+
+    async def main():
+        return await asyncio.gather(*(scheduler.submit('k', run_batch, i) for i in range(3)))
+
+    try:
+        assert _run(main()) == [0, 1, 2]
+    finally:
+        scheduler.shutdown()
+    assert sorted(batches) == [[0], [1], [2]]
+
+
+def test_classify_batches_and_matches_single(stand_in_models, captcha_images):
+    """调度器合并的OCR请求与逐张识别结果一致"""
+    from ddddocr.benchmark.images import captcha_image
+    from ddddocr.compat.legacy import DdddOcr
+
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'])
+    # 每个宽度两张图片
+    images = captcha_images + [captcha_image(width=image_width, height=40, seed=100 + index)
+                               for index, image_width in enumerate((60, 97, 100, 131, 160, 203, 250, 400))]
+    scheduler = InferenceScheduler(max_batch_size=16, max_wait_ms=20, num_workers=1)
+
+    async def main():
+        return await asyncio.gather(*(scheduler.classify(ocr, image) for image in images))
+
+    try:
+        assert _run(main()) == [ocr.classification(image) for image in images]
+    finally:
+        scheduler.shutdown()
+    assert scheduler.stats()['batches'] == len(captcha_images)
+    assert scheduler.stats()['average_batch_size'] == 2.0
+
+
+def test_classify_groups_mixed_widths_into_separate_batches(stand_in_models):
+    """不同宽度的请求分别成批，各批次内的图片宽度相同，结果与逐张识别一致"""
+    from ddddocr.benchmark.images import captcha_image
+    from ddddocr.compat.legacy import DdddOcr
+
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'])
+    images = [captcha_image(width=width, height=40, seed=index)
+              for index, width in enumerate((100, 160, 100, 250, 160, 100))]
+    batches = []
+    classification_batch = ocr.classification_batch
+
+    def record(imgs, **params):
+        batches.append(sorted(ocr.ocr_engine.batch_key(image) for image in imgs))
+        return classification_batch(imgs, **params)
+
+    ocr.classification_batch = record
+    scheduler = InferenceScheduler(max_batch_size=8, max_wait_ms=20, num_workers=3)
+
+    async def main():
+        return await asyncio.gather(*(scheduler.classify(ocr, image) for image in images))
+
+    try:
+        assert _run(main()) == [ocr.classification(image) for image in images]
+    finally:
+        scheduler.shutdown()
+    assert sorted(len(batch) for batch in batches) == [1, 2, 3]
+    assert all(len(set(batch)) == 1 for batch in batches)
+
+
+def test_classify_with_shared_result_cache(stand_in_models, captcha_images):
+    """调度器与实例共用同一个结果缓存时，批次内不再等待调度器已持有的缓存键"""
+    from ddddocr.compat.legacy import DdddOcr
+    from ddddocr.utils.result_cache import ResultCache
+
+    cache = ResultCache()
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'],
+                  result_cache=cache)
+    expected = ocr.ocr_engine.predict_batch(captcha_images, use_cache=False)
+    scheduler = InferenceScheduler(max_batch_size=8, max_wait_ms=20, num_workers=2, result_cache=cache)
+
+    async def main():
+        requests = asyncio.gather(*(scheduler.classify(ocr, image) for image in captcha_images))
+        return await asyncio.wait_for(requests, timeout=10)
+
+    try:
+        assert _run(main()) == expected
+        # 第二轮全部命中缓存
+        assert _run(main()) == expected
+    finally:
+        scheduler.shutdown()
+    assert cache.stats()['hits'] >= len(captcha_images)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        InferenceScheduler(max_batch_size=0)
+    with pytest.raises(ValueError):
+        InferenceScheduler(max_wait_ms=-1)
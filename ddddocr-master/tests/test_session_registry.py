@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+推理会话注册表测试
+"""
+
+import gc
+import os
+
+from ddddocr.compat.legacy import DdddOcr
+from ddddocr.models.session_registry import SessionRegistry, session_registry
+
+
+def _create(models):
+    return DdddOcr(show_ad=False, import_onnx_path=models['ocr'], charsets_path=models['charsets'])
+
+
+def test_back_to_back_constructions_reuse_session(stand_in_models, captcha_images):
+    """逐张创建并丢弃实例时复用同一个推理会话"""
+    session_registry.clear()
+    ocr = _create(stand_in_models)
+    ocr.classification(captcha_images[0])
+    session = ocr.ocr_engine.session
+    del ocr
+    gc.collect()
+
+    assert len(session_registry) == 1
+    assert session_registry.stats()[0]['idle']
+
+    ocr = _create(stand_in_models)
+    assert ocr.ocr_engine.session is session
+    assert not session_registry.stats()[0]['idle']
+
+
+def test_idle_sessions_are_bounded(stand_in_models):
+    """空闲会话超过上限时按最久未使用的顺序丢弃"""
+    registry = SessionRegistry(max_idle=1)
+    first = registry.acquire(stand_in_models['ocr'], ['CPUExecutionProvider'])
+    second = registry.acquire(stand_in_models['detection'], ['CPUExecutionProvider'])
+    first.release()
+    assert len(registry) == 2
+    second.release()
+    assert len(registry) == 1
+    assert registry.stats()[0]['model_path'] == stand_in_models['detection']
+
+    registry.trim()
+    assert len(registry) == 0
+
+
+def test_idle_session_dropped_when_model_changes(stand_in_models):
+    """空闲期间模型文件被修改时重新加载"""
+    registry = SessionRegistry()
+    handle = registry.acquire(stand_in_models['ocr'], ['CPUExecutionProvider'])
+    handle.get()
+    handle.release()
+
+    stat = os.stat(stand_in_models['ocr'])
+    os.utime(stand_in_models['ocr'], (stat.st_atime, stat.st_mtime + 10))
+    try:
+        again = registry.acquire(stand_in_models['ocr'], ['CPUExecutionProvider'])
+        assert again is not handle
+        assert not again.loaded
+    finally:
+        os.utime(stand_in_models['ocr'], (stat.st_atime, stat.st_mtime))
@@ -0,0 +1,95 @@
+# coding=utf-8
+"""
+共享权重测试
+主进程读入的权重在派生的工作进程中被会话直接引用，不产生私有副本
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from ddddocr.compat.legacy import DdddOcr
+from ddddocr.models.session_registry import SessionRegistry, session_registry
+
+
+def _private_mb():
+    with open('/proc/self/smaps_rollup') as f:
+        return sum(int(line.split()[1]) for line in f
+                   if line.startswith(('Private_Clean', 'Private_Dirty'))) / 1024
+
+
+def _conv_model(path, channels=512, layers=8):
+    """Conv+BatchNorm堆叠的模型，默认图优化会融合二者并生成新的权重"""
+    import onnx
+    from onnx import helper, numpy_helper, TensorProto
+
+    rng = np.random.RandomState(0)
+    nodes, initializers, previous = [], [], 'x'
+    for i in range(layers):
+        initializers.append(numpy_helper.from_array(
+            (rng.randn(channels, channels, 3, 3) * 0.02).astype(np.float32), f'w{i}'))
+        for name in ('scale', 'bias', 'mean', 'var'):
+            initializers.append(numpy_helper.from_array(
+                (rng.rand(channels) + 0.5).astype(np.float32), f'{name}{i}'))
+        nodes.append(helper.make_node('Conv', [previous, f'w{i}'], [f'conv{i}'], pads=[1, 1, 1, 1]))
+        nodes.append(helper.make_node('BatchNormalization',
+                                      [f'conv{i}', f'scale{i}', f'bias{i}', f'mean{i}', f'var{i}'], [f'bn{i}']))
+        nodes.append(helper.make_node('Relu', [f'bn{i}'], [f'relu{i}']))
+        previous = f'relu{i}'
+    graph = helper.make_graph(nodes, 'conv', [helper.make_tensor_value_info('x', TensorProto.FLOAT, [1, channels, 8, 8])],
+                              [helper.make_tensor_value_info(previous, TensorProto.FLOAT, None)], initializers)
+    onnx.save(helper.make_model(graph, opset_imports=[helper.make_opsetid('', 13)], ir_version=8), path)
+
+
+def test_shared_weights_give_same_result(stand_in_models, captcha_images):
+    session_registry.clear()
+    expected = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'],
+                       charsets_path=stand_in_models['charsets']).classification_batch(captcha_images)
+    session_registry.clear()
+
+    ocr = DdddOcr(show_ad=False, import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'])
+    assert session_registry.share_weights() > 0
+    assert session_registry.stats()[0]['shared_weights']
+    assert ocr.classification_batch(captcha_images) == expected
+    session_registry.clear()
+
+
+@pytest.mark.skipif(not (hasattr(os, 'fork') and os.path.exists('/proc/self/smaps_rollup')),
+                    reason='需要fork与/proc/self/smaps_rollup')
+def test_forked_worker_does_not_copy_weights(tmp_path):
+    pytest.importorskip('onnx')
+    import onnxruntime
+
+    path = str(tmp_path / 'conv.onnx')
+    _conv_model(path)
+    x = np.random.RandomState(1).rand(1, 512, 8, 8).astype(np.float32)
+    expected = onnxruntime.InferenceSession(path, providers=['CPUExecutionProvider']).run(None, {'x': x})[0]
+
+    registry = SessionRegistry()
+    handle = registry.acquire(path, ['CPUExecutionProvider'])
+    nbytes = registry.share_weights()
+    assert nbytes > 64 * 1024 * 1024
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            before = _private_mb()
+            output = handle.get().run(None, {'x': x})[0]
+            grown = _private_mb() - before
+            message = f"{grown:.1f} {int(np.allclose(output, expected, rtol=1e-4, atol=1e-4))}"
+            os.write(write_fd, message.encode())
+        finally:
+            sys.stdout.flush()
+            os._exit(0)
+    os.close(write_fd)
+    message = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    grown, same = message.split()
+    assert same == '1'
+    # 各自加载时每个工作进程私有内存增长超过权重大小，共享时只有会话自身的少量内存
+    assert float(grown) < nbytes / 1024 / 1024 / 4
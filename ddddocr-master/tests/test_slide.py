@@ -0,0 +1,60 @@
+# coding=utf-8
+"""
+滑块匹配测试
+金字塔模式与全分辨率匹配的结果在tolerance范围内一致
+"""
+
+import pytest
+
+from ddddocr.benchmark.images import slide_images, slide_comparison_images
+from ddddocr.core.slide_engine import SlideEngine
+
+
+@pytest.fixture(scope='module')
+def slide():
+    return SlideEngine()
+
+
+def _close(expected, actual, tolerance):
+    return (abs(expected['target_x'] - actual['target_x']) <= tolerance
+            and abs(expected['target_y'] - actual['target_y']) <= tolerance)
+
+
+@pytest.mark.parametrize('simple_target', [False, True])
+@pytest.mark.parametrize('size', [(672, 390, 50), (280, 160, 50)])
+def test_pyramid_matches_exact(slide, simple_target, size):
+    """包括粗匹配最高峰不在真实缺口处的种子（如672x390下的10、12、18、34）"""
+    width, height, piece = size
+    tolerance = 2
+    mismatches = []
+    for seed in range(40):
+        target, background, _ = slide_images(width=width, height=height, piece=piece, seed=seed)
+        exact = slide.slide_match(target, background, simple_target=simple_target)
+        pyramid = slide.slide_match(target, background, simple_target=simple_target,
+                                    mode='pyramid', tolerance=tolerance)
+        if not _close(exact, pyramid, tolerance):
+            mismatches.append((seed, exact['target'], pyramid['target']))
+    assert mismatches == []
+
+
+def test_pyramid_finds_gap_missed_by_coarse_peak(slide):
+    """种子12的粗匹配最高峰在错误位置，需精匹配其余候选才能找到缺口"""
+    target, background, x = slide_images(width=672, height=390, seed=12)
+    result = slide.slide_match(target, background, simple_target=True, mode='pyramid')
+    assert abs(result['target_x'] - (x + 25)) <= 2
+
+
+def test_pyramid_with_row_band(slide):
+    target, background, _ = slide_images(width=672, height=390, seed=3)
+    exact = slide.slide_match(target, background)
+    band = (max(0, exact['target_y'] - 60), exact['target_y'] + 60)
+    pyramid = slide.slide_match(target, background, mode='pyramid', row_band=band)
+    assert _close(exact, pyramid, 2)
+
+
+def test_pyramid_comparison_matches_exact(slide):
+    for seed in range(10):
+        full, gapped, _ = slide_comparison_images(width=672, height=390, seed=seed)
+        exact = slide.slide_comparison(gapped, full)
+        pyramid = slide.slide_comparison(gapped, full, mode='pyramid')
+        assert _close(exact, pyramid, 2), seed
@@ -0,0 +1,59 @@
+# coding=utf-8
+"""
+单张OCR宽度分桶测试
+分桶推理的结果必须与按原始宽度直接调用会话一致
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from ddddocr.core.ocr_engine import OCREngine
+from ddddocr.models.model_loader import ModelLoader
+
+
+def _probabilities(engine, images, width_bucket):
+    engine.width_bucket = width_bucket
+    return [np.asarray(engine.predict(image, probability=True)['probabilities']) for image in images]
+
+
+def test_default_bucket_matches_unbucketed(context_ocr_model, captcha_images):
+    """默认按原始宽度分桶，对有序列上下文的模型结果也与直接调用会话一致"""
+    engine = OCREngine(import_onnx_path=context_ocr_model['ocr'], charsets_path=context_ocr_model['charsets'])
+    assert engine.width_bucket == 1
+    expected = _probabilities(engine, captcha_images, 0)
+    actual = _probabilities(engine, captcha_images + captcha_images, 1)
+    for reference, result in zip(expected + expected, actual):
+        np.testing.assert_allclose(result, reference, atol=1e-6)
+
+
+def test_padded_bucket_changes_context_model(context_ocr_model, captcha_images):
+    """填充分桶会被有序列上下文的模型读取，因此不能默认开启"""
+    engine = OCREngine(import_onnx_path=context_ocr_model['ocr'], charsets_path=context_ocr_model['charsets'])
+    expected = _probabilities(engine, captcha_images, 0)
+    padded = _probabilities(engine, captcha_images, 32)
+    assert any(result.shape != reference.shape or not np.allclose(result, reference, atol=1e-6)
+               for reference, result in zip(expected, padded))
+
+
+def test_padded_bucket_matches_independent_steps(stand_in_models, captcha_images):
+    """时间步相互独立的模型填充分桶后结果不变"""
+    engine = OCREngine(import_onnx_path=stand_in_models['ocr'], charsets_path=stand_in_models['charsets'])
+    expected = _probabilities(engine, captcha_images, 0)
+    padded = _probabilities(engine, captcha_images, 8)
+    for reference, result in zip(expected, padded):
+        np.testing.assert_allclose(result, reference, atol=1e-6)
+
+
+@pytest.mark.parametrize('old,beta', [(False, False), (True, False), (False, True)])
+def test_builtin_models_padded_bucket(old, beta, captcha_images):
+    """内置模型上比较填充分桶与直接调用会话的识别结果（模型文件不存在时跳过）"""
+    if not os.path.exists(ModelLoader().get_ocr_model_path(old, beta)):
+        pytest.skip('内置模型文件不存在')
+    engine = OCREngine(old=old, beta=beta)
+    engine.width_bucket = 0
+    expected = [engine.predict(image) for image in captcha_images]
+    for width_bucket in (1, 8):
+        engine.width_bucket = width_bucket
+        assert [engine.predict(image) for image in captcha_images] == expected